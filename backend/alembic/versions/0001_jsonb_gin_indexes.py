@@ -0,0 +1,48 @@
+"""GIN jsonb_path_ops indexes for JSONB containment queries.
+
+Tables are created by ``init_db`` (``Base.metadata.create_all``), which also
+builds the indexes declared on the models; this revision brings databases
+created before those declarations up to date. Statements are guarded with
+IF [NOT] EXISTS so the revision is idempotent against either path.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0001"
+down_revision: str | None = None
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (index name, table, JSONB column)
+_GIN_INDEXES = (
+    ("ix_dora_data_types_gin", "dora_register", "data_types_processed"),
+    ("ix_dora_data_locations_gin", "dora_register", "data_locations"),
+    ("ix_dora_subcontractors_gin", "dora_register", "subcontractors"),
+    ("ix_dora_certifications_gin", "dora_register", "certifications"),
+    ("ix_internal_scans_scan_data_gin", "internal_scans", "scan_data"),
+    ("ix_questions_options_gin", "questions", "options"),
+    ("ix_vendor_scores_domain_scores_gin", "vendor_scores", "domain_scores"),
+)
+
+
+def upgrade() -> None:
+    """Create the GIN indexes without blocking writes."""
+    with op.get_context().autocommit_block():
+        for name, table, column in _GIN_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING gin ({column} jsonb_path_ops)"
+            )
+
+
+def downgrade() -> None:
+    """Drop the GIN indexes."""
+    with op.get_context().autocommit_block():
+        for name, _table, _column in _GIN_INDEXES:
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,42 @@
+"""Store audit log details as JSONB with GIN indexes.
+
+Converts ``audit_logs.details`` from JSON to JSONB so it can be indexed, then
+adds a root ``jsonb_path_ops`` GIN index and an expression index on the
+frequently filtered ``details -> 'target'`` key. Queries must use the
+``details @> '{"key": value}'`` form for the planner to pick these up.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0002"
+down_revision: str | None = "0001"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Convert the column and build the indexes."""
+    op.execute("ALTER TABLE audit_logs ALTER COLUMN details TYPE jsonb USING details::jsonb")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_details_gin "
+            "ON audit_logs USING gin (details jsonb_path_ops)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_details_target "
+            "ON audit_logs USING gin ((details -> 'target') jsonb_path_ops)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the indexes and revert the column to JSON."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_audit_details_target")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_audit_details_gin")
+    op.execute("ALTER TABLE audit_logs ALTER COLUMN details TYPE json USING details::json")
@@ -0,0 +1,49 @@
+"""Composite covering indexes for audit and internal scan time-series filters.
+
+Replaces the single-column ``user_id`` / ``scan_type`` indexes with composite
+indexes over the time column that INCLUDE the projected columns, so dashboard
+queries become index-only scans instead of a bitmap-AND plus heap recheck.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0003"
+down_revision: str | None = "0002"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Build the covering indexes, then drop the redundant single-column ones."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_user_ts "
+            'ON audit_logs (user_id, "timestamp") INCLUDE (action, resource_type)'
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scan_type_created "
+            "ON internal_scans (scan_type, created_at) INCLUDE (score, grade)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_audit_logs_user_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_internal_scans_scan_type")
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_internal_scans_scan_type "
+            "ON internal_scans (scan_type)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_audit_logs_user_id "
+            "ON audit_logs (user_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_scan_type_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_audit_user_ts")
@@ -0,0 +1,60 @@
+"""Partial indexes restricted to open dispute/remediation/finding states.
+
+The full B-tree indexes on ``status`` mostly index resolved/closed rows that
+queries never ask for. They are replaced by partial indexes over the open
+states, which are an order of magnitude smaller and stay in shared_buffers.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0004"
+down_revision: str | None = "0003"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (partial index, table, indexed column, predicate, replaced full index)
+_PARTIAL_INDEXES = (
+    (
+        "ix_disputes_open", "disputes", "sla_deadline",
+        "status IN ('open', 'in_review')", "ix_disputes_status",
+    ),
+    (
+        "ix_remediations_open", "remediations", "deadline",
+        "status IN ('pending', 'in_progress')", "ix_remediations_status",
+    ),
+    (
+        "ix_findings_open", "findings", "severity",
+        "status = 'open'", "ix_findings_status",
+    ),
+    (
+        "ix_internal_findings_open", "internal_findings", "severity",
+        "status = 'open'", "ix_internal_findings_status",
+    ),
+)
+
+
+def upgrade() -> None:
+    """Build the partial indexes and drop the full status indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, column, predicate, replaced in _PARTIAL_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} ({column}) WHERE {predicate}"
+            )
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {replaced}")
+
+
+def downgrade() -> None:
+    """Restore the full status indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, _column, _predicate, replaced in _PARTIAL_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {replaced} ON {table} (status)"
+            )
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -0,0 +1,62 @@
+"""Store questionnaire graph keys as native uuid.
+
+``varchar(36)`` keys cost 37 bytes per entry against 16 for ``uuid``, so the
+primary key and foreign key indexes of the questionnaire tables shrink by more
+than half. Foreign keys have to be dropped while the referenced columns change
+type and are recreated afterwards with their default PostgreSQL names.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0005"
+down_revision: str | None = "0004"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, referenced table)
+_FOREIGN_KEYS = (
+    ("questions", "questionnaire_id", "questionnaires"),
+    ("questionnaire_responses", "questionnaire_id", "questionnaires"),
+    ("answers", "response_id", "questionnaire_responses"),
+    ("answers", "question_id", "questions"),
+)
+
+_UUID_COLUMNS = (
+    ("questionnaires", "id"),
+    ("questions", "id"),
+    ("questionnaire_responses", "id"),
+    ("answers", "id"),
+    *((table, column) for table, column, _ref in _FOREIGN_KEYS),
+)
+
+
+def _retype(target: str, using: str) -> None:
+    """Change the type of every questionnaire key, rebuilding the foreign keys."""
+    for table, column, _ref in _FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_{column}_fkey")
+    for table, column in _UUID_COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {target} "
+            f"USING {column}::{using}"
+        )
+    for table, column, ref in _FOREIGN_KEYS:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_fkey "
+            f"FOREIGN KEY ({column}) REFERENCES {ref} (id) ON DELETE CASCADE"
+        )
+
+
+def upgrade() -> None:
+    """Convert the questionnaire keys from varchar(36) to uuid."""
+    _retype("uuid", "uuid")
+
+
+def downgrade() -> None:
+    """Convert the questionnaire keys back to varchar(36)."""
+    _retype("varchar(36)", "varchar")
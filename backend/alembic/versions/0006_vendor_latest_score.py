@@ -0,0 +1,54 @@
+"""Denormalize the latest vendor score onto vendors.
+
+Dashboards and the grade filter used to rank the whole ``vendor_scores``
+history per vendor to find the latest row. The latest score, grade and scan
+time now live on ``vendors`` and are maintained by an ORM ``after_insert``
+listener on ``VendorScore``; this revision adds the columns and backfills them.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0006"
+down_revision: str | None = "0005"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Add the latest-score columns and fill them from the score history."""
+    op.add_column(
+        "vendors",
+        sa.Column("latest_score", sa.Integer(), comment="Latest global score 0-1000"),
+    )
+    op.add_column("vendors", sa.Column("latest_grade", sa.String(1)))
+    op.add_column("vendors", sa.Column("latest_scored_at", sa.DateTime(timezone=True)))
+    op.execute(
+        """
+        UPDATE vendors AS v
+        SET latest_score = s.global_score,
+            latest_grade = s.grade,
+            latest_scored_at = s.scanned_at
+        FROM (
+            SELECT DISTINCT ON (vendor_id) vendor_id, global_score, grade, scanned_at
+            FROM vendor_scores
+            ORDER BY vendor_id, scanned_at DESC
+        ) AS s
+        WHERE v.id = s.vendor_id
+        """
+    )
+    op.create_index("ix_vendors_latest_grade", "vendors", ["latest_grade"])
+
+
+def downgrade() -> None:
+    """Drop the latest-score columns."""
+    op.drop_index("ix_vendors_latest_grade", table_name="vendors")
+    op.drop_column("vendors", "latest_scored_at")
+    op.drop_column("vendors", "latest_grade")
+    op.drop_column("vendors", "latest_score")
@@ -0,0 +1,59 @@
+"""BRIN indexes on append-only timestamp columns.
+
+``audit_logs.timestamp``, ``internal_scans.created_at``,
+``vendor_scores.scanned_at`` and ``reports.created_at`` grow with insertion
+order, so a BRIN index summarising every 32 heap pages serves time-range
+scans at a fraction of the size and write cost of a B-tree. Ordered
+per-user/per-type lookups stay on the existing composite B-trees.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0007"
+down_revision: str | None = "0006"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (BRIN index, table, column, replaced B-tree index or None)
+_BRIN_INDEXES = (
+    ("brin_audit_ts", "audit_logs", "timestamp", "ix_audit_logs_timestamp"),
+    (
+        "brin_internal_scans_created", "internal_scans", "created_at",
+        "ix_internal_scans_created_at",
+    ),
+    (
+        "brin_vendor_scores_scanned", "vendor_scores", "scanned_at",
+        "ix_vendor_scores_scanned_at",
+    ),
+    ("brin_reports_created", "reports", "created_at", None),
+)
+
+
+def upgrade() -> None:
+    """Build the BRIN indexes and drop the B-trees they replace."""
+    with op.get_context().autocommit_block():
+        for name, table, column, replaced in _BRIN_INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} ON {table} "
+                f"USING brin ({column}) WITH (pages_per_range = 32)"
+            )
+            if replaced:
+                op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {replaced}")
+
+
+def downgrade() -> None:
+    """Restore the B-tree timestamp indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, column, replaced in _BRIN_INDEXES:
+            if replaced:
+                op.execute(
+                    f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {replaced} "
+                    f"ON {table} ({column})"
+                )
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
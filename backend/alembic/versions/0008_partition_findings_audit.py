@@ -0,0 +1,162 @@
+"""Range-partition audit_logs, findings and internal_findings by month.
+
+The three tables are rebuilt as ``PARTITION BY RANGE`` parents on their
+insertion timestamp so that time-bounded queries prune to the matching
+months and old data can later be detached per partition. PostgreSQL requires
+the partition key in the primary key, which becomes ``(id, <timestamp>)``.
+
+Monthly partitions are created by ``create_monthly_partitions()``: here for
+the span of the existing data plus three months ahead, and daily by a
+pg_cron job when the extension is installed. A DEFAULT partition catches
+anything outside those ranges. Retention (detaching old partitions) is left
+to operators since audit records fall under DORA retention rules.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0008"
+down_revision: str | None = "0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# table -> (partition column, foreign keys, secondary indexes)
+_TABLES = {
+    "audit_logs": (
+        '"timestamp"',
+        (),
+        (
+            'CREATE INDEX ix_audit_user_ts ON audit_logs (user_id, "timestamp") '
+            "INCLUDE (action, resource_type)",
+            "CREATE INDEX ix_audit_details_gin ON audit_logs "
+            "USING gin (details jsonb_path_ops)",
+            "CREATE INDEX ix_audit_details_target ON audit_logs "
+            "USING gin ((details -> 'target') jsonb_path_ops)",
+            "CREATE INDEX ix_audit_logs_action ON audit_logs (action)",
+            'CREATE INDEX brin_audit_ts ON audit_logs USING brin ("timestamp") '
+            "WITH (pages_per_range = 32)",
+        ),
+    ),
+    "findings": (
+        "created_at",
+        ("FOREIGN KEY (vendor_id) REFERENCES vendors (id) ON DELETE CASCADE",),
+        (
+            "CREATE INDEX ix_findings_open ON findings (severity) WHERE status = 'open'",
+            "CREATE INDEX ix_findings_scan_id ON findings (scan_id)",
+            "CREATE INDEX ix_findings_severity ON findings (severity)",
+            "CREATE INDEX ix_findings_vendor_id ON findings (vendor_id)",
+        ),
+    ),
+    "internal_findings": (
+        "detected_at",
+        ("FOREIGN KEY (scan_id) REFERENCES internal_scans (id) ON DELETE CASCADE",),
+        (
+            "CREATE INDEX ix_internal_findings_category ON internal_findings (category)",
+            "CREATE INDEX ix_internal_findings_open ON internal_findings (severity) "
+            "WHERE status = 'open'",
+            "CREATE INDEX ix_internal_findings_scan_id ON internal_findings (scan_id)",
+            "CREATE INDEX ix_internal_findings_severity ON internal_findings (severity)",
+        ),
+    ),
+}
+
+_PARTITION_FUNCTION = """
+CREATE OR REPLACE FUNCTION create_monthly_partitions(
+    parent text, from_month date, to_month date
+) RETURNS void LANGUAGE plpgsql AS $$
+DECLARE
+    bound date := date_trunc('month', from_month)::date;
+BEGIN
+    WHILE bound < to_month LOOP
+        EXECUTE format(
+            'CREATE TABLE IF NOT EXISTS %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)',
+            parent || '_' || to_char(bound, 'YYYY_MM'), parent,
+            bound, (bound + interval '1 month')::date
+        );
+        bound := (bound + interval '1 month')::date;
+    END LOOP;
+END
+$$
+"""
+
+_SCHEDULE_JOB = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.schedule(
+            'create-monthly-partitions', '0 3 * * *',
+            $job$
+            SELECT create_monthly_partitions(
+                parent, now()::date, (date_trunc('month', now()) + interval '3 months')::date
+            )
+            FROM unnest(ARRAY['audit_logs', 'findings', 'internal_findings']) AS parent
+            $job$
+        );
+    END IF;
+END
+$$
+"""
+
+_UNSCHEDULE_JOB = """
+DO $$
+BEGIN
+    IF EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_cron') THEN
+        PERFORM cron.unschedule('create-monthly-partitions');
+    END IF;
+END
+$$
+"""
+
+
+def _rebuild(table: str, partitioned: bool) -> None:
+    """Copy ``table`` into a fresh (partitioned or plain) table of the same shape."""
+    column, foreign_keys, indexes = _TABLES[table]
+    legacy = f"{table}_legacy"
+
+    op.execute(f"ALTER TABLE {table} RENAME TO {legacy}")
+    partition_clause = f" PARTITION BY RANGE ({column})" if partitioned else ""
+    op.execute(
+        f"CREATE TABLE {table} (LIKE {legacy} INCLUDING DEFAULTS INCLUDING COMMENTS)"
+        f"{partition_clause}"
+    )
+    if partitioned:
+        op.execute(
+            f"SELECT create_monthly_partitions('{table}', "
+            f"coalesce((SELECT min({column}) FROM {legacy}), now())::date, "
+            "(date_trunc('month', now()) + interval '3 months')::date)"
+        )
+        op.execute(f"CREATE TABLE {table}_default PARTITION OF {table} DEFAULT")
+
+    op.execute(f"INSERT INTO {table} SELECT * FROM {legacy}")
+    if table == "audit_logs":
+        # Keep the serial sequence alive when the legacy table is dropped
+        op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+    op.execute(f"DROP TABLE {legacy}")
+
+    primary_key = f"id, {column}" if partitioned else "id"
+    op.execute(f"ALTER TABLE {table} ADD PRIMARY KEY ({primary_key})")
+    for foreign_key in foreign_keys:
+        op.execute(f"ALTER TABLE {table} ADD {foreign_key}")
+    for index in indexes:
+        op.execute(index)
+
+
+def upgrade() -> None:
+    """Rebuild the tables as monthly range-partitioned parents."""
+    op.execute(_PARTITION_FUNCTION)
+    for table in _TABLES:
+        _rebuild(table, partitioned=True)
+    op.execute(_SCHEDULE_JOB)
+
+
+def downgrade() -> None:
+    """Rebuild the tables as plain heap tables."""
+    op.execute(_UNSCHEDULE_JOB)
+    for table in _TABLES:
+        _rebuild(table, partitioned=False)
+    op.execute("DROP FUNCTION IF EXISTS create_monthly_partitions(text, date, date)")
@@ -0,0 +1,85 @@
+"""Store the remaining primary and foreign keys as native uuid.
+
+Follows 0005, which converted the questionnaire tables, for every other
+``varchar(36)`` primary key and the foreign keys that reference them. Plain
+identifier columns without a foreign key (``user_id``, ``scan_id`` on
+findings, ``resource_id``...) keep their text type since they may carry
+external identifiers.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0009"
+down_revision: str | None = "0008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, referenced table, ON DELETE action)
+_FOREIGN_KEYS = (
+    ("alerts", "vendor_id", "vendors", "CASCADE"),
+    ("disputes", "vendor_id", "vendors", "CASCADE"),
+    ("dora_register", "vendor_id", "vendors", "CASCADE"),
+    ("findings", "vendor_id", "vendors", "CASCADE"),
+    ("questionnaire_responses", "vendor_id", "vendors", "CASCADE"),
+    ("remediations", "vendor_id", "vendors", "CASCADE"),
+    ("reports", "vendor_id", "vendors", "SET NULL"),
+    ("vendor_dependencies", "vendor_id", "vendors", "CASCADE"),
+    ("vendor_scores", "vendor_id", "vendors", "CASCADE"),
+    ("framework_mappings", "control_id", "security_controls", "CASCADE"),
+    ("maturity_assessments", "control_id", "security_controls", "CASCADE"),
+    ("internal_findings", "scan_id", "internal_scans", "CASCADE"),
+)
+
+_PRIMARY_KEY_TABLES = (
+    "alerts",
+    "concentration_alerts",
+    "disputes",
+    "dora_register",
+    "findings",
+    "framework_mappings",
+    "internal_findings",
+    "internal_scans",
+    "llm_configs",
+    "maturity_assessments",
+    "remediations",
+    "reports",
+    "security_controls",
+    "users",
+    "vendor_dependencies",
+    "vendor_scores",
+    "vendors",
+)
+
+
+def _retype(target: str, using: str) -> None:
+    """Change the type of every key column, rebuilding the foreign keys."""
+    for table, column, _ref, _ondelete in _FOREIGN_KEYS:
+        op.execute(f"ALTER TABLE {table} DROP CONSTRAINT IF EXISTS {table}_{column}_fkey")
+    for table in _PRIMARY_KEY_TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id TYPE {target} USING id::{using}")
+    for table, column, _ref, _ondelete in _FOREIGN_KEYS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {target} "
+            f"USING {column}::{using}"
+        )
+    for table, column, ref, ondelete in _FOREIGN_KEYS:
+        op.execute(
+            f"ALTER TABLE {table} ADD CONSTRAINT {table}_{column}_fkey "
+            f"FOREIGN KEY ({column}) REFERENCES {ref} (id) ON DELETE {ondelete}"
+        )
+
+
+def upgrade() -> None:
+    """Convert the keys from varchar(36) to uuid."""
+    _retype("uuid", "uuid")
+
+
+def downgrade() -> None:
+    """Convert the keys back to varchar(36)."""
+    _retype("varchar(36)", "varchar")
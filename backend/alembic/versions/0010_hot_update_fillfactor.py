@@ -0,0 +1,55 @@
+"""Lower fillfactor on frequently updated tables to allow HOT updates.
+
+Status transitions, score updates and ``updated_at`` refreshes rewrite rows
+in these tables. With 30% of each heap page left free, the new row version
+can stay on the same page and, when no indexed column changed, PostgreSQL
+skips index maintenance entirely (heap-only tuple update). The setting only
+applies to newly written pages; existing pages are repacked by the next
+``VACUUM FULL`` or pg_repack run.
+
+The full index on ``security_controls.status`` is dropped as well: it only
+holds three distinct values, every status query over the small controls
+table is a sequential scan anyway, and keeping it would prevent status
+changes from being HOT.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0010"
+down_revision: str | None = "0009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLES = (
+    "remediations",
+    "questionnaire_responses",
+    "internal_scans",
+    "security_controls",
+    "dora_register",
+    "llm_configs",
+)
+
+
+def upgrade() -> None:
+    """Set fillfactor to 70 and drop the status index on security controls."""
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} SET (fillfactor = 70)")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_security_controls_status")
+
+
+def downgrade() -> None:
+    """Restore the default fillfactor and the status index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_security_controls_status "
+            "ON security_controls (status)"
+        )
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} RESET (fillfactor)")
@@ -0,0 +1,48 @@
+"""Maintain updated_at with moddatetime triggers.
+
+``updated_at`` used to be set by SQLAlchemy's ``onupdate=func.now()``,
+which adds the column to every ORM UPDATE. A ``BEFORE UPDATE`` trigger
+from the ``moddatetime`` contrib extension now stamps it server-side, for
+ORM and Core writes alike.
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0011"
+down_revision: str | None = "0010"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLES = (
+    "vendors",
+    "findings",
+    "remediations",
+    "dora_register",
+    "questionnaires",
+    "questionnaire_responses",
+    "llm_configs",
+)
+
+
+def upgrade() -> None:
+    """Install moddatetime and add a set_updated_at trigger per table."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS moddatetime")
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS set_updated_at ON {table}")
+        op.execute(
+            f"CREATE TRIGGER set_updated_at BEFORE UPDATE ON {table} "
+            "FOR EACH ROW EXECUTE FUNCTION moddatetime(updated_at)"
+        )
+
+
+def downgrade() -> None:
+    """Drop the triggers and the extension."""
+    for table in _TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS set_updated_at ON {table}")
+    op.execute("DROP EXTENSION IF EXISTS moddatetime")
@@ -0,0 +1,61 @@
+"""Enforce a single active LLM config and notify listeners of changes.
+
+``uniq_llm_active`` is a partial unique index over the active row, so at
+most one configuration can be active. Existing duplicates are deactivated
+first, keeping the most recently updated one. A statement-level trigger
+sends ``pg_notify('llm_config_changed')`` after every write so API workers
+can invalidate their cached copy of the active configuration.
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0012"
+down_revision: str | None = "0011"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Deduplicate active configs, add the unique index and the notify trigger."""
+    op.execute(
+        """
+        UPDATE llm_configs SET is_active = false
+        WHERE is_active AND id <> (
+            SELECT id FROM llm_configs WHERE is_active
+            ORDER BY updated_at DESC LIMIT 1
+        )
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uniq_llm_active "
+        "ON llm_configs (is_active) WHERE is_active"
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION notify_llm_config_changed() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            PERFORM pg_notify('llm_config_changed', '');
+            RETURN NULL;
+        END
+        $$
+        """
+    )
+    op.execute("DROP TRIGGER IF EXISTS llm_config_changed ON llm_configs")
+    op.execute(
+        "CREATE TRIGGER llm_config_changed AFTER INSERT OR UPDATE OR DELETE "
+        "ON llm_configs FOR EACH STATEMENT EXECUTE FUNCTION notify_llm_config_changed()"
+    )
+
+
+def downgrade() -> None:
+    """Drop the notify trigger and the unique index."""
+    op.execute("DROP TRIGGER IF EXISTS llm_config_changed ON llm_configs")
+    op.execute("DROP FUNCTION IF EXISTS notify_llm_config_changed()")
+    op.execute("DROP INDEX IF EXISTS uniq_llm_active")
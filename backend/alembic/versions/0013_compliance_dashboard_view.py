@@ -0,0 +1,55 @@
+"""Pre-aggregate GRC coverage into the compliance_dashboard materialized view.
+
+The coverage and heatmap endpoints grouped ``security_controls`` joined with
+``framework_mappings`` on every request. The view stores the status counts
+and average maturity per (framework, domain); the API refreshes it
+concurrently at most every 30 seconds after a GRC change, which the unique
+index on ``(framework, domain)`` makes possible.
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0013"
+down_revision: str | None = "0012"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create and populate the view with its unique index."""
+    op.execute(
+        """
+        CREATE MATERIALIZED VIEW IF NOT EXISTS compliance_dashboard AS
+        SELECT fm.framework,
+               sc.domain,
+               count(*) AS total_controls,
+               count(*) FILTER (WHERE sc.status = 'implemented') AS implemented,
+               count(*) FILTER (WHERE sc.status = 'partial') AS partial,
+               count(*) FILTER (WHERE sc.status = 'not_implemented') AS not_implemented,
+               avg(ma.level)::float8 AS avg_maturity
+        FROM security_controls AS sc
+        JOIN framework_mappings AS fm ON fm.control_id = sc.id
+        LEFT JOIN (
+            SELECT control_id, avg(level) AS level
+            FROM maturity_assessments
+            GROUP BY control_id
+        ) AS ma ON ma.control_id = sc.id
+        GROUP BY fm.framework, sc.domain
+        WITH DATA
+        """
+    )
+    op.execute(
+        "CREATE UNIQUE INDEX IF NOT EXISTS uniq_compliance_dashboard "
+        "ON compliance_dashboard (framework, domain)"
+    )
+
+
+def downgrade() -> None:
+    """Drop the view."""
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS compliance_dashboard")
@@ -0,0 +1,56 @@
+"""Generate primary keys with gen_random_uuid() in PostgreSQL.
+
+The ORM used to compute ``str(uuid4())`` for every new row, including the
+bulk finding inserts. The keys are now a server default and come back through
+``INSERT ... RETURNING``. ``gen_random_uuid()`` is built into PostgreSQL 13+,
+so pgcrypto is not needed.
+
+Revision ID: 0014
+Revises: 0013
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0014"
+down_revision: str | None = "0013"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TABLES = (
+    "alerts",
+    "answers",
+    "concentration_alerts",
+    "disputes",
+    "dora_register",
+    "findings",
+    "framework_mappings",
+    "internal_findings",
+    "internal_scans",
+    "llm_configs",
+    "maturity_assessments",
+    "questionnaire_responses",
+    "questionnaires",
+    "questions",
+    "remediations",
+    "reports",
+    "security_controls",
+    "users",
+    "vendor_dependencies",
+    "vendor_scores",
+    "vendors",
+)
+
+
+def upgrade() -> None:
+    """Default every uuid primary key to gen_random_uuid()."""
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+
+
+def downgrade() -> None:
+    """Remove the server-side key defaults."""
+    for table in _TABLES:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN id DROP DEFAULT")
@@ -0,0 +1,53 @@
+"""Store free-form titles, URLs and paths as text instead of varchar(n).
+
+``varchar(n)`` and ``text`` share the same on-disk format, so the length
+limits only added a check on every write without any storage benefit. Only
+limits backed by an external constraint (names, e-mails, codes) are kept.
+Widening varchar to text is binary compatible: no table rewrite and no index
+rebuild.
+
+Revision ID: 0015
+Revises: 0014
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0015"
+down_revision: str | None = "0014"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, previous length)
+_COLUMNS = (
+    ("alerts", "title", 500),
+    ("answers", "file_path", 500),
+    ("audit_logs", "user_agent", 500),
+    ("disputes", "evidence_url", 500),
+    ("findings", "title", 500),
+    ("internal_findings", "title", 500),
+    ("internal_scans", "target", 500),
+    ("llm_configs", "api_base_url", 500),
+    ("remediations", "title", 500),
+    ("reports", "file_path", 500),
+    ("security_controls", "evidence_url", 1000),
+    ("security_controls", "title", 500),
+    ("vendors", "website", 500),
+)
+
+
+def upgrade() -> None:
+    """Convert the columns to text."""
+    for table, column, _length in _COLUMNS:
+        op.execute(f"ALTER TABLE {table} ALTER COLUMN {column} TYPE text")
+
+
+def downgrade() -> None:
+    """Restore the varchar(n) limits, truncating longer values."""
+    for table, column, length in _COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar({length}) "
+            f"USING left({column}, {length})"
+        )
@@ -0,0 +1,47 @@
+"""Compress scan_data with lz4 and flag ISO 27001 certified DORA entries.
+
+``internal_scans.scan_data`` holds full scan results of up to several
+megabytes, stored out of line in TOAST; lz4 decompresses them several times
+faster than pglz. The new setting only applies to values written from now
+on; existing rows keep pglz until they are rewritten.
+
+``dora_register.iso27001_certified`` is a stored generated column over the
+certifications array, with a partial B-tree index over certified entries.
+
+Revision ID: 0016
+Revises: 0015
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0016"
+down_revision: str | None = "0015"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Switch scan_data to lz4 and add the generated certification flag."""
+    op.execute("ALTER TABLE internal_scans ALTER COLUMN scan_data SET COMPRESSION lz4")
+    op.execute(
+        """
+        ALTER TABLE dora_register ADD COLUMN iso27001_certified boolean NOT NULL
+        GENERATED ALWAYS AS (certifications @> '["ISO 27001"]'::jsonb) STORED
+        """
+    )
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_dora_iso27001_certified "
+            "ON dora_register (iso27001_certified) WHERE iso27001_certified"
+        )
+
+
+def downgrade() -> None:
+    """Drop the certification flag and restore the default compression."""
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_dora_iso27001_certified")
+    op.execute("ALTER TABLE dora_register DROP COLUMN iso27001_certified")
+    op.execute("ALTER TABLE internal_scans ALTER COLUMN scan_data SET COMPRESSION default")
@@ -0,0 +1,38 @@
+"""Replace the internal_findings scan_id index with a covering one.
+
+``ix_internal_findings_scan_covering`` carries severity, status and category
+in its leaf pages, so filtering a scan's findings on those columns and
+counting them per scan no longer visits the heap. It also backs the
+``scan_id`` foreign key in place of ``ix_internal_findings_scan_id``.
+``internal_findings`` is partitioned, which rules out CONCURRENTLY.
+
+Revision ID: 0017
+Revises: 0016
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0017"
+down_revision: str | None = "0016"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the covering index and drop the plain scan_id index."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_internal_findings_scan_covering "
+        "ON internal_findings (scan_id) INCLUDE (severity, status, category)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_internal_findings_scan_id")
+
+
+def downgrade() -> None:
+    """Restore the plain scan_id index."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_internal_findings_scan_id ON internal_findings (scan_id)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_internal_findings_scan_covering")
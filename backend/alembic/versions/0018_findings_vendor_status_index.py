@@ -0,0 +1,39 @@
+"""Index findings per vendor and status with the ETag probe columns included.
+
+``findings`` stays range-partitioned by month (0008): PostgreSQL allows a
+single partitioning axis per level, and the time axis is the one that allows
+retention by detaching old months. The per-vendor access path is served
+by ``ix_findings_vendor_status`` instead, created on every partition. It
+replaces ``ix_findings_vendor_id`` for the foreign key, and its INCLUDE
+columns let the vendor findings ETag query (``max(updated_at)``, ``count``
+with severity/domain/status filters) run as an index-only scan.
+Partitioned tables do not support CONCURRENTLY.
+
+Revision ID: 0018
+Revises: 0017
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0018"
+down_revision: str | None = "0017"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the vendor/status index and drop the plain vendor_id index."""
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_findings_vendor_status ON findings (vendor_id, status) "
+        "INCLUDE (severity, domain, updated_at)"
+    )
+    op.execute("DROP INDEX IF EXISTS ix_findings_vendor_id")
+
+
+def downgrade() -> None:
+    """Restore the plain vendor_id index."""
+    op.execute("CREATE INDEX IF NOT EXISTS ix_findings_vendor_id ON findings (vendor_id)")
+    op.execute("DROP INDEX IF EXISTS ix_findings_vendor_status")
@@ -0,0 +1,45 @@
+"""Add the vendor listing covering index and case-insensitive domain uniqueness.
+
+``ix_vendors_status_created_desc`` serves status-filtered, newest-first
+vendor pages from the index alone and makes the single-column status index
+redundant. ``ix_vendors_domain_lower`` rejects domains that differ only by
+case and is the conflict target of the CSV importer. Creating it fails if
+such duplicates already exist; they must be merged first.
+
+Revision ID: 0019
+Revises: 0018
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0019"
+down_revision: str | None = "0018"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the listing and lower(domain) indexes, drop the status index."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vendors_status_created_desc "
+            "ON vendors (status, created_at DESC) INCLUDE (name, domain, tier, industry)"
+        )
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_vendors_domain_lower "
+            "ON vendors (lower(domain))"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_vendors_status")
+
+
+def downgrade() -> None:
+    """Restore the status index and drop the new ones."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vendors_status ON vendors (status)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_vendors_domain_lower")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_vendors_status_created_desc")
@@ -0,0 +1,47 @@
+"""Generate vendor keys as time-ordered UUIDv7.
+
+Random v4 keys land on random leaf pages of the primary key index, so bulk
+vendor imports dirty pages all over it. UUIDv7 keys start with a millisecond
+timestamp and append to its right edge. PostgreSQL 16 has no built-in
+``uuidv7()``, so this revision adds a SQL implementation; PostgreSQL 18's
+built-in version takes precedence over it once available. Existing keys are
+left as they are.
+
+Revision ID: 0020
+Revises: 0019
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0020"
+down_revision: str | None = "0019"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_UUIDV7_FUNCTION = """
+CREATE OR REPLACE FUNCTION uuidv7() RETURNS uuid LANGUAGE sql VOLATILE AS $$
+    SELECT encode(
+        set_bit(set_bit(
+            overlay(uuid_send(gen_random_uuid()) PLACING substring(
+                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                FROM 3
+            ) FROM 1 FOR 6),
+            52, 1), 53, 1),
+        'hex')::uuid
+$$
+"""
+
+
+def upgrade() -> None:
+    """Create uuidv7() and use it as the vendors.id default."""
+    op.execute(_UUIDV7_FUNCTION)
+    op.execute("ALTER TABLE vendors ALTER COLUMN id SET DEFAULT uuidv7()")
+
+
+def downgrade() -> None:
+    """Go back to random v4 keys and drop uuidv7()."""
+    op.execute("ALTER TABLE vendors ALTER COLUMN id SET DEFAULT gen_random_uuid()")
+    op.execute("DROP FUNCTION IF EXISTS uuidv7()")
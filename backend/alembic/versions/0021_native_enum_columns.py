@@ -0,0 +1,64 @@
+"""Store statuses, severities, priorities and risk levels as native enums.
+
+``vendors.status``, ``findings.severity``, ``internal_findings.severity``,
+``remediations.priority`` and ``concentration_alerts.risk_level`` were
+``varchar(20)`` holding a closed set of values. An enum value is 4 bytes and
+compares as an integer, and the type rejects anything outside the set. The
+labels are the existing lowercase values, so rows cast in place.
+
+Changing a column type rewrites the table and rebuilds its indexes under an
+ACCESS EXCLUSIVE lock; run this during a maintenance window on large
+``findings`` partitions.
+
+Revision ID: 0021
+Revises: 0020
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0021"
+down_revision: str | None = "0020"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+_TYPES = {
+    "vendor_status": ("active", "inactive", "under_review"),
+    "severity": ("critical", "high", "medium", "low", "info"),
+    "priority": ("critical", "high", "medium", "low"),
+    "risk_level": ("low", "medium", "high", "critical"),
+}
+
+# (table, column, enum type)
+_COLUMNS = (
+    ("vendors", "status", "vendor_status"),
+    ("findings", "severity", "severity"),
+    ("internal_findings", "severity", "severity"),
+    ("remediations", "priority", "priority"),
+    ("concentration_alerts", "risk_level", "risk_level"),
+)
+
+
+def upgrade() -> None:
+    """Create the enum types and convert the columns."""
+    for name, labels in _TYPES.items():
+        values = ", ".join(f"'{label}'" for label in labels)
+        op.execute(f"CREATE TYPE {name} AS ENUM ({values})")
+    for table, column, type_name in _COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE {type_name} "
+            f"USING {column}::{type_name}"
+        )
+
+
+def downgrade() -> None:
+    """Convert the columns back to varchar(20) and drop the enum types."""
+    for table, column, _type_name in _COLUMNS:
+        op.execute(
+            f"ALTER TABLE {table} ALTER COLUMN {column} TYPE varchar(20) "
+            f"USING {column}::text"
+        )
+    for name in _TYPES:
+        op.execute(f"DROP TYPE {name}")
@@ -0,0 +1,41 @@
+"""Store vendor domains as case-insensitive citext.
+
+``vendors.domain`` becomes ``citext``: its unique index rejects domains that
+differ only by case, so plain ``domain = :x`` lookups are case-insensitive
+and index-backed, and the CSV importer uses it as its ON CONFLICT arbiter.
+The ``ix_vendors_domain_lower`` expression index is no longer needed.
+
+Changing the column type rebuilds the indexes covering ``domain`` under an
+ACCESS EXCLUSIVE lock.
+
+Revision ID: 0022
+Revises: 0021
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0022"
+down_revision: str | None = "0021"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Install citext, convert the domain column and drop the lower(domain) index."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS citext")
+    op.execute("ALTER TABLE vendors ALTER COLUMN domain TYPE citext")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_vendors_domain_lower")
+
+
+def downgrade() -> None:
+    """Restore the lower(domain) index and the varchar(255) column."""
+    op.execute("ALTER TABLE vendors ALTER COLUMN domain TYPE varchar(255)")
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_vendors_domain_lower "
+            "ON vendors (lower(domain))"
+        )
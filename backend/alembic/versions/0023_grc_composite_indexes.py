@@ -0,0 +1,51 @@
+"""Add composite indexes for the GRC control and framework queries.
+
+``ix_security_controls_domain_status`` serves the control listing filtered on
+domain, or on domain and status. ``ix_framework_mappings_framework_control``
+lists the controls mapped to a framework from the index alone, which the
+``compliance_dashboard`` refresh join also uses. Each makes the single-column
+index on its leading column redundant.
+
+Revision ID: 0023
+Revises: 0022
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0023"
+down_revision: str | None = "0022"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the composite indexes and drop the single-column ones they cover."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_security_controls_domain_status "
+            "ON security_controls (domain, status)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_framework_mappings_framework_control "
+            "ON framework_mappings (framework, control_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_security_controls_domain")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_framework_mappings_framework")
+
+
+def downgrade() -> None:
+    """Restore the single-column indexes and drop the composite ones."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_framework_mappings_framework "
+            "ON framework_mappings (framework)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_security_controls_domain "
+            "ON security_controls (domain)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_framework_mappings_framework_control")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_security_controls_domain_status")
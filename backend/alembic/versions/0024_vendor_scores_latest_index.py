@@ -0,0 +1,42 @@
+"""Index vendor scores by vendor, newest first.
+
+Every "latest score of a vendor" lookup filtered ``vendor_scores`` on
+``vendor_id`` and then sorted that vendor's whole history on ``scanned_at``.
+This includes the PowerBI dataset's domain scores, the latest-score
+endpoint and the score history. ``ix_vendor_scores_vendor_scanned`` returns
+that history already ordered, so the latest score is the first index
+entry. It makes the single-column ``vendor_id`` index redundant.
+
+Revision ID: 0024
+Revises: 0023
+Create Date: 2026-10-16
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0024"
+down_revision: str | None = "0023"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Create the (vendor_id, scanned_at DESC) index and drop the vendor_id one."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vendor_scores_vendor_scanned "
+            "ON vendor_scores (vendor_id, scanned_at DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_vendor_scores_vendor_id")
+
+
+def downgrade() -> None:
+    """Restore the vendor_id index and drop the composite one."""
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_vendor_scores_vendor_id "
+            "ON vendor_scores (vendor_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_vendor_scores_vendor_scanned")
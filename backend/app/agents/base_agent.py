@@ -6,7 +6,6 @@ LLM provider integration.
 """
 
 import asyncio
-import base64
 import logging
 import time
 from abc import ABC, abstractmethod
@@ -178,32 +177,22 @@ class BaseAgent(ABC):
         """
         from app.config import settings
         from app.database import async_session
-        from app.models.llm_config import LLMConfig
+        from app.services.llm_config_service import get_cached_llm_config
         from app.services.llm_provider import (
             BaseLLMProvider,
             LLMProviderConfig,
             get_llm_provider,
         )
-        from app.utils.crypto import decrypt_data
-
-        from sqlalchemy import select
 
         async with async_session() as session:
-            result = await session.execute(
-                select(LLMConfig).where(LLMConfig.is_active.is_(True)).limit(1)
-            )
-            cfg = result.scalar_one_or_none()
+            cfg = await get_cached_llm_config(session)
 
         if cfg is not None:
-            api_key = None
-            if cfg.api_key_encrypted and settings.encryption_key:
-                enc_key = base64.b64decode(settings.encryption_key)
-                api_key = decrypt_data(cfg.api_key_encrypted, enc_key)
             return get_llm_provider(
                 LLMProviderConfig(
                     provider=cfg.provider,
                     model_name=cfg.model_name,
-                    api_key=api_key,
+                    api_key=cfg.api_key,
                     api_base_url=cfg.api_base_url,
                 )
             )
@@ -0,0 +1,56 @@
+"""Response classes for read-heavy endpoints.
+
+When a route returns a Pydantic model, FastAPI dumps it to Python objects,
+validates the result again against ``response_model`` and only then encodes
+it to JSON. ``ModelResponse`` serializes the schema straight to JSON bytes
+with pydantic-core instead, skipping the round-trip. Routes keep their
+``response_model`` for the OpenAPI schema.
+
+``FastJSONResponse`` is the application's default response class: it encodes
+with pydantic-core's serializer instead of ``json.dumps``.
+"""
+
+from collections.abc import Sequence
+from functools import cache
+from typing import Any
+
+from fastapi import Response
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    """JSON response encoded by pydantic-core.
+
+    Handles datetime, UUID and Decimal natively and several times faster than
+    ``json.dumps``. Non-finite floats are encoded as ``null``.
+    """
+
+    def render(self, content: Any) -> bytes:
+        """Serialize the content to JSON bytes."""
+        return to_json(content, inf_nan_mode="null")
+
+
+@cache
+def _list_adapter(model: type[BaseModel]) -> TypeAdapter[list[Any]]:
+    """Return the (cached) adapter serializing a list of ``model``."""
+    return TypeAdapter(list[model])
+
+
+class ModelResponse(Response):
+    """JSON response rendering a Pydantic model or a list of one model type.
+
+    The content is trusted (built by our own services), so it is serialized
+    without being validated again.
+    """
+
+    media_type = "application/json"
+
+    def render(self, content: BaseModel | Sequence[BaseModel]) -> bytes:
+        """Serialize the content to JSON bytes."""
+        if isinstance(content, BaseModel):
+            return content.model_dump_json().encode()
+        if not content:
+            return b"[]"
+        return _list_adapter(type(content[0])).dump_json(list(content))
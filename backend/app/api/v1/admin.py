@@ -3,9 +3,9 @@
 import base64
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from pydantic import BaseModel, Field
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_db, require_role
@@ -13,12 +13,16 @@ from app.config import settings
 from app.models.llm_config import LLMConfig
 from app.models.user import User
 from app.schemas.llm_config import (
-    LLM_PROVIDERS,
+    LLM_PROVIDERS_JSON,
     LLMConfigCreate,
     LLMConfigResponse,
     LLMConfigTestResponse,
     LLMProviderInfo,
 )
+from app.services.llm_config_service import (
+    get_active_llm_config,
+    invalidate_llm_config_cache,
+)
 from app.services.llm_provider import LLMProviderConfig, get_llm_provider
 from app.services.proxy_service import get_proxy_url, verify_proxy
 from app.utils.constants import DEFAULT_DOMAIN_WEIGHTS, SCORING_DOMAINS
@@ -164,10 +168,7 @@ async def get_llm_config(
     _current_user: object = Depends(require_role("admin")),
 ) -> LLMConfigResponse | None:
     """Get the current active LLM configuration (API key masked)."""
-    result = await db.execute(
-        select(LLMConfig).where(LLMConfig.is_active.is_(True)).limit(1)
-    )
-    cfg = result.scalar_one_or_none()
+    cfg = await get_active_llm_config(db)
     if cfg is None:
         return None
     enc_key = _get_encryption_key()
@@ -186,12 +187,10 @@ async def update_llm_config(
     """
     enc_key = _get_encryption_key()
 
-    # Deactivate all existing active configs
-    result = await db.execute(
-        select(LLMConfig).where(LLMConfig.is_active.is_(True))
+    # Deactivate the current config first: uniq_llm_active allows one active row
+    await db.execute(
+        update(LLMConfig).where(LLMConfig.is_active.is_(True)).values(is_active=False)
     )
-    for existing in result.scalars().all():
-        existing.is_active = False
 
     # Encrypt API key if provided
     encrypted_key = None
@@ -207,6 +206,8 @@ async def update_llm_config(
     )
     db.add(new_config)
     await db.flush()
+    # Other API workers are notified by the llm_configs trigger on commit
+    invalidate_llm_config_cache()
     return _llm_config_to_response(new_config, enc_key)
 
 
@@ -245,9 +246,9 @@ async def test_llm_config(
 @router.get("/llm-providers", response_model=list[LLMProviderInfo])
 async def list_llm_providers(
     _current_user: object = Depends(require_role("admin")),
-) -> list[LLMProviderInfo]:
+) -> Response:
     """List all available LLM providers with their supported models."""
-    return LLM_PROVIDERS
+    return Response(content=LLM_PROVIDERS_JSON, media_type="application/json")
 
 
 # ---------------------------------------------------------------------------
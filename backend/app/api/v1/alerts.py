@@ -1,19 +1,22 @@
 """Alert endpoints."""
 
+from typing import Literal
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
 from app.models.alert import Alert
+from app.schemas.common import UUIDStr
 
 router = APIRouter(prefix="/alerts", tags=["alerts"])
 
 
 @router.get("/")
 async def list_alerts(
-    vendor_id: str | None = Query(None),
-    severity: str | None = Query(None, pattern=r"^(critical|high|medium|low|info)$"),
+    vendor_id: UUIDStr | None = Query(None),
+    severity: Literal["critical", "high", "medium", "low", "info"] | None = Query(None),
     is_read: bool | None = Query(None),
     is_resolved: bool | None = Query(None),
     page: int = Query(1, ge=1),
@@ -32,20 +35,26 @@ async def list_alerts(
     if is_resolved is not None:
         query = query.where(Alert.is_resolved == is_resolved)
 
-    query = query.order_by(Alert.created_at.desc())
-
-    # Count total
+    # Paginate, with the total from a window count in the same round-trip
     from sqlalchemy import func as sa_func
 
-    count_query = select(sa_func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
-    # Paginate
     offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size)
-    result = await db.execute(query)
-    alerts = result.scalars().all()
+    result = await db.execute(
+        query.add_columns(sa_func.count().over().label("total_count"))
+        .order_by(Alert.created_at.desc())
+        .offset(offset)
+        .limit(page_size)
+    )
+    rows = result.all()
+    alerts = [row.Alert for row in rows]
+    if rows:
+        total = rows[0].total_count
+    elif offset:
+        # Past the last page no row carries the window count
+        total_result = await db.execute(select(sa_func.count()).select_from(query.subquery()))
+        total = total_result.scalar() or 0
+    else:
+        total = 0
 
     return {
         "items": [
@@ -71,7 +80,7 @@ async def list_alerts(
 
 @router.get("/{alert_id}")
 async def get_alert(
-    alert_id: str,
+    alert_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
 ) -> dict:
@@ -98,7 +107,7 @@ async def get_alert(
 
 @router.patch("/{alert_id}/read")
 async def mark_alert_read(
-    alert_id: str,
+    alert_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
 ) -> dict:
@@ -116,7 +125,7 @@ async def mark_alert_read(
 
 @router.patch("/{alert_id}/resolve")
 async def mark_alert_resolved(
-    alert_id: str,
+    alert_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
 ) -> dict:
@@ -1,8 +1,11 @@
 """Benchmark endpoints: sector comparison for vendors and portfolio."""
 
+from typing import Literal
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from app.api.deps import get_current_user
+from app.schemas.common import UUIDStr
 from app.services.benchmark_service import BenchmarkService
 
 router = APIRouter(prefix="/benchmark", tags=["benchmark"])
@@ -20,7 +23,7 @@ async def list_sectors(
 
 @router.get("/portfolio")
 async def portfolio_benchmark(
-    sector: str = Query(..., pattern=r"^(assurance|mutuelle|sante|banque|industrie)$"),
+    sector: Literal["assurance", "mutuelle", "sante", "banque", "industrie"] = Query(...),
     _current_user: object = Depends(get_current_user),
 ) -> dict:
     """Compare portfolio averages against a sector benchmark.
@@ -50,8 +53,8 @@ async def portfolio_benchmark(
 
 @router.get("/vendors/{vendor_id}")
 async def vendor_benchmark(
-    vendor_id: str,
-    sector: str = Query(..., pattern=r"^(assurance|mutuelle|sante|banque|industrie)$"),
+    vendor_id: UUIDStr,
+    sector: Literal["assurance", "mutuelle", "sante", "banque", "industrie"] = Query(...),
     _current_user: object = Depends(get_current_user),
 ) -> dict:
     """Compare a vendor's scores against a sector benchmark.
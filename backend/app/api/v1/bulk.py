@@ -3,25 +3,75 @@
 import csv
 import io
 import json
+from collections.abc import AsyncIterator
 from datetime import datetime, timezone
+from typing import Any
 
 from fastapi import APIRouter, Depends, Query, UploadFile
 from fastapi.responses import StreamingResponse
-from sqlalchemy import select
+from pydantic import ValidationError
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db, require_role
-from app.models.scoring import Finding, VendorScore
+from app.database import async_session, run_after_commit
+from app.models.scoring import Finding
 from app.models.vendor import Vendor
 from app.schemas.bulk import (
+    BULK_IMPORT_ROWS,
     BulkExportFormat,
     BulkImportResult,
     BulkScanRequest,
     BulkScanResponse,
 )
+from app.services.integrations.powerbi_service import invalidate_dataset_cache
 
 router = APIRouter(prefix="/bulk", tags=["bulk"])
 
+# Rows per multi-row INSERT during CSV import
+IMPORT_BATCH_SIZE = 1000
+# Rows fetched and serialized per chunk of a streamed export
+EXPORT_BATCH_SIZE = 1000
+
+
+# Existing domains, in any case, are skipped by the database through the
+# unique citext domain index instead of a lookup per row
+_IMPORT_STMT = (
+    pg_insert(Vendor)
+    .on_conflict_do_nothing(index_elements=[Vendor.domain])
+    .returning(Vendor.id)
+)
+
+
+async def _import_batch(
+    db: AsyncSession,
+    raw_rows: list[dict[str, Any]],
+    row_nums: list[int],
+    errors: list[tuple[int, str]],
+) -> tuple[int, int]:
+    """Validate a batch of CSV rows in one call and insert the valid ones.
+
+    Invalid rows are reported in ``errors`` as ``(row number, message)``.
+
+    Returns:
+        Number of valid rows and number of vendors created.
+    """
+    try:
+        rows = BULK_IMPORT_ROWS.validate_python(raw_rows)
+    except ValidationError as exc:
+        failed: dict[int, str] = {}
+        for err in exc.errors():
+            failed.setdefault(err["loc"][0], err["msg"])
+        errors.extend((row_nums[i], msg) for i, msg in failed.items())
+        rows = BULK_IMPORT_ROWS.validate_python(
+            [raw for i, raw in enumerate(raw_rows) if i not in failed]
+        )
+    if not rows:
+        return 0, 0
+    result = await db.execute(_IMPORT_STMT, [row.to_vendor_row() for row in rows])
+    return len(rows), len(result.all())
+
 
 @router.post("/vendors", response_model=BulkImportResult)
 async def bulk_import_vendors(
@@ -34,53 +84,59 @@ async def bulk_import_vendors(
     CSV format: name,domain,tier,industry,country,contact_email
     First row must be a header row.
     """
-    content = await file.read()
-    text = content.decode("utf-8-sig")
-    reader = csv.DictReader(io.StringIO(text))
+    reader = csv.DictReader(io.TextIOWrapper(file.file, encoding="utf-8-sig"))
 
     created = 0
-    skipped = 0
-    errors: list[str] = []
+    errors: list[tuple[int, str]] = []
     total = 0
+    valid = 0
+    raw_rows: list[dict[str, Any]] = []
+    row_nums: list[int] = []
 
     for row_num, row in enumerate(reader, start=2):
         total += 1
-        name = row.get("name", "").strip()
-        domain = row.get("domain", "").strip()
+        name = (row.get("name") or "").strip()
+        domain = (row.get("domain") or "").strip()
 
         if not name or not domain:
-            errors.append(f"Row {row_num}: missing name or domain")
-            continue
-
-        # Check duplicate
-        existing = await db.execute(
-            select(Vendor).where(Vendor.domain == domain)
-        )
-        if existing.scalar_one_or_none():
-            skipped += 1
+            errors.append((row_num, "missing name or domain"))
             continue
 
         try:
-            tier = int(row.get("tier", "3"))
+            tier = int(row.get("tier") or "3")
         except ValueError:
             tier = 3
 
-        vendor = Vendor(
-            name=name,
-            domain=domain,
-            tier=max(1, min(3, tier)),
-            industry=row.get("industry", "").strip() or None,
-            country=row.get("country", "").strip() or None,
-            contact_email=row.get("contact_email", "").strip() or None,
-        )
-        db.add(vendor)
-        created += 1
+        raw_rows.append({
+            "name": name,
+            "domain": domain,
+            "tier": max(1, min(3, tier)),
+            "industry": (row.get("industry") or "").strip() or None,
+            "country": (row.get("country") or "").strip() or None,
+            "contact_email": (row.get("contact_email") or "").strip() or None,
+        })
+        row_nums.append(row_num)
+        if len(raw_rows) >= IMPORT_BATCH_SIZE:
+            batch_valid, batch_created = await _import_batch(db, raw_rows, row_nums, errors)
+            valid += batch_valid
+            created += batch_created
+            raw_rows, row_nums = [], []
+
+    if raw_rows:
+        batch_valid, batch_created = await _import_batch(db, raw_rows, row_nums, errors)
+        valid += batch_valid
+        created += batch_created
+
+    skipped = valid - created
+    # The Core INSERT bypasses the mapper events that retire cached datasets
+    if created:
+        run_after_commit(db, invalidate_dataset_cache)
 
     return BulkImportResult(
         total_rows=total,
         created=created,
         skipped=skipped,
-        errors=errors,
+        errors=[f"Row {row_num}: {msg}" for row_num, msg in sorted(errors)],
     )
 
 
@@ -116,74 +172,118 @@ async def bulk_scan(
     )
 
 
+_EXPORT_FIELDS = (
+    "vendor_id",
+    "name",
+    "domain",
+    "tier",
+    "industry",
+    "country",
+    "status",
+    "global_score",
+    "grade",
+    "scanned_at",
+    "open_findings",
+)
+
+
+async def _iter_export_rows() -> AsyncIterator[list[dict]]:
+    """Yield export rows in batches of ``EXPORT_BATCH_SIZE``.
+
+    Runs in its own session: the request session is closed before a
+    streaming response body is produced.
+    """
+    open_findings = (
+        select(Finding.vendor_id, func.count().label("open_findings"))
+        .where(Finding.status == "open")
+        .group_by(Finding.vendor_id)
+        .subquery()
+    )
+    stmt = (
+        select(
+            Vendor.id,
+            Vendor.name,
+            Vendor.domain,
+            Vendor.tier,
+            Vendor.industry,
+            Vendor.country,
+            Vendor.status,
+            Vendor.latest_score,
+            Vendor.latest_grade,
+            Vendor.latest_scored_at,
+            open_findings.c.open_findings,
+        )
+        .outerjoin(open_findings, open_findings.c.vendor_id == Vendor.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    async with async_session() as session:
+        result = await session.stream(stmt)
+        async for partition in result.partitions():
+            yield [
+                {
+                    "vendor_id": r.id,
+                    "name": r.name,
+                    "domain": r.domain,
+                    "tier": r.tier,
+                    "industry": r.industry or "",
+                    "country": r.country or "",
+                    "status": r.status,
+                    "global_score": r.latest_score if r.latest_score is not None else "",
+                    "grade": r.latest_grade or "",
+                    "scanned_at": r.latest_scored_at.isoformat() if r.latest_scored_at else "",
+                    "open_findings": r.open_findings or 0,
+                }
+                for r in partition
+            ]
+
+
+async def _iter_csv() -> AsyncIterator[bytes]:
+    """Stream the export as CSV, one chunk per batch of rows."""
+    buf = io.StringIO()
+    writer = csv.DictWriter(buf, fieldnames=_EXPORT_FIELDS)
+    writer.writeheader()
+    async for rows in _iter_export_rows():
+        writer.writerows(rows)
+        yield buf.getvalue().encode("utf-8")
+        buf.seek(0)
+        buf.truncate()
+    if buf.tell():
+        yield buf.getvalue().encode("utf-8")
+
+
+async def _iter_json() -> AsyncIterator[bytes]:
+    """Stream the export as a JSON array, one chunk per batch of rows."""
+    separator = "[\n"
+    async for rows in _iter_export_rows():
+        chunk = ",\n".join(json.dumps(row, default=str) for row in rows)
+        yield (separator + chunk).encode("utf-8")
+        separator = ",\n"
+    yield ("[]" if separator == "[\n" else "\n]").encode("utf-8")
+
+
 @router.get("/export")
 async def bulk_export(
     format: BulkExportFormat = Query(BulkExportFormat.JSON),
-    db: AsyncSession = Depends(get_db),
     _user: object = Depends(get_current_user),
 ) -> StreamingResponse:
     """Export all vendor data with scores and findings.
 
-    Supports CSV and JSON formats.
+    Supports CSV and JSON formats. Rows are streamed in batches, so the
+    first bytes go out before the whole table has been read.
     """
-    # Fetch data
-    vendor_result = await db.execute(select(Vendor))
-    vendors = vendor_result.scalars().all()
-
-    score_result = await db.execute(
-        select(VendorScore).order_by(VendorScore.scanned_at.desc())
-    )
-    scores = score_result.scalars().all()
-    score_map: dict[str, VendorScore] = {}
-    for s in scores:
-        if s.vendor_id not in score_map:
-            score_map[s.vendor_id] = s
-
-    finding_result = await db.execute(select(Finding).where(Finding.status == "open"))
-    findings = finding_result.scalars().all()
-    finding_counts: dict[str, int] = {}
-    for f in findings:
-        finding_counts[f.vendor_id] = finding_counts.get(f.vendor_id, 0) + 1
-
-    # Build rows
-    rows: list[dict] = []
-    for v in vendors:
-        sc = score_map.get(v.id)
-        rows.append({
-            "vendor_id": v.id,
-            "name": v.name,
-            "domain": v.domain,
-            "tier": v.tier,
-            "industry": v.industry or "",
-            "country": v.country or "",
-            "status": v.status,
-            "global_score": sc.global_score if sc else "",
-            "grade": sc.grade if sc else "",
-            "scanned_at": sc.scanned_at.isoformat() if sc and sc.scanned_at else "",
-            "open_findings": finding_counts.get(v.id, 0),
-        })
-
     now = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
 
     if format == BulkExportFormat.CSV:
-        output = io.StringIO()
-        if rows:
-            writer = csv.DictWriter(output, fieldnames=rows[0].keys())
-            writer.writeheader()
-            writer.writerows(rows)
-        content = output.getvalue()
         return StreamingResponse(
-            io.BytesIO(content.encode("utf-8")),
+            _iter_csv(),
             media_type="text/csv",
             headers={
                 "Content-Disposition": f'attachment; filename="export_{now}.csv"'
             },
         )
 
-    # JSON format
-    content = json.dumps(rows, indent=2, default=str)
     return StreamingResponse(
-        io.BytesIO(content.encode("utf-8")),
+        _iter_json(),
         media_type="application/json",
         headers={
             "Content-Disposition": f'attachment; filename="export_{now}.json"'
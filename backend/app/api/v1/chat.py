@@ -96,7 +96,7 @@ async def trigger_reindex(
     from app.models.scoring import Finding, VendorScore
     from app.models.vendor import Vendor
     from app.services.llm_provider import LLMProviderConfig, get_llm_provider
-    from app.services.rag_service import RAGService
+    from app.services.rag_service import RAGService, clear_search_cache
 
     from sqlalchemy import select
 
@@ -130,28 +130,54 @@ async def trigger_reindex(
             }
             for s in scores
         ]
-        indexed["scores"] = await rag.index_vendor_scores(score_dicts)
+        indexed["scores"] = await rag.index_vendor_scores(
+            score_dicts, batch_size=request.batch_size
+        )
 
     if "findings" in request.collections:
-        findings_q = select(Finding)
-        finding_result = await db.execute(findings_q)
-        findings = finding_result.scalars().all()
-
-        finding_dicts = [
-            {
-                "id": f.id,
-                "vendor_id": f.vendor_id,
-                "title": f.title,
-                "description": f.description or "",
-                "severity": f.severity,
-                "domain": f.domain,
-            }
-            for f in findings
-        ]
-        indexed["findings"] = await rag.index_findings(finding_dicts)
+        # Plain rows streamed and indexed one batch at a time, so that only a
+        # batch of what can be the whole findings table is held in memory
+        findings_q = select(
+            Finding.id,
+            Finding.vendor_id,
+            Finding.title,
+            Finding.description,
+            Finding.severity,
+            Finding.domain,
+        ).execution_options(yield_per=request.batch_size)
+        indexed["findings"] = 0
+        findings_result = await db.stream(findings_q)
+        async for partition in findings_result.partitions():
+            indexed["findings"] += await rag.index_findings(
+                [
+                    {
+                        "id": f.id,
+                        "vendor_id": f.vendor_id,
+                        "title": f.title,
+                        "description": f.description or "",
+                        "severity": f.severity,
+                        "domain": f.domain,
+                    }
+                    for f in partition
+                ],
+                batch_size=request.batch_size,
+            )
+
+    # Cached search results may reference replaced points
+    clear_search_cache()
 
     return {
         "status": "completed",
         "indexed": indexed,
         "collections": request.collections,
     }
+
+
+@router.get("/cache/stats")
+async def get_chat_cache_stats(
+    _user: UserClaims = Depends(get_current_user),
+) -> dict:
+    """Return hit/miss/eviction counters of the RAG search cache."""
+    from app.services.rag_service import get_search_cache_stats
+
+    return get_search_cache_stats()
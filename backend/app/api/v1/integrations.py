@@ -20,37 +20,33 @@ from app.services.integrations import (
 router = APIRouter(prefix="/integrations", tags=["integrations"])
 
 
+_Service = SplunkService | ServiceNowService | SlackService | TeamsService
+
+# Service class of each integration, looked up by enum member
+_SERVICES: dict[IntegrationType, type[_Service]] = {
+    IntegrationType.splunk: SplunkService,
+    IntegrationType.servicenow: ServiceNowService,
+    IntegrationType.slack: SlackService,
+    IntegrationType.teams: TeamsService,
+}
+
+
+def _get_service(itype: IntegrationType) -> _Service:
+    """Instantiate the service of an integration type from the current settings."""
+    service_class = _SERVICES.get(itype)
+    if service_class is None:
+        raise HTTPException(status_code=400, detail=f"Unknown integration type: {itype}")
+    return service_class()
+
+
 def _get_status(itype: IntegrationType) -> IntegrationStatus:
     """Build current status for an integration type based on settings."""
-    if itype == IntegrationType.splunk:
-        svc = SplunkService()
-        return IntegrationStatus(
-            type=itype,
-            enabled=svc.configured,
-            configured=svc.configured,
-        )
-    if itype == IntegrationType.servicenow:
-        svc = ServiceNowService()
-        return IntegrationStatus(
-            type=itype,
-            enabled=svc.configured,
-            configured=svc.configured,
-        )
-    if itype == IntegrationType.slack:
-        svc = SlackService()
-        return IntegrationStatus(
-            type=itype,
-            enabled=svc.configured,
-            configured=svc.configured,
-        )
-    if itype == IntegrationType.teams:
-        svc = TeamsService()
-        return IntegrationStatus(
-            type=itype,
-            enabled=svc.configured,
-            configured=svc.configured,
-        )
-    raise HTTPException(status_code=400, detail=f"Unknown integration type: {itype}")
+    svc = _get_service(itype)
+    return IntegrationStatus(
+        type=itype,
+        enabled=svc.configured,
+        configured=svc.configured,
+    )
 
 
 @router.get("/", response_model=IntegrationListResponse)
@@ -90,16 +86,7 @@ async def test_integration(
     integration_type: IntegrationType,
 ) -> IntegrationTestResult:
     """Test connectivity for an integration."""
-    if integration_type == IntegrationType.splunk:
-        result = await SplunkService().test_connection()
-    elif integration_type == IntegrationType.servicenow:
-        result = await ServiceNowService().test_connection()
-    elif integration_type == IntegrationType.slack:
-        result = await SlackService().test_connection()
-    elif integration_type == IntegrationType.teams:
-        result = await TeamsService().test_connection()
-    else:
-        raise HTTPException(status_code=400, detail="Unknown integration type")
+    result = await _get_service(integration_type).test_connection()
 
     return IntegrationTestResult(
         type=integration_type,
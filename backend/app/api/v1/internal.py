@@ -1,11 +1,14 @@
 """Internal scoring endpoints: AD Rating, M365 Rating, GRC/PSSI."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db, require_role
 from app.models.internal_scoring import InternalFinding, InternalScan
+from app.schemas.common import UUIDStr
 from app.schemas.grc import FrameworkCoverage, HeatmapCell, MaturityData, SecurityControlResponse, SecurityControlUpdate
 from app.schemas.internal import InternalFindingResponse, InternalScanCreate, InternalScanResponse
 from app.services.ad_rating_service import ADRatingService
@@ -65,24 +68,21 @@ async def get_ad_history(
 
 @router.get("/ad/findings", response_model=list[InternalFindingResponse])
 async def get_ad_findings(
-    severity: str | None = Query(None, pattern=r"^(critical|high|medium|low|info)$"),
+    severity: Literal["critical", "high", "medium", "low", "info"] | None = Query(None),
     category: str | None = Query(None),
     db: AsyncSession = Depends(get_db),
     _user: object = Depends(get_current_user),
 ) -> list[InternalFindingResponse]:
     """Get findings from the latest AD scan."""
-    # Get latest AD scan
-    scan_result = await db.execute(
-        select(InternalScan)
+    # Latest scan resolved in the same statement as its findings
+    latest_scan = (
+        select(InternalScan.id)
         .where(InternalScan.scan_type == "ad")
         .order_by(InternalScan.created_at.desc())
         .limit(1)
+        .scalar_subquery()
     )
-    scan = scan_result.scalar_one_or_none()
-    if not scan:
-        return []
-
-    query = select(InternalFinding).where(InternalFinding.scan_id == scan.id)
+    query = select(InternalFinding).where(InternalFinding.scan_id == latest_scan)
     if severity:
         query = query.where(InternalFinding.severity == severity)
     if category:
@@ -131,22 +131,20 @@ async def get_m365_score(
 
 @router.get("/m365/findings", response_model=list[InternalFindingResponse])
 async def get_m365_findings(
-    severity: str | None = Query(None, pattern=r"^(critical|high|medium|low|info)$"),
+    severity: Literal["critical", "high", "medium", "low", "info"] | None = Query(None),
     db: AsyncSession = Depends(get_db),
     _user: object = Depends(get_current_user),
 ) -> list[InternalFindingResponse]:
     """Get findings from the latest M365 scan."""
-    scan_result = await db.execute(
-        select(InternalScan)
+    # Latest scan resolved in the same statement as its findings
+    latest_scan = (
+        select(InternalScan.id)
         .where(InternalScan.scan_type == "m365")
         .order_by(InternalScan.created_at.desc())
         .limit(1)
+        .scalar_subquery()
     )
-    scan = scan_result.scalar_one_or_none()
-    if not scan:
-        return []
-
-    query = select(InternalFinding).where(InternalFinding.scan_id == scan.id)
+    query = select(InternalFinding).where(InternalFinding.scan_id == latest_scan)
     if severity:
         query = query.where(InternalFinding.severity == severity)
     query = query.order_by(InternalFinding.detected_at.desc())
@@ -162,15 +160,10 @@ async def get_m365_findings(
 @router.get("/grc/controls")
 async def get_grc_controls(
     domain: str | None = Query(None),
-    control_status: str | None = Query(
-        None,
-        alias="status",
-        pattern=r"^(implemented|partial|not_implemented)$",
-    ),
-    framework: str | None = Query(
-        None,
-        pattern=r"^(iso27001|dora|nis2|hds|rgpd)$",
+    control_status: Literal["implemented", "partial", "not_implemented"] | None = Query(
+        None, alias="status"
     ),
+    framework: Literal["iso27001", "dora", "nis2", "hds", "rgpd"] | None = Query(None),
     db: AsyncSession = Depends(get_db),
     _user: object = Depends(get_current_user),
 ) -> list[dict]:
@@ -181,7 +174,7 @@ async def get_grc_controls(
 
 @router.put("/grc/controls/{control_id}")
 async def update_grc_control(
-    control_id: str,
+    control_id: UUIDStr,
     update: SecurityControlUpdate,
     db: AsyncSession = Depends(get_db),
     _user: object = Depends(require_role("admin", "rssi", "analyste_ssi")),
@@ -207,12 +200,12 @@ async def get_grc_maturity(
     return await service.get_maturity_score()
 
 
-@router.get("/grc/coverage/{framework}")
+@router.get("/grc/coverage/{framework}", response_model=FrameworkCoverage)
 async def get_framework_coverage(
     framework: str,
     db: AsyncSession = Depends(get_db),
     _user: object = Depends(get_current_user),
-) -> dict:
+) -> Response:
     """Get implementation coverage for a specific framework."""
     if framework not in ("iso27001", "dora", "nis2", "hds", "rgpd"):
         raise HTTPException(
@@ -220,7 +213,9 @@ async def get_framework_coverage(
             detail=f"Unknown framework: {framework}",
         )
     service = GRCService(db)
-    return await service.get_coverage_by_framework(framework)
+    return Response(
+        content=await service.get_coverage_json(framework), media_type="application/json"
+    )
 
 
 @router.get("/grc/heatmap")
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db, require_role
+from app.schemas.common import UUIDStr
 from app.schemas.questionnaire import (
     QuestionnaireCreateRequest,
     QuestionnaireListItem,
@@ -62,7 +63,7 @@ async def list_questionnaires(
 
 @router.get("/{questionnaire_id}", response_model=QuestionnaireResponse)
 async def get_questionnaire(
-    questionnaire_id: str,
+    questionnaire_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
 ) -> QuestionnaireResponse:
@@ -79,7 +80,7 @@ async def get_questionnaire(
 
 @router.post("/{questionnaire_id}/send", response_model=QuestionnaireSendResponse)
 async def send_questionnaire(
-    questionnaire_id: str,
+    questionnaire_id: UUIDStr,
     data: QuestionnaireSendRequest,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(require_role("admin", "rssi", "analyste_ssi")),
@@ -97,7 +98,7 @@ async def send_questionnaire(
 
 @router.post("/{questionnaire_id}/respond", response_model=QuestionnaireSubmitResponse)
 async def submit_response(
-    questionnaire_id: str,
+    questionnaire_id: UUIDStr,
     data: QuestionnaireSubmitRequest,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
@@ -109,7 +110,7 @@ async def submit_response(
 
 @router.post("/{questionnaire_id}/smart-answer", response_model=SmartAnswerResponse)
 async def smart_answer(
-    questionnaire_id: str,
+    questionnaire_id: UUIDStr,
     data: SmartAnswerRequest,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
@@ -1,13 +1,16 @@
 """Report endpoints: list, generate, download."""
 
+from typing import Literal
+
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from fastapi.responses import FileResponse
-from pydantic import BaseModel, Field
+from pydantic import BaseModel
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db, require_role, UserClaims
 from app.models.report import Report
+from app.schemas.common import UUIDStr
 
 router = APIRouter(prefix="/reports", tags=["reports"])
 
@@ -15,15 +18,15 @@ router = APIRouter(prefix="/reports", tags=["reports"])
 class ReportGenerateRequest(BaseModel):
     """Request body for generating a report."""
 
-    report_type: str = Field(..., pattern=r"^(executive|rssi|vendor|dora|benchmark)$")
-    format: str = Field(default="pdf", pattern=r"^(pdf|pptx|xlsx)$")
+    report_type: Literal["executive", "rssi", "vendor", "dora", "benchmark"]
+    format: Literal["pdf", "pptx", "xlsx"] = "pdf"
     vendor_id: str | None = None
 
 
 @router.get("/")
 async def list_reports(
-    report_type: str | None = Query(None, pattern=r"^(executive|rssi|vendor|dora|benchmark)$"),
-    vendor_id: str | None = Query(None),
+    report_type: Literal["executive", "rssi", "vendor", "dora", "benchmark"] | None = Query(None),
+    vendor_id: UUIDStr | None = Query(None),
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
     db: AsyncSession = Depends(get_db),
@@ -35,18 +38,27 @@ async def list_reports(
         query = query.where(Report.report_type == report_type)
     if vendor_id:
         query = query.where(Report.vendor_id == vendor_id)
-    query = query.order_by(Report.created_at.desc())
 
     from sqlalchemy import func as sa_func
 
-    count_query = select(sa_func.count()).select_from(query.subquery())
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
-
+    # Paginate, with the total from a window count in the same round-trip
     offset = (page - 1) * page_size
-    query = query.offset(offset).limit(page_size)
-    result = await db.execute(query)
-    reports = result.scalars().all()
+    result = await db.execute(
+        query.add_columns(sa_func.count().over().label("total_count"))
+        .order_by(Report.created_at.desc())
+        .offset(offset)
+        .limit(page_size)
+    )
+    rows = result.all()
+    reports = [row.Report for row in rows]
+    if rows:
+        total = rows[0].total_count
+    elif offset:
+        # Past the last page no row carries the window count
+        total_result = await db.execute(select(sa_func.count()).select_from(query.subquery()))
+        total = total_result.scalar() or 0
+    else:
+        total = 0
 
     return {
         "items": [
@@ -92,7 +104,7 @@ async def generate_report(
 
 @router.get("/{report_id}/download")
 async def download_report(
-    report_id: str,
+    report_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
 ) -> FileResponse:
@@ -1,16 +1,43 @@
 """Scoring endpoints: scores, history, domain breakdown, scan trigger."""
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+import hashlib
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy import func as sa_func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db, require_role
+from app.api.responses import ModelResponse
 from app.models.scoring import Finding, VendorScore
 from app.models.vendor import Vendor
+from app.schemas.common import UUIDStr
 from app.schemas.scoring import FindingResponse, ScoreResponse, ScoringTriggerRequest
 
 router = APIRouter(prefix="/scoring", tags=["scoring"])
 
+# Domains scanned when a trigger request does not narrow the scope
+_DEFAULT_DOMAINS = ("D1", "D2", "D3", "D4", "D5", "D6", "D7", "D8")
+
+# Columns backing the read-only response schemas
+_SCORE_COLUMNS = [getattr(VendorScore, name) for name in ScoreResponse.model_fields]
+_FINDING_COLUMNS = [getattr(Finding, name) for name in FindingResponse.model_fields]
+
+
+def _weak_etag(*parts: object) -> str:
+    """Build a weak ETag from the values identifying a response body."""
+    key = ":".join(str(p) for p in parts)
+    return f'W/"{hashlib.blake2b(key.encode(), digest_size=8).hexdigest()}"'
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Return True if the client's If-None-Match header covers this ETag."""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    candidates = {tag.strip() for tag in header.split(",")}
+    return "*" in candidates or etag in candidates
+
 
 @router.get("/portfolio")
 async def get_portfolio_scores(
@@ -32,40 +59,21 @@ async def get_portfolio_scores(
             "tier1Coverage": 0,
         }
 
-    # Average of each vendor's latest score
-    latest_scores_subq = (
-        select(
-            VendorScore.vendor_id,
-            VendorScore.global_score,
-            sa_func.row_number()
-            .over(partition_by=VendorScore.vendor_id, order_by=VendorScore.scanned_at.desc())
-            .label("rn"),
-        )
-    ).subquery()
-
-    latest = select(
-        sa_func.avg(latest_scores_subq.c.global_score).label("avg_score"),
-        sa_func.count().label("scored_count"),
-    ).where(latest_scores_subq.c.rn == 1)
-
-    avg_result = await db.execute(latest)
-    row = avg_result.one_or_none()
-    avg_score = round(float(row.avg_score)) if row and row.avg_score else 0
-
-    # Tier-1 coverage
-    tier1_total_result = await db.execute(
-        select(sa_func.count(Vendor.id)).where(Vendor.tier == 1)
+    # Average of each vendor's latest score, denormalized onto vendors
+    avg_result = await db.execute(
+        select(sa_func.avg(Vendor.latest_score)).where(Vendor.latest_score.is_not(None))
     )
-    tier1_total = tier1_total_result.scalar() or 0
+    avg = avg_result.scalar()
+    avg_score = round(float(avg)) if avg else 0
 
-    tier1_scored_result = await db.execute(
-        select(sa_func.count(sa_func.distinct(VendorScore.vendor_id))).where(
-            VendorScore.vendor_id.in_(
-                select(Vendor.id).where(Vendor.tier == 1)
-            )
-        )
+    # Tier-1 coverage
+    tier1_result = await db.execute(
+        select(
+            sa_func.count(),
+            sa_func.count(Vendor.latest_scored_at),
+        ).where(Vendor.tier == 1)
     )
-    tier1_scored = tier1_scored_result.scalar() or 0
+    tier1_total, tier1_scored = tier1_result.one()
     tier1_coverage = round(tier1_scored / tier1_total * 100) if tier1_total else 100
 
     return {
@@ -84,23 +92,10 @@ async def get_grade_distribution(
     _current_user: object = Depends(get_current_user),
 ) -> list[dict]:
     """Return vendor count per grade bucket for the latest scores."""
-    latest_scores_subq = (
-        select(
-            VendorScore.vendor_id,
-            VendorScore.grade,
-            sa_func.row_number()
-            .over(partition_by=VendorScore.vendor_id, order_by=VendorScore.scanned_at.desc())
-            .label("rn"),
-        )
-    ).subquery()
-
     result = await db.execute(
-        select(
-            latest_scores_subq.c.grade,
-            sa_func.count().label("cnt"),
-        )
-        .where(latest_scores_subq.c.rn == 1)
-        .group_by(latest_scores_subq.c.grade)
+        select(Vendor.latest_grade.label("grade"), sa_func.count().label("cnt"))
+        .where(Vendor.latest_grade.is_not(None))
+        .group_by(Vendor.latest_grade)
     )
     counts = {row.grade: row.cnt for row in result.all()}
 
@@ -160,47 +155,61 @@ async def get_executive_summary(
 
 @router.get("/vendors/{vendor_id}/latest", response_model=ScoreResponse)
 async def get_latest_score(
-    vendor_id: str,
+    vendor_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
-) -> ScoreResponse:
+) -> ModelResponse:
     """Get the latest score for a vendor."""
     result = await db.execute(
-        select(VendorScore)
+        select(*_SCORE_COLUMNS)
         .where(VendorScore.vendor_id == vendor_id)
         .order_by(VendorScore.scanned_at.desc())
         .limit(1)
     )
-    score = result.scalar_one_or_none()
-    if not score:
+    row = result.mappings().one_or_none()
+    if row is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"No score found for vendor {vendor_id}",
         )
-    return ScoreResponse.model_validate(score)
+    return ModelResponse(ScoreResponse.model_construct(**row))
 
 
 @router.get("/vendors/{vendor_id}/history", response_model=list[ScoreResponse])
 async def get_score_history(
-    vendor_id: str,
+    vendor_id: UUIDStr,
+    request: Request,
     limit: int = Query(30, ge=1, le=365),
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
-) -> list[ScoreResponse]:
-    """Get score history for a vendor (most recent first)."""
+) -> Response:
+    """Get score history for a vendor (most recent first).
+
+    Responds 304 when the client's ETag matches the latest scan marker.
+    """
+    marker = await db.execute(
+        select(sa_func.max(VendorScore.scanned_at), sa_func.count()).where(
+            VendorScore.vendor_id == vendor_id
+        )
+    )
+    last_scanned, count = marker.one()
+    etag = _weak_etag(vendor_id, last_scanned, count, limit)
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
     result = await db.execute(
-        select(VendorScore)
+        select(*_SCORE_COLUMNS)
         .where(VendorScore.vendor_id == vendor_id)
         .order_by(VendorScore.scanned_at.desc())
         .limit(limit)
     )
-    scores = result.scalars().all()
-    return [ScoreResponse.model_validate(s) for s in scores]
+    scores = [ScoreResponse.model_construct(**row) for row in result.mappings()]
+    return ModelResponse(scores, headers={"ETag": etag})
 
 
 @router.get("/vendors/{vendor_id}/domains", response_model=dict)
 async def get_domain_breakdown(
-    vendor_id: str,
+    vendor_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
 ) -> dict:
@@ -228,30 +237,41 @@ async def get_domain_breakdown(
 
 @router.get("/vendors/{vendor_id}/findings", response_model=list[FindingResponse])
 async def get_vendor_findings(
-    vendor_id: str,
-    severity: str | None = Query(None, pattern=r"^(critical|high|medium|low|info)$"),
-    domain: str | None = Query(None, pattern=r"^D[1-8]$"),
-    finding_status: str | None = Query(
-        None,
-        alias="status",
-        pattern=r"^(open|acknowledged|disputed|resolved|false_positive)$",
-    ),
+    vendor_id: UUIDStr,
+    request: Request,
+    severity: Literal["critical", "high", "medium", "low", "info"] | None = Query(None),
+    domain: Literal["D1", "D2", "D3", "D4", "D5", "D6", "D7", "D8"] | None = Query(None),
+    finding_status: Literal[
+        "open", "acknowledged", "disputed", "resolved", "false_positive"
+    ] | None = Query(None, alias="status"),
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
-) -> list[FindingResponse]:
-    """Get findings for a vendor with optional filters."""
-    query = select(Finding).where(Finding.vendor_id == vendor_id)
+) -> Response:
+    """Get findings for a vendor with optional filters.
+
+    Responds 304 when the client's ETag matches the latest finding update.
+    """
+    filters = [Finding.vendor_id == vendor_id]
     if severity:
-        query = query.where(Finding.severity == severity)
+        filters.append(Finding.severity == severity)
     if domain:
-        query = query.where(Finding.domain == domain)
+        filters.append(Finding.domain == domain)
     if finding_status:
-        query = query.where(Finding.status == finding_status)
-    query = query.order_by(Finding.created_at.desc())
+        filters.append(Finding.status == finding_status)
+
+    marker = await db.execute(
+        select(sa_func.max(Finding.updated_at), sa_func.count()).where(*filters)
+    )
+    last_updated, count = marker.one()
+    etag = _weak_etag(vendor_id, last_updated, count, severity, domain, finding_status)
+    if _etag_matches(request, etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
+    query = select(*_FINDING_COLUMNS).where(*filters).order_by(Finding.created_at.desc())
 
     result = await db.execute(query)
-    findings = result.scalars().all()
-    return [FindingResponse.model_validate(f) for f in findings]
+    findings = [FindingResponse.model_construct(**row) for row in result.mappings()]
+    return ModelResponse(findings, headers={"ETag": etag})
 
 
 @router.post("/trigger", status_code=status.HTTP_202_ACCEPTED)
@@ -269,7 +289,7 @@ async def trigger_scan(
     return {
         "message": "Scan triggered",
         "vendor_id": request.vendor_id,
-        "domains": request.domains or ["D1", "D2", "D3", "D4", "D5", "D6", "D7", "D8"],
+        "domains": request.domains or _DEFAULT_DOMAINS,
         "priority": request.priority,
         "status": "queued",
     }
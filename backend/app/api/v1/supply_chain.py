@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db
+from app.api.responses import FastJSONResponse
 from app.schemas.supply_chain import (
     AnalyzeRequest,
     ConcentrationRiskResponse,
@@ -22,11 +23,11 @@ async def get_supply_chain_graph(
     ),
     db: AsyncSession = Depends(get_db),
     _user: object = Depends(get_current_user),
-) -> GraphData:
+) -> FastJSONResponse:
     """Return the full supply chain dependency graph (D3.js compatible)."""
     service = SupplyChainService(db)
     ids = vendor_ids.split(",") if vendor_ids else None
-    return await service.build_dependency_graph(ids)
+    return FastJSONResponse(await service.build_dependency_graph(ids))
 
 
 @router.get("/concentration", response_model=ConcentrationRiskResponse)
@@ -1,13 +1,17 @@
 """Vendor CRUD endpoints."""
 
+from typing import Literal
 from uuid import uuid4
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db, require_role
+from app.api.responses import ModelResponse
+from app.schemas.common import UUIDStr
 from app.schemas.vendor import (
     VendorCreate,
+    VendorCursorResponse,
     VendorListResponse,
     VendorResponse,
     VendorUpdate,
@@ -24,17 +28,19 @@ async def list_vendors(
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
     tier: int | None = Query(None, ge=1, le=3, description="Filter by tier"),
     industry: str | None = Query(None, description="Filter by industry"),
-    grade: str | None = Query(None, pattern=r"^[A-F]$", description="Filter by grade"),
-    status_filter: str | None = Query(
-        None, alias="status", pattern=r"^(active|inactive|under_review)$"
+    grade: Literal["A", "B", "C", "D", "E", "F"] | None = Query(
+        None, description="Filter by grade"
+    ),
+    status_filter: Literal["active", "inactive", "under_review"] | None = Query(
+        None, alias="status"
     ),
     search: str | None = Query(None, description="Search by name or domain"),
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
-) -> VendorListResponse:
+) -> ModelResponse:
     """List vendors with pagination and optional filters."""
     service = VendorService(db)
-    return await service.list_vendors(
+    vendors = await service.list_vendors(
         page=page,
         page_size=page_size,
         tier=tier,
@@ -43,23 +49,64 @@ async def list_vendors(
         status=status_filter,
         search=search,
     )
+    return ModelResponse(vendors)
+
+
+@router.get("/recent", response_model=VendorCursorResponse)
+async def list_recent_vendors(
+    cursor: str | None = Query(None, description="next_cursor of the previous page"),
+    page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    tier: int | None = Query(None, ge=1, le=3, description="Filter by tier"),
+    industry: str | None = Query(None, description="Filter by industry"),
+    grade: Literal["A", "B", "C", "D", "E", "F"] | None = Query(
+        None, description="Filter by grade"
+    ),
+    status_filter: Literal["active", "inactive", "under_review"] | None = Query(
+        None, alias="status"
+    ),
+    search: str | None = Query(None, description="Search by name or domain"),
+    db: AsyncSession = Depends(get_db),
+    _current_user: object = Depends(get_current_user),
+) -> ModelResponse:
+    """List vendors newest first with keyset (cursor) pagination.
+
+    Unlike the page-numbered listing, deep pages cost no more than the first.
+    """
+    service = VendorService(db)
+    try:
+        vendors = await service.list_recent_vendors(
+            cursor=cursor,
+            page_size=page_size,
+            tier=tier,
+            industry=industry,
+            grade=grade,
+            status=status_filter,
+            search=search,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid pagination cursor",
+        )
+    return ModelResponse(vendors)
 
 
 @router.get("/{vendor_id}", response_model=VendorResponse)
 async def get_vendor(
-    vendor_id: str,
+    vendor_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
-) -> VendorResponse:
+) -> ModelResponse:
     """Get a single vendor by ID."""
     service = VendorService(db)
     try:
-        return await service.get_vendor(vendor_id)
+        vendor = await service.get_vendor(vendor_id)
     except VendorNotFoundError:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vendor not found: {vendor_id}",
         )
+    return ModelResponse(vendor)
 
 
 @router.post("/", response_model=VendorResponse, status_code=status.HTTP_201_CREATED)
@@ -81,7 +128,7 @@ async def create_vendor(
 
 @router.patch("/{vendor_id}", response_model=VendorResponse)
 async def update_vendor(
-    vendor_id: str,
+    vendor_id: UUIDStr,
     vendor: VendorUpdate,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(require_role("admin", "rssi", "analyste_ssi")),
@@ -99,7 +146,7 @@ async def update_vendor(
 
 @router.delete("/{vendor_id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_vendor(
-    vendor_id: str,
+    vendor_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(require_role("admin")),
 ) -> None:
@@ -116,15 +163,13 @@ async def delete_vendor(
 
 @router.post("/{vendor_id}/rescan", status_code=status.HTTP_202_ACCEPTED)
 async def rescan_vendor(
-    vendor_id: str,
+    vendor_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(require_role("admin", "rssi", "analyste_ssi")),
 ) -> dict:
     """Trigger a rescan for a specific vendor."""
     service = VendorService(db)
-    try:
-        await service.get_vendor(vendor_id)
-    except VendorNotFoundError:
+    if not await service.vendor_exists(vendor_id):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Vendor not found: {vendor_id}",
@@ -4,6 +4,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.deps import get_current_user, get_db, require_role
+from app.schemas.common import UUIDStr
 from app.schemas.vrm import (
     DisputeCreate,
     DisputeResponse,
@@ -42,7 +43,7 @@ async def onboard_vendor(
     status_code=status.HTTP_201_CREATED,
 )
 async def create_dispute(
-    vendor_id: str,
+    vendor_id: UUIDStr,
     data: DisputeCreate,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
@@ -60,7 +61,7 @@ async def create_dispute(
 
 @router.get("/disputes", response_model=list[DisputeResponse])
 async def list_disputes(
-    vendor_id: str | None = Query(None, description="Filter by vendor ID"),
+    vendor_id: UUIDStr | None = Query(None, description="Filter by vendor ID"),
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
 ) -> list[DisputeResponse]:
@@ -71,7 +72,7 @@ async def list_disputes(
 
 @router.put("/disputes/{dispute_id}", response_model=DisputeResponse)
 async def resolve_dispute(
-    dispute_id: str,
+    dispute_id: UUIDStr,
     data: DisputeUpdate,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(require_role("admin", "rssi", "analyste_ssi")),
@@ -93,7 +94,7 @@ async def resolve_dispute(
     status_code=status.HTTP_201_CREATED,
 )
 async def create_remediation(
-    vendor_id: str,
+    vendor_id: UUIDStr,
     data: RemediationCreate,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(require_role("admin", "rssi", "analyste_ssi")),
@@ -111,7 +112,7 @@ async def create_remediation(
 
 @router.get("/vendors/{vendor_id}/remediation", response_model=list[RemediationResponse])
 async def list_remediations(
-    vendor_id: str,
+    vendor_id: UUIDStr,
     db: AsyncSession = Depends(get_db),
     _current_user: object = Depends(get_current_user),
 ) -> list[RemediationResponse]:
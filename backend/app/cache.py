@@ -0,0 +1,58 @@
+"""Shared Redis cache for pre-serialized API responses.
+
+Values are stored as the JSON bytes sent to clients, so a cache hit costs one
+Redis round trip and no database query or serialization. The cache is best
+effort: when Redis is unreachable, values are computed on every call.
+"""
+
+import logging
+from collections.abc import Awaitable, Callable
+
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from app.config import settings
+
+logger = logging.getLogger("cyberscore.cache")
+
+# Short timeouts: a slow cache must not be slower than computing the value
+redis_client = Redis.from_url(
+    settings.redis_url, socket_connect_timeout=0.5, socket_timeout=0.5
+)
+
+
+async def get_or_set(
+    key: str, ttl: int, producer: Callable[[], Awaitable[bytes]]
+) -> bytes:
+    """Return the cached bytes under ``key``, computing and storing them on a miss.
+
+    Args:
+        key: Cache key.
+        ttl: Time to live of a stored value, in seconds.
+        producer: Coroutine function computing the value on a miss.
+
+    Returns:
+        The cached or freshly computed value.
+    """
+    try:
+        cached = await redis_client.get(key)
+    except RedisError as exc:
+        logger.debug("Cache read failed for %s: %s", key, exc)
+        return await producer()
+    if cached is not None:
+        return cached
+
+    value = await producer()
+    try:
+        await redis_client.set(key, value, ex=ttl)
+    except RedisError as exc:
+        logger.debug("Cache write failed for %s: %s", key, exc)
+    return value
+
+
+async def invalidate(*keys: str) -> None:
+    """Delete ``keys`` from the cache; errors are logged and ignored."""
+    try:
+        await redis_client.delete(*keys)
+    except RedisError as exc:
+        logger.warning("Cache invalidation failed for %s: %s", ", ".join(keys), exc)
@@ -1,20 +1,37 @@
 """FastAPI application factory for CyberScore."""
 
+import asyncio
+import contextlib
 from contextlib import asynccontextmanager
 from collections.abc import AsyncGenerator
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
+from app.api.responses import FastJSONResponse
 from app.config import settings
 from app.database import init_db
+from app.services.compliance_dashboard_service import refresh_compliance_dashboard_periodically
+from app.services.llm_config_service import listen_for_llm_config_changes
+from app.services.smart_answer_service import run_smart_answer_batcher
 
 
 @asynccontextmanager
 async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
-    """Application lifespan: initialize DB on startup."""
+    """Application lifespan: initialize DB and start the background tasks."""
     await init_db()
+    tasks = [
+        asyncio.create_task(listen_for_llm_config_changes()),
+        asyncio.create_task(refresh_compliance_dashboard_periodically()),
+        asyncio.create_task(run_smart_answer_batcher()),
+    ]
     yield
+    for task in tasks:
+        task.cancel()
+    for task in tasks:
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
 
 
 def create_app() -> FastAPI:
@@ -30,6 +47,7 @@ def create_app() -> FastAPI:
         docs_url="/api/docs" if settings.debug else None,
         redoc_url="/api/redoc" if settings.debug else None,
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
     )
 
     app.add_middleware(
@@ -39,6 +57,8 @@ def create_app() -> FastAPI:
         allow_methods=["*"],
         allow_headers=["*"],
     )
+    # Score/finding lists are highly repetitive JSON and compress 5-10x
+    app.add_middleware(GZipMiddleware, minimum_size=512)
 
     # Import router here to avoid circular imports
     from app.api.v1 import router as api_v1_router
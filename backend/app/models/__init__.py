@@ -2,6 +2,7 @@
 
 from app.models.alert import Alert
 from app.models.audit import AuditLog
+from app.models.compliance_dashboard import ComplianceDashboardMV
 from app.models.dispute import Dispute
 from app.models.dora_register import DORARegisterEntry
 from app.models.grc import FrameworkMapping, MaturityAssessment, SecurityControl
@@ -19,6 +20,7 @@ __all__ = [
     "Alert",
     "Answer",
     "AuditLog",
+    "ComplianceDashboardMV",
     "Dispute",
     "DORARegisterEntry",
     "Finding",
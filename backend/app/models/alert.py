@@ -1,9 +1,8 @@
 """Alert ORM model."""
 
 from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, String, Text, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
@@ -15,10 +14,10 @@ class Alert(Base):
     __tablename__ = "alerts"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     vendor_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("vendors.id", ondelete="CASCADE"), index=True
+        Uuid(as_uuid=False), ForeignKey("vendors.id", ondelete="CASCADE"), index=True
     )
     alert_type: Mapped[str] = mapped_column(
         String(50), index=True,
@@ -28,7 +27,7 @@ class Alert(Base):
         String(20), index=True,
         comment="critical | high | medium | low | info",
     )
-    title: Mapped[str] = mapped_column(String(500))
+    title: Mapped[str] = mapped_column(Text)
     description: Mapped[str | None] = mapped_column(Text)
     is_read: Mapped[bool] = mapped_column(default=False)
     is_resolved: Mapped[bool] = mapped_column(default=False)
@@ -2,32 +2,63 @@
 
 from datetime import datetime
 
-from sqlalchemy import DateTime, String, func
-from sqlalchemy.dialects.postgresql import JSON
+from sqlalchemy import DateTime, Index, String, Text, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.models.ddl import attach_default_partition
 
 
 class AuditLog(Base):
     """Immutable audit trail for compliance (DORA, RGPD)."""
 
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        # Dashboard filter `user_id = ? AND timestamp > ? ORDER BY timestamp DESC`
+        # is served as an index-only scan; it also covers plain user_id lookups.
+        Index(
+            "ix_audit_user_ts", "user_id", "timestamp",
+            postgresql_include=["action", "resource_type"],
+        ),
+        # Compliance queries filter with `details @> '{"key": value}'`; the
+        # nested `details -> 'target'` expression index is created by migration.
+        Index(
+            "ix_audit_details_gin", "details",
+            postgresql_using="gin",
+            postgresql_ops={"details": "jsonb_path_ops"},
+        ),
+        # Append-only and time-correlated: one BRIN summary per 32 pages
+        # replaces a B-tree entry per row for time-range scans
+        Index(
+            "brin_audit_ts", "timestamp",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # Monthly partitions; the partition key has to be part of the primary key
+        {"postgresql_partition_by": "RANGE (timestamp)"},
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     timestamp: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), index=True
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
     )
-    user_id: Mapped[str] = mapped_column(String(36), index=True)
+    user_id: Mapped[str] = mapped_column(String(36))
     action: Mapped[str] = mapped_column(String(100), index=True)
     resource_type: Mapped[str] = mapped_column(String(100))
     resource_id: Mapped[str] = mapped_column(String(36))
-    details: Mapped[dict | None] = mapped_column(JSON, default=dict)
+    details: Mapped[dict | None] = mapped_column(JSONB, default=dict)
     ip_address: Mapped[str | None] = mapped_column(String(45))
-    user_agent: Mapped[str | None] = mapped_column(String(500))
+    user_agent: Mapped[str | None] = mapped_column(Text)
+
+    # Rows are still identified by id alone on the ORM side
+    __mapper_args__ = {"primary_key": [id]}
 
     def __repr__(self) -> str:
         return (
             f"<AuditLog(id={self.id}, user_id={self.user_id!r}, "
             f"action={self.action!r}, resource={self.resource_type!r}/{self.resource_id!r})>"
         )
+
+
+attach_default_partition(AuditLog.__table__)
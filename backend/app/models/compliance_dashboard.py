@@ -0,0 +1,67 @@
+"""Read-only ORM model for the compliance_dashboard materialized view."""
+
+from sqlalchemy import Column, Float, Integer, MetaData, String, Table
+from sqlalchemy.orm import Mapped
+
+from app.database import Base
+from app.models.ddl import create_materialized_view
+
+# Per (framework, domain): control status counts from the framework mappings
+# and the average maturity level of the mapped controls.
+COMPLIANCE_DASHBOARD_QUERY = """
+SELECT fm.framework,
+       sc.domain,
+       count(*) AS total_controls,
+       count(*) FILTER (WHERE sc.status = 'implemented') AS implemented,
+       count(*) FILTER (WHERE sc.status = 'partial') AS partial,
+       count(*) FILTER (WHERE sc.status = 'not_implemented') AS not_implemented,
+       avg(ma.level)::float8 AS avg_maturity
+FROM security_controls AS sc
+JOIN framework_mappings AS fm ON fm.control_id = sc.id
+LEFT JOIN (
+    SELECT control_id, avg(level) AS level
+    FROM maturity_assessments
+    GROUP BY control_id
+) AS ma ON ma.control_id = sc.id
+GROUP BY fm.framework, sc.domain
+"""
+
+# Kept off Base.metadata so create_all() does not create it as a table
+_view_metadata = MetaData()
+
+
+class ComplianceDashboardMV(Base):
+    """Pre-aggregated GRC coverage per framework and domain.
+
+    Refreshed in the background by the compliance dashboard service; never
+    add or modify instances.
+    """
+
+    __table__ = Table(
+        "compliance_dashboard",
+        _view_metadata,
+        Column("framework", String(20), primary_key=True),
+        Column("domain", String(100), primary_key=True),
+        Column("total_controls", Integer),
+        Column("implemented", Integer),
+        Column("partial", Integer),
+        Column("not_implemented", Integer),
+        Column("avg_maturity", Float, comment="Average maturity level 1-5, NULL if unassessed"),
+    )
+
+    framework: Mapped[str]
+    domain: Mapped[str]
+    total_controls: Mapped[int]
+    implemented: Mapped[int]
+    partial: Mapped[int]
+    not_implemented: Mapped[int]
+    avg_maturity: Mapped[float | None]
+
+    def __repr__(self) -> str:
+        return (
+            f"<ComplianceDashboardMV(framework={self.framework!r}, "
+            f"domain={self.domain!r}, implemented={self.implemented})>"
+        )
+
+
+create_materialized_view(Base.metadata, ComplianceDashboardMV.__table__, COMPLIANCE_DASHBOARD_QUERY)
@@ -0,0 +1,157 @@
+"""DDL hooks for PostgreSQL table features not covered by ``Table`` options."""
+
+from sqlalchemy import DDL, MetaData, Table, event
+
+
+def attach_default_partition(table: Table) -> None:
+    """Create a DEFAULT partition whenever ``table`` is built by ``create_all``.
+
+    ``init_db()`` creates partitioned parents without any partition, which
+    would reject every insert. Monthly partitions are created by the Alembic
+    migrations and the scheduled ``create_monthly_partitions()`` job; the
+    default partition only catches rows outside those ranges.
+    """
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            f"CREATE TABLE IF NOT EXISTS {table.name}_default "
+            f"PARTITION OF {table.name} DEFAULT"
+        ).execute_if(dialect="postgresql"),
+    )
+
+
+def set_fillfactor(table: Table, fillfactor: int) -> None:
+    """Leave free space on heap pages of a frequently updated table.
+
+    The spare room lets PostgreSQL keep updated row versions on the same page
+    (HOT updates), which skips index maintenance when no indexed column
+    changed.
+    """
+    event.listen(
+        table,
+        "after_create",
+        DDL(f"ALTER TABLE {table.name} SET (fillfactor = {fillfactor})").execute_if(
+            dialect="postgresql"
+        ),
+    )
+
+
+def set_compression(table: Table, column: str, method: str) -> None:
+    """Compress large out-of-line (TOAST) values of ``column`` with ``method``.
+
+    ``lz4`` (PostgreSQL 14+) compresses and decompresses several times faster
+    than the default ``pglz`` at a similar ratio.
+    """
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            f"ALTER TABLE {table.name} ALTER COLUMN {column} SET COMPRESSION {method}"
+        ).execute_if(dialect="postgresql"),
+    )
+
+
+def set_updated_at_trigger(table: Table) -> None:
+    """Maintain ``updated_at`` with the ``moddatetime`` trigger on UPDATE.
+
+    The column is mapped with ``server_onupdate=FetchedValue()`` so the ORM
+    neither renders ``updated_at = now()`` into its UPDATEs nor sets it.
+    """
+    event.listen(
+        table,
+        "after_create",
+        DDL("CREATE EXTENSION IF NOT EXISTS moddatetime").execute_if(dialect="postgresql"),
+    )
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            f"CREATE TRIGGER set_updated_at BEFORE UPDATE ON {table.name} "
+            "FOR EACH ROW EXECUTE FUNCTION moddatetime(updated_at)"
+        ).execute_if(dialect="postgresql"),
+    )
+
+
+def notify_on_change(table: Table, channel: str) -> None:
+    """Send ``pg_notify(channel)`` after every INSERT, UPDATE or DELETE on ``table``."""
+    function = f"notify_{channel}"
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            f"CREATE OR REPLACE FUNCTION {function}() RETURNS trigger "
+            f"LANGUAGE plpgsql AS $$ BEGIN PERFORM pg_notify('{channel}', ''); "
+            "RETURN NULL; END $$"
+        ).execute_if(dialect="postgresql"),
+    )
+    event.listen(
+        table,
+        "after_create",
+        DDL(
+            f"CREATE TRIGGER {channel} AFTER INSERT OR UPDATE OR DELETE "
+            f"ON {table.name} FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+        ).execute_if(dialect="postgresql"),
+    )
+
+
+def create_materialized_view(metadata: MetaData, view: Table, query: str) -> None:
+    """Build the materialized ``view`` as ``query`` alongside ``metadata``'s tables.
+
+    ``view`` must belong to a separate ``MetaData`` so that ``create_all``
+    does not emit it as a table. The unique index on its primary key columns
+    is what allows ``REFRESH MATERIALIZED VIEW CONCURRENTLY``.
+    """
+    columns = ", ".join(column.name for column in view.primary_key)
+    event.listen(
+        metadata,
+        "after_create",
+        DDL(
+            f"CREATE MATERIALIZED VIEW IF NOT EXISTS {view.name} AS {query} WITH DATA"
+        ).execute_if(dialect="postgresql"),
+    )
+    event.listen(
+        metadata,
+        "after_create",
+        DDL(
+            f"CREATE UNIQUE INDEX IF NOT EXISTS uniq_{view.name} ON {view.name} ({columns})"
+        ).execute_if(dialect="postgresql"),
+    )
+    event.listen(
+        metadata,
+        "before_drop",
+        DDL(f"DROP MATERIALIZED VIEW IF EXISTS {view.name}").execute_if(dialect="postgresql"),
+    )
+
+
+# UUIDv7 (RFC 9562): a 48-bit millisecond timestamp prefix over the random bits
+# of gen_random_uuid(), with the version nibble turned from 4 into 7.
+# PostgreSQL 18 ships a built-in uuidv7() that takes precedence over this one.
+UUIDV7_FUNCTION = """
+CREATE OR REPLACE FUNCTION uuidv7() RETURNS uuid LANGUAGE sql VOLATILE AS $$
+    SELECT encode(
+        set_bit(set_bit(
+            overlay(uuid_send(gen_random_uuid()) PLACING substring(
+                int8send(floor(extract(epoch FROM clock_timestamp()) * 1000)::bigint)
+                FROM 3
+            ) FROM 1 FOR 6),
+            52, 1), 53, 1),
+        'hex')::uuid
+$$
+"""
+
+
+def create_uuidv7_function(metadata: MetaData) -> None:
+    """Create ``uuidv7()`` before ``create_all`` builds tables defaulting to it."""
+    event.listen(
+        metadata, "before_create", DDL(UUIDV7_FUNCTION).execute_if(dialect="postgresql")
+    )
+
+
+def create_extension(metadata: MetaData, name: str) -> None:
+    """Install the extension ``name`` before ``create_all`` builds tables using its types."""
+    event.listen(
+        metadata,
+        "before_create",
+        DDL(f"CREATE EXTENSION IF NOT EXISTS {name}").execute_if(dialect="postgresql"),
+    )
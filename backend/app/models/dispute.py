@@ -1,9 +1,8 @@
 """Dispute ORM model for vendor finding disputes."""
 
 from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, Uuid, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -13,19 +12,26 @@ class Dispute(Base):
     """Vendor dispute against a security finding."""
 
     __tablename__ = "disputes"
+    __table_args__ = (
+        # Almost every status query targets open disputes: index only those rows
+        Index(
+            "ix_disputes_open", "sla_deadline",
+            postgresql_where=text("status IN ('open', 'in_review')"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     vendor_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("vendors.id", ondelete="CASCADE"), index=True
+        Uuid(as_uuid=False), ForeignKey("vendors.id", ondelete="CASCADE"), index=True
     )
     finding_id: Mapped[str] = mapped_column(String(36), index=True)
     status: Mapped[str] = mapped_column(
-        String(20), default="open", index=True,
+        String(20), default="open",
         comment="open | in_review | resolved | rejected",
     )
-    evidence_url: Mapped[str | None] = mapped_column(String(500))
+    evidence_url: Mapped[str | None] = mapped_column(Text)
     requester_email: Mapped[str] = mapped_column(String(255), nullable=False)
     admin_notes: Mapped[str | None] = mapped_column(Text)
     sla_deadline: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
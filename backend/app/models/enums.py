@@ -0,0 +1,71 @@
+"""Enumerated column values stored as native PostgreSQL enum types.
+
+An enum value takes 4 bytes on disk and compares as an integer (its position
+in the type), instead of a variable-length string compare. The database
+labels are the lowercase ``.value`` of each member, so existing rows cast
+directly and plain string filters such as ``Vendor.status == "active"`` keep
+working. ``StrEnum`` members are ``str`` instances, so they serialize into
+responses as their value.
+"""
+
+from enum import StrEnum
+
+from sqlalchemy import Enum
+
+from app.database import Base
+
+
+class VendorStatus(StrEnum):
+    """Lifecycle status of a vendor."""
+
+    ACTIVE = "active"
+    INACTIVE = "inactive"
+    UNDER_REVIEW = "under_review"
+
+
+class Severity(StrEnum):
+    """Severity of an external or internal finding."""
+
+    CRITICAL = "critical"
+    HIGH = "high"
+    MEDIUM = "medium"
+    LOW = "low"
+    INFO = "info"
+
+
+class Priority(StrEnum):
+    """Priority of a remediation plan item."""
+
+    CRITICAL = "critical"
+    HIGH = "high"
+    MEDIUM = "medium"
+    LOW = "low"
+
+
+class RiskLevel(StrEnum):
+    """Risk level of a supply chain concentration."""
+
+    LOW = "low"
+    MEDIUM = "medium"
+    HIGH = "high"
+    CRITICAL = "critical"
+
+
+def pg_enum(enum_class: type[StrEnum], name: str) -> Enum:
+    """Map ``enum_class`` to the native enum type ``name``, labelled by value.
+
+    The type belongs to the shared metadata, so it is created once even when
+    several tables use it.
+    """
+    return Enum(
+        enum_class,
+        name=name,
+        metadata=Base.metadata,
+        values_callable=lambda members: [member.value for member in members],
+    )
+
+
+VENDOR_STATUS = pg_enum(VendorStatus, "vendor_status")
+SEVERITY = pg_enum(Severity, "severity")
+PRIORITY = pg_enum(Priority, "priority")
+RISK_LEVEL = pg_enum(RiskLevel, "risk_level")
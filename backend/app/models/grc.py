@@ -1,37 +1,41 @@
 """GRC ORM models: SecurityControl, FrameworkMapping, MaturityAssessment."""
 
 from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.models.ddl import set_fillfactor
 
 
 class SecurityControl(Base):
     """A security control tracked for GRC/PSSI compliance."""
 
     __tablename__ = "security_controls"
+    __table_args__ = (
+        # Serves the domain and domain + status filters of the control listing
+        Index("ix_security_controls_domain_status", "domain", "status"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     reference: Mapped[str] = mapped_column(
         String(50), unique=True, comment="Control reference code (e.g. CTL-001)"
     )
-    title: Mapped[str] = mapped_column(String(500))
+    title: Mapped[str] = mapped_column(Text)
     description: Mapped[str | None] = mapped_column(Text)
     domain: Mapped[str] = mapped_column(
-        String(100), index=True,
+        String(100),
         comment="Control domain (e.g. access_control, network_security)",
     )
     status: Mapped[str] = mapped_column(
-        String(20), default="not_implemented", index=True,
+        String(20), default="not_implemented",
         comment="implemented | partial | not_implemented",
     )
     owner: Mapped[str | None] = mapped_column(String(200))
-    evidence_url: Mapped[str | None] = mapped_column(String(1000))
+    evidence_url: Mapped[str | None] = mapped_column(Text)
     last_assessed: Mapped[datetime | None] = mapped_column(
         DateTime(timezone=True)
     )
@@ -55,15 +59,20 @@ class FrameworkMapping(Base):
     """Maps a security control to a regulatory framework requirement."""
 
     __tablename__ = "framework_mappings"
+    __table_args__ = (
+        # Controls mapped to a framework, read from the index alone; the
+        # coverage and heatmap view refresh joins through it
+        Index("ix_framework_mappings_framework_control", "framework", "control_id"),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     control_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("security_controls.id", ondelete="CASCADE"), index=True
+        Uuid(as_uuid=False), ForeignKey("security_controls.id", ondelete="CASCADE"), index=True
     )
     framework: Mapped[str] = mapped_column(
-        String(20), index=True,
+        String(20),
         comment="iso27001 | dora | nis2 | hds | rgpd",
     )
     framework_ref: Mapped[str] = mapped_column(
@@ -89,10 +98,10 @@ class MaturityAssessment(Base):
     __tablename__ = "maturity_assessments"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     control_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("security_controls.id", ondelete="CASCADE"), index=True
+        Uuid(as_uuid=False), ForeignKey("security_controls.id", ondelete="CASCADE"), index=True
     )
     level: Mapped[int] = mapped_column(
         Integer, comment="Maturity level 1-5 (CMMI)"
@@ -114,3 +123,6 @@ class MaturityAssessment(Base):
             f"<MaturityAssessment(control_id={self.control_id!r}, "
             f"level={self.level})>"
         )
+
+
+set_fillfactor(SecurityControl.__table__, 70)
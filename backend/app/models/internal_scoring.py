@@ -1,29 +1,48 @@
 """Internal Scoring ORM models: InternalScan and InternalFinding."""
 
 from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, Integer, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, Integer, String, Text, Uuid, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.models.ddl import attach_default_partition, set_compression, set_fillfactor
+from app.models.enums import SEVERITY, Severity
 
 
 class InternalScan(Base):
     """An internal infrastructure scan (AD, M365, or GRC assessment)."""
 
     __tablename__ = "internal_scans"
+    __table_args__ = (
+        # Covers `scan_type = ? ORDER BY created_at DESC` history queries
+        Index(
+            "ix_scan_type_created", "scan_type", "created_at",
+            postgresql_include=["score", "grade"],
+        ),
+        Index(
+            "ix_internal_scans_scan_data_gin", "scan_data",
+            postgresql_using="gin",
+            postgresql_ops={"scan_data": "jsonb_path_ops"},
+        ),
+        # created_at follows insertion order, so a BRIN summary is enough
+        Index(
+            "brin_internal_scans_created", "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     scan_type: Mapped[str] = mapped_column(
-        String(10), index=True,
+        String(10),
         comment="ad | m365 | grc",
     )
     target: Mapped[str] = mapped_column(
-        String(500), comment="Domain controller, tenant ID, or GRC scope"
+        Text, comment="Domain controller, tenant ID, or GRC scope"
     )
     score: Mapped[int] = mapped_column(
         Integer, default=0, comment="Score 0-1000"
@@ -36,7 +55,7 @@ class InternalScan(Base):
         JSONB, default=dict, comment="Full scan results JSON"
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), index=True
+        DateTime(timezone=True), server_default=func.now()
     )
 
     # Relationships
@@ -55,37 +74,56 @@ class InternalFinding(Base):
     """Individual finding from an internal scan."""
 
     __tablename__ = "internal_findings"
+    __table_args__ = (
+        # Open findings are the hot set; resolved rows would only bloat the index
+        Index(
+            "ix_internal_findings_open", "severity",
+            postgresql_where=text("status = 'open'"),
+        ),
+        # Serves the scan_id FK; severity/category filters within a scan are
+        # checked on index entries and per-scan counts skip the heap
+        Index(
+            "ix_internal_findings_scan_covering", "scan_id",
+            postgresql_include=["severity", "status", "category"],
+        ),
+        # Monthly partitions; the partition key has to be part of the primary key
+        {"postgresql_partition_by": "RANGE (detected_at)"},
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     scan_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("internal_scans.id", ondelete="CASCADE"), index=True
+        Uuid(as_uuid=False), ForeignKey("internal_scans.id", ondelete="CASCADE")
     )
     category: Mapped[str] = mapped_column(
         String(100), index=True,
         comment="Finding category (e.g. privileged_accounts, gpo_security)",
     )
-    title: Mapped[str] = mapped_column(String(500))
+    title: Mapped[str] = mapped_column(Text)
     description: Mapped[str | None] = mapped_column(Text)
-    severity: Mapped[str] = mapped_column(
-        String(20), index=True,
-        comment="critical | high | medium | low | info",
-    )
+    severity: Mapped[Severity] = mapped_column(SEVERITY, index=True)
     recommendation: Mapped[str | None] = mapped_column(Text)
     status: Mapped[str] = mapped_column(
-        String(20), default="open", index=True,
+        String(20), default="open",
         comment="open | resolved",
     )
     detected_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
     )
 
     # Relationships
     scan: Mapped["InternalScan"] = relationship(back_populates="findings")
 
+    __mapper_args__ = {"primary_key": [id]}
+
     def __repr__(self) -> str:
         return (
             f"<InternalFinding(id={self.id!r}, category={self.category!r}, "
             f"severity={self.severity!r}, title={self.title!r})>"
         )
+
+
+attach_default_partition(InternalFinding.__table__)
+set_fillfactor(InternalScan.__table__, 70)
+set_compression(InternalScan.__table__, "scan_data", "lz4")
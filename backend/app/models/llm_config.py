@@ -1,24 +1,32 @@
 """LLM Configuration ORM model."""
 
 from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import Boolean, DateTime, String, Text, func
+from sqlalchemy import Boolean, DateTime, FetchedValue, Index, String, Text, Uuid, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.models.ddl import notify_on_change, set_fillfactor, set_updated_at_trigger
 
 
 class LLMConfig(Base):
     """Stores LLM provider configuration with encrypted API keys.
 
-    Only ONE config should be active at a time (is_active=True).
+    Only ONE config can be active at a time (is_active=True), enforced by
+    the ``uniq_llm_active`` partial unique index.
     """
 
     __tablename__ = "llm_configs"
+    __table_args__ = (
+        Index(
+            "uniq_llm_active", "is_active",
+            unique=True,
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     provider: Mapped[str] = mapped_column(
         String(20),
@@ -29,13 +37,13 @@ class LLMConfig(Base):
     api_key_encrypted: Mapped[str | None] = mapped_column(
         Text, comment="AES-256-GCM encrypted API key"
     )
-    api_base_url: Mapped[str | None] = mapped_column(String(500))
+    api_base_url: Mapped[str | None] = mapped_column(Text)
     is_active: Mapped[bool] = mapped_column(Boolean, default=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     def __repr__(self) -> str:
@@ -43,3 +51,8 @@ class LLMConfig(Base):
             f"<LLMConfig(id={self.id!r}, provider={self.provider!r}, "
             f"model={self.model_name!r}, active={self.is_active})>"
         )
+
+
+set_fillfactor(LLMConfig.__table__, 70)
+set_updated_at_trigger(LLMConfig.__table__)
+notify_on_change(LLMConfig.__table__, "llm_config_changed")
@@ -1,13 +1,13 @@
 """Questionnaire ORM models."""
 
 from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, FetchedValue, ForeignKey, Index, String, Text, Uuid, func
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.models.ddl import set_fillfactor, set_updated_at_trigger
 
 
 class Questionnaire(Base):
@@ -16,7 +16,7 @@ class Questionnaire(Base):
     __tablename__ = "questionnaires"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     title: Mapped[str] = mapped_column(String(255), nullable=False)
     description: Mapped[str | None] = mapped_column(Text)
@@ -29,15 +29,13 @@ class Questionnaire(Base):
         DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
     )
 
-    # Relationships
-    questions: Mapped[list["Question"]] = relationship(
-        back_populates="questionnaire", lazy="selectin",
-    )
+    # Relationships -- loaded explicitly with selectinload() where needed
+    questions: Mapped[list["Question"]] = relationship(back_populates="questionnaire")
     responses: Mapped[list["QuestionnaireResponse"]] = relationship(
-        back_populates="questionnaire", lazy="selectin",
+        back_populates="questionnaire"
     )
 
     def __repr__(self) -> str:
@@ -48,12 +46,19 @@ class Question(Base):
     """Individual question within a questionnaire."""
 
     __tablename__ = "questions"
+    __table_args__ = (
+        Index(
+            "ix_questions_options_gin", "options",
+            postgresql_using="gin",
+            postgresql_ops={"options": "jsonb_path_ops"},
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     questionnaire_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("questionnaires.id", ondelete="CASCADE"), index=True
+        Uuid(as_uuid=False), ForeignKey("questionnaires.id", ondelete="CASCADE"), index=True
     )
     order: Mapped[int] = mapped_column(default=0)
     text: Mapped[str] = mapped_column(Text, nullable=False)
@@ -79,13 +84,13 @@ class QuestionnaireResponse(Base):
     __tablename__ = "questionnaire_responses"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     questionnaire_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("questionnaires.id", ondelete="CASCADE"), index=True
+        Uuid(as_uuid=False), ForeignKey("questionnaires.id", ondelete="CASCADE"), index=True
     )
     vendor_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("vendors.id", ondelete="CASCADE"), index=True
+        Uuid(as_uuid=False), ForeignKey("vendors.id", ondelete="CASCADE"), index=True
     )
     submitted_by: Mapped[str | None] = mapped_column(String(36))
     status: Mapped[str] = mapped_column(
@@ -98,14 +103,12 @@ class QuestionnaireResponse(Base):
         DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     # Relationships
     questionnaire: Mapped["Questionnaire"] = relationship(back_populates="responses")
-    answers: Mapped[list["Answer"]] = relationship(
-        back_populates="response", lazy="selectin",
-    )
+    answers: Mapped[list["Answer"]] = relationship(back_populates="response")
 
     def __repr__(self) -> str:
         return (
@@ -120,16 +123,18 @@ class Answer(Base):
     __tablename__ = "answers"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     response_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("questionnaire_responses.id", ondelete="CASCADE"), index=True
+        Uuid(as_uuid=False),
+        ForeignKey("questionnaire_responses.id", ondelete="CASCADE"),
+        index=True,
     )
     question_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("questions.id", ondelete="CASCADE"), index=True
+        Uuid(as_uuid=False), ForeignKey("questions.id", ondelete="CASCADE"), index=True
     )
     value: Mapped[str | None] = mapped_column(Text)
-    file_path: Mapped[str | None] = mapped_column(String(500))
+    file_path: Mapped[str | None] = mapped_column(Text)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
@@ -139,3 +144,8 @@ class Answer(Base):
 
     def __repr__(self) -> str:
         return f"<Answer(id={self.id!r}, question_id={self.question_id!r})>"
+
+
+set_fillfactor(QuestionnaireResponse.__table__, 70)
+set_updated_at_trigger(Questionnaire.__table__)
+set_updated_at_trigger(QuestionnaireResponse.__table__)
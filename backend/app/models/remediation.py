@@ -1,34 +1,39 @@
 """Remediation plan ORM model."""
 
 from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, FetchedValue, ForeignKey, Index, String, Text, Uuid, func, text
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.models.ddl import set_fillfactor, set_updated_at_trigger
+from app.models.enums import PRIORITY, Priority
 
 
 class Remediation(Base):
     """Remediation plan item for a vendor."""
 
     __tablename__ = "remediations"
+    __table_args__ = (
+        # Almost every status query targets pending work: index only those rows
+        Index(
+            "ix_remediations_open", "deadline",
+            postgresql_where=text("status IN ('pending', 'in_progress')"),
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     vendor_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("vendors.id", ondelete="CASCADE"), index=True
+        Uuid(as_uuid=False), ForeignKey("vendors.id", ondelete="CASCADE"), index=True
     )
-    title: Mapped[str] = mapped_column(String(500), nullable=False)
+    title: Mapped[str] = mapped_column(Text, nullable=False)
     description: Mapped[str] = mapped_column(Text, nullable=False)
-    priority: Mapped[str] = mapped_column(
-        String(20), default="medium", index=True,
-        comment="critical | high | medium | low",
-    )
+    priority: Mapped[Priority] = mapped_column(PRIORITY, default=Priority.MEDIUM, index=True)
     deadline: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
     status: Mapped[str] = mapped_column(
-        String(20), default="pending", index=True,
+        String(20), default="pending",
         comment="pending | in_progress | completed | overdue",
     )
     assigned_to: Mapped[str | None] = mapped_column(String(255))
@@ -36,7 +41,7 @@ class Remediation(Base):
         DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     def __repr__(self) -> str:
@@ -44,3 +49,7 @@ class Remediation(Base):
             f"<Remediation(id={self.id!r}, vendor_id={self.vendor_id!r}, "
             f"priority={self.priority!r}, status={self.status!r})>"
         )
+
+
+set_fillfactor(Remediation.__table__, 70)
+set_updated_at_trigger(Remediation.__table__)
@@ -1,9 +1,8 @@
 """Report ORM model."""
 
 from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import BigInteger, DateTime, ForeignKey, String, func
+from sqlalchemy import BigInteger, DateTime, ForeignKey, Index, String, Text, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -13,9 +12,17 @@ class Report(Base):
     """Generated report (PDF, PPTX, XLSX)."""
 
     __tablename__ = "reports"
+    __table_args__ = (
+        # Reports are append-only; keeps created_at range filters cheap
+        Index(
+            "brin_reports_created", "created_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     report_type: Mapped[str] = mapped_column(
         String(20), index=True,
@@ -25,10 +32,10 @@ class Report(Base):
         String(10), comment="pdf | pptx | xlsx",
     )
     vendor_id: Mapped[str | None] = mapped_column(
-        String(36), ForeignKey("vendors.id", ondelete="SET NULL"), index=True
+        Uuid(as_uuid=False), ForeignKey("vendors.id", ondelete="SET NULL"), index=True
     )
     generated_by: Mapped[str] = mapped_column(String(36), comment="User ID who requested")
-    file_path: Mapped[str] = mapped_column(String(500))
+    file_path: Mapped[str] = mapped_column(Text)
     file_size: Mapped[int | None] = mapped_column(BigInteger)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
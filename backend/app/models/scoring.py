@@ -1,25 +1,60 @@
 """Scoring ORM models: VendorScore and Finding."""
 
 from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import DateTime, Float, ForeignKey, String, Text, func
+from sqlalchemy import (
+    Connection,
+    DateTime,
+    FetchedValue,
+    Float,
+    ForeignKey,
+    Index,
+    String,
+    Text,
+    Uuid,
+    desc,
+    event,
+    func,
+    inspect,
+    or_,
+    text,
+    update,
+)
 from sqlalchemy.dialects.postgresql import JSONB
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, Mapper, mapped_column, relationship
 
 from app.database import Base
+from app.models.ddl import attach_default_partition, set_updated_at_trigger
+from app.models.enums import SEVERITY, Severity
+from app.models.vendor import Vendor
 
 
 class VendorScore(Base):
     """Aggregated vendor cyber score at a point in time."""
 
     __tablename__ = "vendor_scores"
+    __table_args__ = (
+        Index(
+            "ix_vendor_scores_domain_scores_gin", "domain_scores",
+            postgresql_using="gin",
+            postgresql_ops={"domain_scores": "jsonb_path_ops"},
+        ),
+        # Time-range scans over the append-only score history
+        Index(
+            "brin_vendor_scores_scanned", "scanned_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32},
+        ),
+        # A vendor's newest-first history is a range of this index, and its
+        # latest score the first entry of that range
+        Index("ix_vendor_scores_vendor_scanned", "vendor_id", desc("scanned_at")),
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     vendor_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("vendors.id", ondelete="CASCADE"), index=True
+        Uuid(as_uuid=False), ForeignKey("vendors.id", ondelete="CASCADE")
     )
     global_score: Mapped[int] = mapped_column(
         comment="Global score 0-1000"
@@ -32,11 +67,11 @@ class VendorScore(Base):
     )
     scan_id: Mapped[str | None] = mapped_column(String(36))
     scanned_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), index=True
+        DateTime(timezone=True), server_default=func.now()
     )
 
     # Relationships
-    vendor: Mapped["Vendor"] = relationship(back_populates="scores")  # noqa: F821
+    vendor: Mapped["Vendor"] = relationship(back_populates="scores")
 
     def __repr__(self) -> str:
         return (
@@ -45,47 +80,91 @@ class VendorScore(Base):
         )
 
 
+@event.listens_for(VendorScore, "after_insert")
+def _sync_vendor_latest_score(
+    _mapper: Mapper[VendorScore], connection: Connection, target: VendorScore
+) -> None:
+    """Copy a newly inserted score onto its vendor within the same flush.
+
+    The guard on ``latest_scored_at`` keeps an out-of-order backfill from
+    overwriting a newer score.
+    """
+    # Read the loaded state directly: a lazy load is not allowed mid-flush
+    scanned_at = inspect(target).dict.get("scanned_at") or func.now()
+    vendors = Vendor.__table__
+    connection.execute(
+        update(vendors)
+        .where(
+            vendors.c.id == target.vendor_id,
+            or_(
+                vendors.c.latest_scored_at.is_(None),
+                vendors.c.latest_scored_at <= scanned_at,
+            ),
+        )
+        .values(
+            latest_score=target.global_score,
+            latest_grade=target.grade,
+            latest_scored_at=scanned_at,
+        )
+    )
+
+
 class Finding(Base):
     """Individual security finding from an OSINT scan."""
 
     __tablename__ = "findings"
+    __table_args__ = (
+        # Open findings are the hot set; resolved rows would only bloat the index
+        Index("ix_findings_open", "severity", postgresql_where=text("status = 'open'")),
+        # Per-vendor lookups stay on small per-partition B-trees; the INCLUDE
+        # columns answer the findings ETag probe without touching the heap
+        Index(
+            "ix_findings_vendor_status", "vendor_id", "status",
+            postgresql_include=["severity", "domain", "updated_at"],
+        ),
+        # Monthly partitions; the partition key has to be part of the primary key
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     vendor_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("vendors.id", ondelete="CASCADE"), index=True
+        Uuid(as_uuid=False), ForeignKey("vendors.id", ondelete="CASCADE")
     )
     scan_id: Mapped[str | None] = mapped_column(String(36), index=True)
     domain: Mapped[str] = mapped_column(
         String(10), comment="Scoring domain D1-D8"
     )
-    title: Mapped[str] = mapped_column(String(500))
+    title: Mapped[str] = mapped_column(Text)
     description: Mapped[str | None] = mapped_column(Text)
-    severity: Mapped[str] = mapped_column(
-        String(20), index=True,
-        comment="critical | high | medium | low | info",
-    )
+    severity: Mapped[Severity] = mapped_column(SEVERITY, index=True)
     cvss_score: Mapped[float | None] = mapped_column(Float)
     source: Mapped[str | None] = mapped_column(String(100))
     evidence: Mapped[str | None] = mapped_column(Text)
     recommendation: Mapped[str | None] = mapped_column(Text)
     status: Mapped[str] = mapped_column(
-        String(20), default="open", index=True,
+        String(20), default="open",
         comment="open | acknowledged | disputed | resolved | false_positive",
     )
     created_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now()
+        DateTime(timezone=True), primary_key=True, server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
     )
 
     # Relationships
-    vendor: Mapped["Vendor"] = relationship(back_populates="findings")  # noqa: F821
+    vendor: Mapped["Vendor"] = relationship(back_populates="findings")
+
+    __mapper_args__ = {"primary_key": [id]}
 
     def __repr__(self) -> str:
         return (
             f"<Finding(id={self.id!r}, domain={self.domain!r}, "
             f"severity={self.severity!r}, title={self.title!r})>"
         )
+
+
+attach_default_partition(Finding.__table__)
+set_updated_at_trigger(Finding.__table__)
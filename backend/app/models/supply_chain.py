@@ -1,12 +1,12 @@
 """Supply Chain ORM models for Nth-party dependency tracking."""
 
 from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import DateTime, Float, ForeignKey, Index, String, func
+from sqlalchemy import DateTime, Float, ForeignKey, Index, String, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
+from app.models.enums import RISK_LEVEL, RiskLevel
 
 
 class VendorDependency(Base):
@@ -18,10 +18,10 @@ class VendorDependency(Base):
     )
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     vendor_id: Mapped[str] = mapped_column(
-        String(36), ForeignKey("vendors.id", ondelete="CASCADE"), index=True
+        Uuid(as_uuid=False), ForeignKey("vendors.id", ondelete="CASCADE"), index=True
     )
     provider_name: Mapped[str] = mapped_column(
         String(255), nullable=False, index=True
@@ -51,7 +51,7 @@ class ConcentrationAlert(Base):
     __tablename__ = "concentration_alerts"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     provider_name: Mapped[str] = mapped_column(
         String(255), nullable=False, index=True
@@ -62,10 +62,7 @@ class ConcentrationAlert(Base):
     percentage: Mapped[float] = mapped_column(
         Float, nullable=False, comment="Concentration percentage 0.0-1.0"
     )
-    risk_level: Mapped[str] = mapped_column(
-        String(20), nullable=False,
-        comment="low | medium | high | critical",
-    )
+    risk_level: Mapped[RiskLevel] = mapped_column(RISK_LEVEL, nullable=False)
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
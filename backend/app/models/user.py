@@ -1,9 +1,8 @@
 """User ORM model."""
 
 from datetime import datetime
-from uuid import uuid4
 
-from sqlalchemy import DateTime, String, func
+from sqlalchemy import DateTime, String, Uuid, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from app.database import Base
@@ -15,7 +14,7 @@ class User(Base):
     __tablename__ = "users"
 
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.gen_random_uuid()
     )
     keycloak_id: Mapped[str] = mapped_column(String(36), unique=True, index=True)
     email: Mapped[str] = mapped_column(String(255), unique=True, index=True)
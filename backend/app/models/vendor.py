@@ -2,12 +2,24 @@
 
 from datetime import datetime
 from decimal import Decimal
-from uuid import uuid4
 
-from sqlalchemy import DateTime, Index, Numeric, String, Text, func
+from sqlalchemy import (
+    DateTime,
+    FetchedValue,
+    Index,
+    Numeric,
+    String,
+    Text,
+    Uuid,
+    desc,
+    func,
+)
+from sqlalchemy.dialects.postgresql import CITEXT
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.models.ddl import create_extension, create_uuidv7_function, set_updated_at_trigger
+from app.models.enums import VENDOR_STATUS, VendorStatus
 
 
 class Vendor(Base):
@@ -16,42 +28,64 @@ class Vendor(Base):
     __tablename__ = "vendors"
     __table_args__ = (
         Index("ix_vendors_tier_status", "tier", "status"),
+        # Newest-first listing filtered on status, answered from the index
+        Index(
+            "ix_vendors_status_created_desc", "status", desc("created_at"),
+            postgresql_include=["name", "domain", "tier", "industry"],
+        ),
     )
 
+    # Time-ordered UUIDv7 keys: new vendors append to the right of the PK index
     id: Mapped[str] = mapped_column(
-        String(36), primary_key=True, default=lambda: str(uuid4())
+        Uuid(as_uuid=False), primary_key=True, server_default=func.uuidv7()
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False, index=True)
-    domain: Mapped[str] = mapped_column(String(255), nullable=False, unique=True, index=True)
+    # Case-insensitive text: the unique index rejects domains differing only by
+    # case, serves plain equality lookups and is the CSV importer's ON CONFLICT
+    # arbiter
+    domain: Mapped[str] = mapped_column(
+        CITEXT().with_variant(String(255, collation="NOCASE"), "sqlite"),
+        nullable=False,
+        unique=True,
+        index=True,
+    )
     tier: Mapped[int] = mapped_column(default=3, comment="1=critical, 2=important, 3=standard")
     industry: Mapped[str | None] = mapped_column(String(100))
     country: Mapped[str | None] = mapped_column(String(100))
     employee_count: Mapped[int | None] = mapped_column()
     contract_value: Mapped[Decimal | None] = mapped_column(Numeric(15, 2))
     description: Mapped[str | None] = mapped_column(Text)
-    website: Mapped[str | None] = mapped_column(String(500))
+    website: Mapped[str | None] = mapped_column(Text)
     contact_email: Mapped[str | None] = mapped_column(String(255))
-    status: Mapped[str] = mapped_column(
-        String(20), default="active", index=True,
-        comment="active | inactive | under_review",
-    )
+    status: Mapped[VendorStatus] = mapped_column(VENDOR_STATUS, default=VendorStatus.ACTIVE)
+    # Denormalized copy of the most recent VendorScore, kept in sync by the
+    # after_insert listener in app.models.scoring
+    latest_score: Mapped[int | None] = mapped_column(comment="Latest global score 0-1000")
+    latest_grade: Mapped[str | None] = mapped_column(String(1), index=True)
+    latest_scored_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True))
     created_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True), server_default=func.now()
     )
     updated_at: Mapped[datetime] = mapped_column(
-        DateTime(timezone=True), server_default=func.now(), onupdate=func.now()
+        DateTime(timezone=True), server_default=func.now(), server_onupdate=FetchedValue()
     )
 
-    # Relationships
+    # Relationships -- never loaded implicitly: use selectinload() where needed.
+    # Child rows are removed by the ON DELETE CASCADE foreign keys.
     scores: Mapped[list["VendorScore"]] = relationship(  # noqa: F821
-        back_populates="vendor", lazy="selectin",
+        back_populates="vendor", lazy="raise_on_sql", passive_deletes=True,
     )
     findings: Mapped[list["Finding"]] = relationship(  # noqa: F821
-        back_populates="vendor", lazy="selectin",
+        back_populates="vendor", lazy="raise_on_sql", passive_deletes=True,
     )
     alerts: Mapped[list["Alert"]] = relationship(  # noqa: F821
-        back_populates="vendor", lazy="selectin",
+        back_populates="vendor", lazy="raise_on_sql", passive_deletes=True,
     )
 
     def __repr__(self) -> str:
         return f"<Vendor(id={self.id!r}, name={self.name!r}, domain={self.domain!r})>"
+
+
+create_extension(Base.metadata, "citext")
+create_uuidv7_function(Base.metadata)
+set_updated_at_trigger(Vendor.__table__)
@@ -0,0 +1,8 @@
+"""Pydantic request and response schemas.
+
+Pure response value objects (chat sources, DORA register entries, GRC
+coverage and heatmap cells, supply chain nodes and links, LLM provider info,
+portal scorecards and findings) are immutable DTOs: they are declared with
+``{"frozen": True, "extra": "forbid"}`` and are never modified after they
+are built. Build a new instance (or use ``model_copy(update=...)``) instead.
+"""
@@ -1,11 +1,12 @@
 """Bulk operations Pydantic schemas."""
 
-from enum import Enum
+from enum import StrEnum
+from typing import Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
-class BulkExportFormat(str, Enum):
+class BulkExportFormat(StrEnum):
     """Supported export formats."""
 
     CSV = "csv"
@@ -17,11 +18,27 @@ class BulkImportRow(BaseModel):
 
     name: str
     domain: str
-    tier: int = Field(default=3, ge=1, le=3)
+    tier: Literal[1, 2, 3] = 3
     industry: str | None = None
     country: str | None = None
     contact_email: str | None = None
 
+    def to_vendor_row(self) -> dict[str, Any]:
+        """Return the column values of the vendor to insert for this row."""
+        return {
+            "name": self.name,
+            "domain": self.domain,
+            "tier": self.tier,
+            "industry": self.industry,
+            "country": self.country,
+            "contact_email": self.contact_email,
+            "status": "active",
+        }
+
+
+# Validates a whole import batch in one call instead of one model per row
+BULK_IMPORT_ROWS = TypeAdapter(list[BulkImportRow])
+
 
 class BulkImportResult(BaseModel):
     """Result of a bulk vendor import."""
@@ -13,6 +13,8 @@ class ChatSource(BaseModel):
     title: str
     relevance: float = Field(default=1.0, ge=0.0, le=1.0)
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class ChatMessageRequest(BaseModel):
     """Incoming chat message from user."""
@@ -41,6 +43,8 @@ class ChatHistoryItem(BaseModel):
     sources: list[ChatSource] = []
     timestamp: datetime
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class ChatHistoryResponse(BaseModel):
     """Chat history list."""
@@ -56,3 +60,6 @@ class IndexRequest(BaseModel):
         default=["scores", "findings", "documents"],
         description="Collections to reindex",
     )
+    batch_size: int = Field(
+        default=64, ge=1, le=256, description="Texts embedded per provider call"
+    )
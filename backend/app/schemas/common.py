@@ -1,12 +1,24 @@
 """Common Pydantic schemas used across the API."""
 
-from typing import Generic, TypeVar
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from datetime import datetime
+from typing import Annotated, Generic, TypeVar
+from uuid import UUID
 
-from pydantic import BaseModel, Field
+from pydantic import AfterValidator, BaseModel, Field
 
 T = TypeVar("T")
 
 
+def _canonical_uuid(value: str) -> str:
+    return str(UUID(value))
+
+
+# Identifier kept as ``str`` but validated as a UUID, so malformed ids are
+# rejected with a 422 instead of failing the database's uuid cast.
+UUIDStr = Annotated[str, AfterValidator(_canonical_uuid)]
+
+
 class PaginatedResponse(BaseModel, Generic[T]):
     """Generic paginated response wrapper."""
 
@@ -17,6 +29,32 @@ class PaginatedResponse(BaseModel, Generic[T]):
     pages: int = Field(..., ge=0, description="Total number of pages")
 
 
+class CursorPaginatedResponse(BaseModel, Generic[T]):
+    """Generic keyset-paginated response wrapper.
+
+    Pass ``next_cursor`` back as ``cursor`` to fetch the following page.
+    """
+
+    items: list[T]
+    next_cursor: str | None = Field(None, description="Cursor of the next page")
+    has_more: bool = Field(..., description="Whether more items follow")
+
+
+def encode_cursor(created_at: datetime, item_id: str) -> str:
+    """Encode the ``(created_at, id)`` keyset position of a row as a cursor."""
+    return urlsafe_b64encode(f"{created_at.isoformat()}|{item_id}".encode()).decode()
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor built by ``encode_cursor``.
+
+    Raises:
+        ValueError: If the cursor is malformed.
+    """
+    created_at, item_id = urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+    return datetime.fromisoformat(created_at), _canonical_uuid(item_id)
+
+
 class ErrorResponse(BaseModel):
     """Standard error response."""
 
@@ -22,6 +22,8 @@ class DORARegisterEntry(BaseModel):
     compliance_status: str = "non-conforme"
     notes: str = ""
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class DORARegisterCreate(BaseModel):
     """Create or update a DORA register entry."""
@@ -60,6 +62,8 @@ class DORAGap(BaseModel):
     severity: str = "medium"
     recommendation: str = ""
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class DORAExportRequest(BaseModel):
     """Options for exporting the DORA register."""
@@ -1,6 +1,7 @@
 """GRC/PSSI Pydantic schemas."""
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -25,9 +26,7 @@ class SecurityControlResponse(BaseModel):
 class SecurityControlUpdate(BaseModel):
     """Request to update a security control."""
 
-    status: str | None = Field(
-        None, pattern=r"^(implemented|partial|not_implemented)$"
-    )
+    status: Literal["implemented", "partial", "not_implemented"] | None = None
     owner: str | None = None
     evidence_url: str | None = None
 
@@ -42,6 +41,8 @@ class FrameworkCoverage(BaseModel):
     not_implemented: int
     coverage_percent: float = Field(..., ge=0, le=100)
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class MaturityData(BaseModel):
     """Maturity data for a control or domain."""
@@ -62,3 +63,8 @@ class HeatmapCell(BaseModel):
     framework: str
     coverage_percent: float = Field(..., ge=0, le=100)
     status: str = Field(..., description="good | warning | critical")
+    avg_maturity: float | None = Field(
+        None, description="Average maturity level 1-5 of the mapped controls"
+    )
+
+    model_config = {"frozen": True, "extra": "forbid"}
@@ -1,11 +1,13 @@
 """Schemas for integration configuration and testing."""
 
-from enum import Enum
+from enum import StrEnum
 
 from pydantic import BaseModel, Field
 
 
-class IntegrationType(str, Enum):
+class IntegrationType(StrEnum):
+    """Supported external integrations."""
+
     splunk = "splunk"
     servicenow = "servicenow"
     slack = "slack"
@@ -1,6 +1,7 @@
 """Internal scoring Pydantic schemas."""
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -31,7 +32,7 @@ class M365ScanConfig(BaseModel):
 class InternalScanCreate(BaseModel):
     """Request to create an internal scan."""
 
-    scan_type: str = Field(..., pattern=r"^(ad|m365|grc)$")
+    scan_type: Literal["ad", "m365", "grc"]
     target: str = Field(..., min_length=1, max_length=500)
     config: dict = Field(default_factory=dict)
 
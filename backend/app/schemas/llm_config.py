@@ -1,15 +1,15 @@
 """Pydantic schemas for LLM configuration."""
 
-from pydantic import BaseModel, Field
+from typing import Literal
+
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class LLMConfigCreate(BaseModel):
     """Request schema for creating/updating LLM configuration."""
 
-    provider: str = Field(
-        ...,
-        pattern=r"^(mistral|gemini|claude|openai|ollama)$",
-        description="LLM provider name",
+    provider: Literal["mistral", "gemini", "claude", "openai", "ollama"] = Field(
+        ..., description="LLM provider name"
     )
     model_name: str = Field(..., min_length=1, max_length=100)
     api_key: str | None = Field(
@@ -52,6 +52,8 @@ class LLMProviderInfo(BaseModel):
     requires_api_key: bool
     requires_base_url: bool
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 LLM_PROVIDERS: list[LLMProviderInfo] = [
     LLMProviderInfo(
@@ -113,3 +115,6 @@ LLM_PROVIDERS: list[LLMProviderInfo] = [
         requires_base_url=True,
     ),
 ]
+
+# Static list: serialized once, served as-is by the providers endpoint
+LLM_PROVIDERS_JSON: bytes = TypeAdapter(list[LLMProviderInfo]).dump_json(LLM_PROVIDERS)
@@ -16,6 +16,8 @@ class PortalScorecard(BaseModel):
     domain_scores: dict[str, int] = Field(default_factory=dict)
     last_scan: datetime | None = None
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class PortalFinding(BaseModel):
     """A finding visible to the vendor."""
@@ -28,6 +30,8 @@ class PortalFinding(BaseModel):
     description: str = ""
     detected_at: datetime | None = None
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class PortalDisputeCreate(BaseModel):
     """Request to dispute a finding."""
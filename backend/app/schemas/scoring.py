@@ -1,6 +1,7 @@
 """Scoring Pydantic schemas."""
 
 from datetime import datetime
+from typing import Literal
 
 from pydantic import BaseModel, Field
 
@@ -57,6 +58,4 @@ class ScoringTriggerRequest(BaseModel):
     domains: list[str] | None = Field(
         None, description="Specific domains to scan (D1-D8). None = all domains."
     )
-    priority: str = Field(
-        default="normal", pattern=r"^(low|normal|high|critical)$"
-    )
+    priority: Literal["low", "normal", "high", "critical"] = "normal"
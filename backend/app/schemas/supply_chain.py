@@ -1,6 +1,7 @@
 """Supply Chain Pydantic schemas."""
 
 from datetime import datetime
+from typing import TypedDict
 
 from pydantic import BaseModel, Field
 
@@ -16,6 +17,8 @@ class SupplyChainNode(BaseModel):
     grade: str | None = None
     provider_type: str | None = Field(None, description="cloud | cdn | dns | email | cert")
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class SupplyChainLink(BaseModel):
     """An edge in the supply chain dependency graph."""
@@ -26,6 +29,8 @@ class SupplyChainLink(BaseModel):
     detected_via: str | None = None
     confidence: float | None = None
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class GraphData(BaseModel):
     """Full supply chain graph for D3.js rendering."""
@@ -34,6 +39,40 @@ class GraphData(BaseModel):
     links: list[SupplyChainLink]
 
 
+class NodeDict(TypedDict):
+    """Plain-dict form of ``SupplyChainNode``."""
+
+    id: str
+    name: str
+    type: str
+    tier: int
+    score: int | None
+    grade: str | None
+    provider_type: str | None
+
+
+class LinkDict(TypedDict):
+    """Plain-dict form of ``SupplyChainLink``."""
+
+    source: str
+    target: str
+    type: str
+    detected_via: str | None
+    confidence: float | None
+
+
+class GraphDict(TypedDict):
+    """Plain-dict form of ``GraphData``, serialized as is.
+
+    A graph of thousands of vendors and providers is built and encoded
+    without one model instance per node and link; ``GraphData`` documents
+    the shape in the OpenAPI schema.
+    """
+
+    nodes: list[NodeDict]
+    links: list[LinkDict]
+
+
 class ConcentrationRisk(BaseModel):
     """Concentration risk for a single provider."""
 
@@ -43,6 +82,8 @@ class ConcentrationRisk(BaseModel):
     risk_level: str = Field(..., description="low | medium | high | critical")
     created_at: datetime | None = None
 
+    model_config = {"frozen": True, "extra": "forbid"}
+
 
 class ConcentrationRiskResponse(BaseModel):
     """Full concentration risk analysis response."""
@@ -2,10 +2,11 @@
 
 from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 
 from pydantic import BaseModel, EmailStr, Field
 
-from app.schemas.common import PaginatedResponse
+from app.schemas.common import CursorPaginatedResponse, PaginatedResponse
 
 
 class VendorBase(BaseModel):
@@ -40,7 +41,7 @@ class VendorUpdate(BaseModel):
     description: str | None = None
     website: str | None = Field(None, max_length=500)
     contact_email: EmailStr | None = None
-    status: str | None = Field(None, pattern=r"^(active|inactive|under_review)$")
+    status: Literal["active", "inactive", "under_review"] | None = None
 
 
 class VendorResponse(VendorBase):
@@ -48,6 +49,8 @@ class VendorResponse(VendorBase):
 
     id: str
     status: str
+    latest_score: int | None = None
+    latest_grade: str | None = None
     created_at: datetime
     updated_at: datetime
 
@@ -56,3 +59,7 @@ class VendorResponse(VendorBase):
 
 class VendorListResponse(PaginatedResponse[VendorResponse]):
     """Paginated vendor list response."""
+
+
+class VendorCursorResponse(CursorPaginatedResponse[VendorResponse]):
+    """Keyset-paginated vendor list response, newest first."""
@@ -2,6 +2,7 @@
 
 from datetime import datetime
 from decimal import Decimal
+from typing import Literal
 
 from pydantic import BaseModel, EmailStr, Field
 
@@ -47,7 +48,7 @@ class DisputeCreate(BaseModel):
 class DisputeUpdate(BaseModel):
     """Schema for updating/resolving a dispute."""
 
-    status: str = Field(..., pattern=r"^(in_review|resolved|rejected)$")
+    status: Literal["in_review", "resolved", "rejected"]
     admin_notes: str | None = None
 
 
@@ -75,7 +76,7 @@ class RemediationCreate(BaseModel):
 
     title: str = Field(..., min_length=1, max_length=500)
     description: str = Field(..., min_length=1)
-    priority: str = Field(default="medium", pattern=r"^(critical|high|medium|low)$")
+    priority: Literal["critical", "high", "medium", "low"] = "medium"
     deadline: datetime
     assigned_to: str | None = Field(None, max_length=255)
 
@@ -0,0 +1,9 @@
+"""Business logic services.
+
+List queries that feed read-only response schemas select only the columns the
+schema exposes (``select(*columns)``) and build responses with
+``Schema.model_construct(**row)`` over ``result.mappings()``. This keeps every
+list endpoint to a single SQL round-trip with no ORM hydration, identity-map
+bookkeeping or relationship loading; the data comes straight from our own
+database, so output validation is skipped.
+"""
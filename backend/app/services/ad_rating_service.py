@@ -1,16 +1,27 @@
 """AD Rating Service — orchestrates AD scans and persists results."""
 
 import logging
+from functools import partial
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agents.ad_rating_agent import ADRatingAgent
-from app.models.internal_scoring import InternalFinding, InternalScan
+from app.database import run_after_commit
+from app.models.internal_scoring import InternalScan
+from app.services.internal_finding_service import insert_internal_findings
+from app.ttl_cache import TTLCache
 
 logger = logging.getLogger("cyberscore.services.ad_rating")
 
+SCORE_CACHE_SIZE = 1024
+SCORE_CACHE_TTL = 30.0  # seconds
+
+# Latest score per target ("__all__" without a target). Dashboards poll
+# get_score far more often than scans run.
+_score_cache: TTLCache[str, dict[str, Any]] = TTLCache(SCORE_CACHE_SIZE, SCORE_CACHE_TTL)
+
 
 class ADRatingService:
     """Service layer for Active Directory security rating."""
@@ -50,22 +61,29 @@ class ADRatingService:
             findings_count=result.data.get("findings_count", 0),
             scan_data=result.data,
         )
+        # Scan results can be regenerated by scanning again, so this
+        # transaction's commit does not wait for the WAL flush
+        await self.db.execute(text("SET LOCAL synchronous_commit = off"))
         self.db.add(scan)
         await self.db.flush()
 
         # Persist individual findings
-        for f in result.data.get("findings", []):
-            finding = InternalFinding(
-                scan_id=scan.id,
-                category=f.get("category", "unknown"),
-                title=f.get("title", ""),
-                description=f.get("description"),
-                severity=f.get("severity", "info"),
-                recommendation=f.get("recommendation"),
-            )
-            self.db.add(finding)
+        findings = [
+            {
+                "scan_id": scan.id,
+                "category": f.get("category", "unknown"),
+                "title": f.get("title", ""),
+                "description": f.get("description"),
+                "severity": f.get("severity", "info"),
+                "recommendation": f.get("recommendation"),
+            }
+            for f in result.data.get("findings", [])
+        ]
+        await insert_internal_findings(self.db, findings)
 
-        await self.db.flush()
+        # Dropped once the scan is committed: before that, a concurrent
+        # get_score would read and cache the previous score again
+        run_after_commit(self.db, partial(_score_cache.discard, domain_controller, "__all__"))
         return scan
 
     async def get_score(self, target: str | None = None) -> dict[str, Any]:
@@ -77,8 +95,21 @@ class ADRatingService:
         Returns:
             Dict with score data or empty dict.
         """
+        key = target or "__all__"
+        cached = _score_cache.get(key)
+        if cached is not None:
+            return cached
+
+        # Only the category scores are extracted from scan_data, server-side
         query = (
-            select(InternalScan)
+            select(
+                InternalScan.id,
+                InternalScan.score,
+                InternalScan.grade,
+                InternalScan.findings_count,
+                InternalScan.scan_data["category_scores"].label("category_scores"),
+                InternalScan.created_at,
+            )
             .where(InternalScan.scan_type == "ad")
             .order_by(InternalScan.created_at.desc())
             .limit(1)
@@ -87,17 +118,20 @@ class ADRatingService:
             query = query.where(InternalScan.target == target)
 
         result = await self.db.execute(query)
-        scan = result.scalar_one_or_none()
-        if not scan:
-            return {}
-        return {
-            "id": scan.id,
-            "score": scan.score,
-            "grade": scan.grade,
-            "findings_count": scan.findings_count,
-            "category_scores": scan.scan_data.get("category_scores", {}),
-            "created_at": scan.created_at.isoformat() if scan.created_at else None,
-        }
+        scan = result.one_or_none()
+        score: dict[str, Any] = {}
+        if scan:
+            score = {
+                "id": scan.id,
+                "score": scan.score,
+                "grade": scan.grade,
+                "findings_count": scan.findings_count,
+                "category_scores": scan.category_scores or {},
+                "created_at": scan.created_at.isoformat() if scan.created_at else None,
+            }
+
+        _score_cache.put(key, score)
+        return score
 
     async def get_history(
         self, target: str | None = None, limit: int = 30
@@ -112,7 +146,13 @@ class ADRatingService:
             List of historical scan summaries.
         """
         query = (
-            select(InternalScan)
+            select(
+                InternalScan.id,
+                InternalScan.score,
+                InternalScan.grade,
+                InternalScan.findings_count,
+                InternalScan.created_at,
+            )
             .where(InternalScan.scan_type == "ad")
             .order_by(InternalScan.created_at.desc())
             .limit(limit)
@@ -121,7 +161,6 @@ class ADRatingService:
             query = query.where(InternalScan.target == target)
 
         result = await self.db.execute(query)
-        scans = result.scalars().all()
         return [
             {
                 "id": s.id,
@@ -130,7 +169,7 @@ class ADRatingService:
                 "findings_count": s.findings_count,
                 "created_at": s.created_at.isoformat() if s.created_at else None,
             }
-            for s in scans
+            for s in result
         ]
 
     async def compare_timeshift(
@@ -145,30 +184,32 @@ class ADRatingService:
         Returns:
             Comparison data with score delta and finding changes.
         """
-        result1 = await self.db.execute(
-            select(InternalScan).where(InternalScan.id == scan1_id)
+        # Both scans in one round trip; only the category scores are read out
+        # of the (possibly multi-megabyte) scan_data document
+        result = await self.db.execute(
+            select(
+                InternalScan.id,
+                InternalScan.score,
+                InternalScan.grade,
+                InternalScan.findings_count,
+                InternalScan.scan_data["category_scores"].label("category_scores"),
+            ).where(InternalScan.id.in_((scan1_id, scan2_id)))
         )
-        result2 = await self.db.execute(
-            select(InternalScan).where(InternalScan.id == scan2_id)
-        )
-        scan1 = result1.scalar_one_or_none()
-        scan2 = result2.scalar_one_or_none()
+        scans = {row.id: row for row in result}
+        scan1 = scans.get(scan1_id)
+        scan2 = scans.get(scan2_id)
 
         if not scan1 or not scan2:
             return {"error": "One or both scans not found"}
 
-        cat1 = scan1.scan_data.get("category_scores", {})
-        cat2 = scan2.scan_data.get("category_scores", {})
+        cat1 = scan1.category_scores or {}
+        cat2 = scan2.category_scores or {}
 
         category_deltas = {}
-        for cat in set(list(cat1.keys()) + list(cat2.keys())):
+        for cat in cat1.keys() | cat2.keys():
             old_val = cat1.get(cat, 0)
             new_val = cat2.get(cat, 0)
-            category_deltas[cat] = {
-                "old": old_val,
-                "new": new_val,
-                "delta": new_val - old_val,
-            }
+            category_deltas[cat] = {"old": old_val, "new": new_val, "delta": new_val - old_val}
 
         return {
             "scan1": {"id": scan1.id, "score": scan1.score, "grade": scan1.grade},
@@ -7,12 +7,13 @@ logger = logging.getLogger("cyberscore.services.alert")
 
 SCORE_DROP_THRESHOLD = 100
 GRADE_ORDER = {"A": 5, "B": 4, "C": 3, "D": 2, "F": 1}
+ALERTING_SEVERITIES = frozenset({"critical", "high"})
 
 
 class AlertService:
     """Service for detecting and dispatching alerts."""
 
-    async def check_score_drop(
+    def check_score_drop(
         self,
         vendor_id: str,
         old_score: int,
@@ -31,7 +32,7 @@ class AlertService:
             })
         return alerts
 
-    async def check_grade_change(
+    def check_grade_change(
         self,
         vendor_id: str,
         old_grade: str,
@@ -48,19 +49,42 @@ class AlertService:
             })
         return alerts
 
-    async def check_critical_findings(
+    def check_critical_findings(
         self,
         vendor_id: str,
         findings: list[dict[str, Any]],
     ) -> list[dict[str, Any]]:
         """Generate alerts for critical/high findings."""
-        alerts: list[dict[str, Any]] = []
-        for f in findings:
-            if f.get("severity") in ("critical", "high"):
-                alerts.append({
-                    "vendor_id": vendor_id,
-                    "type": "critical_finding",
-                    "severity": f["severity"],
-                    "title": f.get("title", "Finding critique"),
-                })
-        return alerts
+        return [
+            {
+                "vendor_id": vendor_id,
+                "type": "critical_finding",
+                "severity": severity,
+                "title": f.get("title", "Finding critique"),
+            }
+            for f in findings
+            if (severity := f.get("severity")) in ALERTING_SEVERITIES
+        ]
+
+    def check_critical_findings_bulk(
+        self,
+        rows: list[dict[str, Any]],
+    ) -> list[dict[str, Any]]:
+        """Generate alerts for critical/high findings across a portfolio.
+
+        Args:
+            rows: Findings of any number of vendors, each with a ``vendor_id``.
+
+        Returns:
+            One alert per critical or high finding, in input order.
+        """
+        return [
+            {
+                "vendor_id": r["vendor_id"],
+                "type": "critical_finding",
+                "severity": severity,
+                "title": r.get("title", "Finding critique"),
+            }
+            for r in rows
+            if (severity := r.get("severity")) in ALERTING_SEVERITIES
+        ]
@@ -5,6 +5,7 @@ sectors and compares vendor or portfolio scores against sector averages.
 """
 
 import logging
+from bisect import bisect_right
 from typing import Any
 
 logger = logging.getLogger("cyberscore.services.benchmark")
@@ -86,20 +87,62 @@ DOMAIN_NAMES = {
 }
 
 
+# (code, name, sector average) of each domain, per sector
+_SECTOR_DOMAINS: dict[str, tuple[tuple[str, str, int], ...]] = {
+    sector: tuple(
+        (code, DOMAIN_NAMES[code], avg) for code, avg in bench["domain_averages"].items()
+    )
+    for sector, bench in SECTOR_BENCHMARKS.items()
+}
+
+# Responses built from the constant tables above, shared by every call.
+# Callers only serialize them and must not modify them.
+_SECTOR_SUMMARIES: list[dict[str, Any]] = [
+    {
+        "key": key,
+        "label": data["label"],
+        "global_avg": data["global_avg"],
+        "global_p50": data["global_p50"],
+    }
+    for key, data in SECTOR_BENCHMARKS.items()
+]
+
+_SECTOR_DETAILS: dict[str, dict[str, Any]] = {
+    sector: {
+        **bench,
+        "sector": sector,
+        "domains": [
+            {"code": code, "name": name, "sector_avg": avg}
+            for code, name, avg in _SECTOR_DOMAINS[sector]
+        ],
+    }
+    for sector, bench in SECTOR_BENCHMARKS.items()
+}
+
+# Percentile brackets, lowest first: a score at or above the i-th threshold of
+# a sector falls in bracket i + 1
+_PERCENTILE_BRACKETS: tuple[tuple[str, str], ...] = (
+    ("bottom_25", "Bottom 25%"),
+    ("bottom_50", "Bottom 50%"),
+    ("top_50", "Top 50%"),
+    ("top_25", "Top 25%"),
+    ("top_10", "Top 10%"),
+)
+
+_PERCENTILE_THRESHOLDS: dict[str, tuple[int, ...]] = {
+    sector: (
+        bench["global_p25"], bench["global_p50"], bench["global_p75"], bench["global_p90"],
+    )
+    for sector, bench in SECTOR_BENCHMARKS.items()
+}
+
+
 class BenchmarkService:
     """Sector benchmark comparison service."""
 
     def get_sectors(self) -> list[dict[str, Any]]:
-        """Return available sectors with summary stats."""
-        return [
-            {
-                "key": key,
-                "label": data["label"],
-                "global_avg": data["global_avg"],
-                "global_p50": data["global_p50"],
-            }
-            for key, data in SECTOR_BENCHMARKS.items()
-        ]
+        """Return available sectors with summary stats (shared, read-only)."""
+        return _SECTOR_SUMMARIES
 
     def get_sector_benchmark(self, sector: str) -> dict[str, Any] | None:
         """Return full benchmark data for a sector.
@@ -108,23 +151,10 @@ class BenchmarkService:
             sector: Sector key (assurance, mutuelle, sante, banque, industrie).
 
         Returns:
-            Benchmark dict with percentiles and domain averages, or None.
+            Benchmark dict with percentiles and domain averages (shared,
+            read-only), or None.
         """
-        bench = SECTOR_BENCHMARKS.get(sector)
-        if bench is None:
-            return None
-        return {
-            **bench,
-            "sector": sector,
-            "domains": [
-                {
-                    "code": code,
-                    "name": DOMAIN_NAMES[code],
-                    "sector_avg": avg,
-                }
-                for code, avg in bench["domain_averages"].items()
-            ],
-        }
+        return _SECTOR_DETAILS.get(sector)
 
     def compare_vendor(
         self,
@@ -142,49 +172,66 @@ class BenchmarkService:
         Returns:
             Comparison data with percentile position and domain deltas.
         """
+        results = self.compare_vendors_batch([(vendor_score, vendor_domain_scores)], sector)
+        return None if results is None else results[0]
+
+    def compare_vendors_batch(
+        self,
+        vendors: list[tuple[int, dict[str, int]]],
+        sector: str,
+    ) -> list[dict[str, Any]] | None:
+        """Compare many vendors against the same sector benchmark.
+
+        The sector's thresholds and domain averages are looked up once for
+        the whole batch.
+
+        Args:
+            vendors: (global score 0-1000, domain code -> score 0-100) pairs.
+            sector: Sector key.
+
+        Returns:
+            One comparison per vendor, in input order, or None for an
+            unknown sector.
+        """
         bench = SECTOR_BENCHMARKS.get(sector)
         if bench is None:
             return None
 
-        # Determine percentile bracket
-        if vendor_score >= bench["global_p90"]:
-            percentile = "top_10"
-            percentile_label = "Top 10%"
-        elif vendor_score >= bench["global_p75"]:
-            percentile = "top_25"
-            percentile_label = "Top 25%"
-        elif vendor_score >= bench["global_p50"]:
-            percentile = "top_50"
-            percentile_label = "Top 50%"
-        elif vendor_score >= bench["global_p25"]:
-            percentile = "bottom_50"
-            percentile_label = "Bottom 50%"
-        else:
-            percentile = "bottom_25"
-            percentile_label = "Bottom 25%"
+        thresholds = _PERCENTILE_THRESHOLDS[sector]
+        domains = _SECTOR_DOMAINS[sector]
+        sector_label = bench["label"]
+        sector_avg_score = bench["global_avg"]
 
-        domain_comparison = []
-        for code, sector_avg in bench["domain_averages"].items():
-            vendor_ds = vendor_domain_scores.get(code, 50)
-            domain_comparison.append({
-                "code": code,
-                "name": DOMAIN_NAMES[code],
-                "vendor_score": vendor_ds,
-                "sector_avg": sector_avg,
-                "delta": vendor_ds - sector_avg,
-                "status": "above" if vendor_ds >= sector_avg else "below",
-            })
+        results = []
+        for vendor_score, vendor_domain_scores in vendors:
+            # Determine percentile bracket
+            percentile, percentile_label = _PERCENTILE_BRACKETS[
+                bisect_right(thresholds, vendor_score)
+            ]
 
-        return {
-            "sector": sector,
-            "sector_label": bench["label"],
-            "vendor_score": vendor_score,
-            "sector_avg": bench["global_avg"],
-            "delta": vendor_score - bench["global_avg"],
-            "percentile": percentile,
-            "percentile_label": percentile_label,
-            "domain_comparison": domain_comparison,
-        }
+            domain_comparison = []
+            for code, name, sector_avg in domains:
+                vendor_ds = vendor_domain_scores.get(code, 50)
+                domain_comparison.append({
+                    "code": code,
+                    "name": name,
+                    "vendor_score": vendor_ds,
+                    "sector_avg": sector_avg,
+                    "delta": vendor_ds - sector_avg,
+                    "status": "above" if vendor_ds >= sector_avg else "below",
+                })
+
+            results.append({
+                "sector": sector,
+                "sector_label": sector_label,
+                "vendor_score": vendor_score,
+                "sector_avg": sector_avg_score,
+                "delta": vendor_score - sector_avg_score,
+                "percentile": percentile,
+                "percentile_label": percentile_label,
+                "domain_comparison": domain_comparison,
+            })
+        return results
 
     def compare_portfolio(
         self,
@@ -207,11 +254,11 @@ class BenchmarkService:
             return None
 
         domain_comparison = []
-        for code, sector_avg in bench["domain_averages"].items():
+        for code, name, sector_avg in _SECTOR_DOMAINS[sector]:
             portfolio_ds = portfolio_domain_avgs.get(code, 50.0)
             domain_comparison.append({
                 "code": code,
-                "name": DOMAIN_NAMES[code],
+                "name": name,
                 "portfolio_avg": round(portfolio_ds, 1),
                 "sector_avg": sector_avg,
                 "delta": round(portfolio_ds - sector_avg, 1),
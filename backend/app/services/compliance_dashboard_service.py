@@ -0,0 +1,83 @@
+"""Compliance Dashboard Service — batched refresh of the compliance_dashboard view.
+
+Committed GRC writes only mark the materialized view as stale; a background
+task in the API process refreshes it at most once every ``REFRESH_INTERVAL``
+seconds, which bounds how stale the coverage and heatmap figures can get. Writes made by other
+processes (Celery workers, scripts) are picked up on the next refresh triggered
+here or at the next API start.
+"""
+
+import asyncio
+import logging
+from dataclasses import dataclass
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import object_session
+
+from app.cache import invalidate
+from app.database import engine, run_after_commit
+from app.models.grc import FrameworkMapping, MaturityAssessment, SecurityControl
+from app.services.grc_service import FRAMEWORKS, coverage_cache_key
+
+logger = logging.getLogger("cyberscore.services.compliance_dashboard")
+
+REFRESH_INTERVAL = 30.0
+
+
+@dataclass(slots=True)
+class _RefreshState:
+    """Whether the view is stale and due for a refresh on the next tick."""
+
+    # Start dirty so the first tick catches changes made while the API was down
+    dirty: bool = True
+
+
+_state = _RefreshState()
+
+
+def mark_compliance_dashboard_dirty() -> None:
+    """Schedule a refresh of the view on the next tick."""
+    _state.dirty = True
+
+
+def _on_grc_write(_mapper: object, _connection: object, target: object) -> None:
+    """Mark the view stale once the transaction flushing ``target`` commits.
+
+    Marking it at flush time would let a refresh run before the commit, read
+    the old rows and clear the flag, leaving the change out of the view.
+    """
+    run_after_commit(object_session(target), mark_compliance_dashboard_dirty)
+
+
+for _target in (MaturityAssessment, FrameworkMapping, SecurityControl):
+    for _event in ("after_insert", "after_update", "after_delete"):
+        event.listen(_target, _event, _on_grc_write)
+
+
+async def refresh_compliance_dashboard() -> None:
+    """Recompute the view without blocking readers, then drop cached coverage."""
+    async with engine.begin() as conn:
+        await conn.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY compliance_dashboard"))
+    await invalidate(*(coverage_cache_key(framework) for framework in FRAMEWORKS))
+
+
+async def refresh_compliance_dashboard_periodically() -> None:
+    """Refresh the view every ``REFRESH_INTERVAL`` seconds while it is stale.
+
+    Runs until cancelled. A failed refresh keeps the view marked as stale so
+    it is retried on the next tick.
+    """
+    if engine.dialect.name != "postgresql":
+        return
+
+    while True:
+        await asyncio.sleep(REFRESH_INTERVAL)
+        if not _state.dirty:
+            continue
+        _state.dirty = False
+        try:
+            await refresh_compliance_dashboard()
+        except SQLAlchemyError as exc:
+            _state.dirty = True
+            logger.warning("Compliance dashboard refresh failed: %s", exc)
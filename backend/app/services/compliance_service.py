@@ -1,6 +1,8 @@
 """Compliance service — DORA, NIS2, RGPD mapping and coverage calculation."""
 
 import logging
+from functools import reduce
+from operator import or_
 from typing import Any
 
 logger = logging.getLogger("cyberscore.services.compliance")
@@ -11,6 +13,25 @@ DORA_ARTICLES = {
     "art30_monitoring": "Surveillance et audit (Art. 30)",
 }
 
+# DORA articles covered by findings of each scoring domain
+DOMAIN_TO_DORA_ARTICLES: dict[str, tuple[str, ...]] = {
+    "D1": ("art28_risk_mgmt",),
+    "D2": ("art28_risk_mgmt",),
+    "D3": ("art28_risk_mgmt",),
+    "D5": ("art28_risk_mgmt",),
+    "D7": ("art30_monitoring",),
+    "D8": ("art30_monitoring",),
+}
+
+# One bit per article, so coverage over many findings is a bitwise OR
+_ARTICLE_BITS = {article: 1 << index for index, article in enumerate(DORA_ARTICLES)}
+_DOMAIN_MASKS = {
+    domain: sum(_ARTICLE_BITS[article] for article in articles)
+    for domain, articles in DOMAIN_TO_DORA_ARTICLES.items()
+}
+# Every article findings can cover: no later finding can add to this mask
+_COVERABLE_MASK = reduce(or_, _DOMAIN_MASKS.values(), 0)
+
 
 class ComplianceService:
     """Service for regulatory compliance assessment."""
@@ -19,26 +40,23 @@ class ComplianceService:
         self, finding: dict[str, Any]
     ) -> list[str]:
         """Map a finding to applicable DORA articles."""
-        articles: list[str] = []
-        domain = finding.get("domain", "")
-        if domain in ("D1", "D2", "D3", "D5"):
-            articles.append("art28_risk_mgmt")
-        if domain in ("D7", "D8"):
-            articles.append("art30_monitoring")
-        return articles
+        return list(DOMAIN_TO_DORA_ARTICLES.get(finding.get("domain", ""), ()))
 
     def get_dora_coverage(
         self, findings: list[dict[str, Any]]
     ) -> dict[str, Any]:
         """Calculate DORA coverage percentage."""
-        covered_articles: set[str] = set()
+        mask = 0
         for finding in findings:
-            covered_articles.update(self.map_finding_to_dora(finding))
+            mask |= _DOMAIN_MASKS.get(finding.get("domain", ""), 0)
+            if mask == _COVERABLE_MASK:
+                break
 
+        covered_articles = [article for article, bit in _ARTICLE_BITS.items() if mask & bit]
         total = len(DORA_ARTICLES)
-        covered = len(covered_articles & set(DORA_ARTICLES.keys()))
+        covered = len(covered_articles)
         return {
             "coverage_percent": round(covered / total * 100, 1) if total else 0,
-            "covered_articles": list(covered_articles),
+            "covered_articles": covered_articles,
             "total_articles": total,
         }
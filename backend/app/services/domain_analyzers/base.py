@@ -1,13 +1,19 @@
 """Base classes for domain analyzers."""
 
 from abc import ABC, abstractmethod
+from bisect import bisect_right
+from collections import Counter
 from dataclasses import dataclass, field
 from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class FindingData:
-    """Individual finding from a domain analysis."""
+    """Individual finding from a domain analysis.
+
+    Immutable, so analyzers can share module-level instances of findings
+    whose content never varies.
+    """
 
     domain: str
     title: str
@@ -19,7 +25,7 @@ class FindingData:
     recommendation: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class DomainResult:
     """Result of a single domain analysis."""
 
@@ -40,12 +46,19 @@ SEVERITY_DEDUCTIONS = {
     "info": 0,
 }
 
+# A score at or above the i-th threshold gets grade i + 1
+_GRADE_THRESHOLDS = (20, 40, 60, 80)
+_GRADES = ("E", "D", "C", "B", "A")
+
 
 class BaseDomainAnalyzer(ABC):
     """Abstract base class for all 8 domain analyzers."""
 
     domain_code: str = ""
     domain_name: str = ""
+    # raw_data keys this analyzer reads; with none of them present, the
+    # feed was not collected and there is nothing to analyze
+    feed_keys: tuple[str, ...] = ()
 
     @abstractmethod
     async def analyze(
@@ -61,6 +74,20 @@ class BaseDomainAnalyzer(ABC):
             DomainResult with score, grade, and findings.
         """
 
+    def has_feed(self, raw_data: dict[str, Any]) -> bool:
+        """Return whether any of the analyzer's feeds was collected."""
+        return any(key in raw_data for key in self.feed_keys)
+
+    def empty_result(self) -> DomainResult:
+        """Return the neutral, zero-confidence result of a domain without data."""
+        return DomainResult(
+            domain_code=self.domain_code,
+            domain_name=self.domain_name,
+            score=50,
+            grade="C",
+            confidence=0.0,
+        )
+
     def calculate_score(self, findings: list[FindingData]) -> int:
         """Calculate domain score based on findings.
 
@@ -72,11 +99,15 @@ class BaseDomainAnalyzer(ABC):
         Returns:
             Score between 0 and 100.
         """
-        score = 100
-        for finding in findings:
-            deduction = SEVERITY_DEDUCTIONS.get(finding.severity, 0)
-            score -= deduction
-        return max(0, min(100, score))
+        if not findings:
+            return 100
+
+        # Count findings per severity (in C), then deduct once per severity
+        counts = Counter(finding.severity for finding in findings)
+        deduction = sum(
+            SEVERITY_DEDUCTIONS.get(severity, 0) * count for severity, count in counts.items()
+        )
+        return max(0, min(100, 100 - deduction))
 
     @staticmethod
     def score_to_grade(score: int) -> str:
@@ -88,12 +119,4 @@ class BaseDomainAnalyzer(ABC):
         Returns:
             Grade letter.
         """
-        if score >= 80:
-            return "A"
-        if score >= 60:
-            return "B"
-        if score >= 40:
-            return "C"
-        if score >= 20:
-            return "D"
-        return "E"
+        return _GRADES[bisect_right(_GRADE_THRESHOLDS, score)]
@@ -12,75 +12,93 @@ from app.services.domain_analyzers.base import (
 )
 
 
+# Findings whose content does not depend on the scanned domain, shared by
+# every analysis
+_SPF_ABSENT = FindingData(
+    domain="D2", title="SPF absent",
+    description="Aucun enregistrement SPF détecté.",
+    severity="high", cvss_score=5.0, source="dns",
+    recommendation="Configurer un enregistrement SPF.",
+)
+
+_DKIM_ABSENT = FindingData(
+    domain="D2", title="DKIM absent",
+    description="Aucun enregistrement DKIM détecté.",
+    severity="high", cvss_score=5.0, source="dns",
+    recommendation="Configurer DKIM pour le domaine.",
+)
+
+_DMARC_ABSENT = FindingData(
+    domain="D2", title="DMARC absent",
+    description="Aucune politique DMARC détectée.",
+    severity="critical", cvss_score=7.0, source="dns",
+    recommendation="Configurer DMARC avec p=quarantine ou p=reject.",
+)
+
+_DMARC_POLICY_NONE = FindingData(
+    domain="D2", title="DMARC policy=none",
+    description="DMARC est configuré mais la politique est 'none' (pas de protection).",
+    severity="medium", cvss_score=4.0, source="dns",
+    recommendation="Passer la politique DMARC à quarantine ou reject.",
+)
+
+_DNSSEC_DISABLED = FindingData(
+    domain="D2", title="DNSSEC non activé",
+    description="DNSSEC n'est pas activé pour ce domaine.",
+    severity="medium", cvss_score=3.5, source="dns",
+    recommendation="Activer DNSSEC.",
+)
+
+_CAA_ABSENT = FindingData(
+    domain="D2", title="Enregistrement CAA absent",
+    description="Aucun enregistrement CAA limitant les CA autorisées.",
+    severity="low", cvss_score=2.0, source="dns",
+    recommendation="Ajouter un enregistrement CAA.",
+)
+
+
 class DNSSecurityAnalyzer(BaseDomainAnalyzer):
     """D2: Analyzes DNS security configuration."""
 
     domain_code = "D2"
     domain_name = "Sécurité DNS"
+    feed_keys = ("dns",)
 
     async def analyze(
         self, domain: str, raw_data: dict[str, Any]
     ) -> DomainResult:
         """Analyze DNS security posture."""
+        if not self.has_feed(raw_data):
+            return self.empty_result()
         findings: list[FindingData] = []
         dns_data = raw_data.get("dns", {})
 
         # SPF check
         spf = dns_data.get("spf", {})
         if not spf.get("present"):
-            findings.append(FindingData(
-                domain="D2", title="SPF absent",
-                description="Aucun enregistrement SPF détecté.",
-                severity="high", cvss_score=5.0, source="dns",
-                recommendation="Configurer un enregistrement SPF.",
-            ))
+            findings.append(_SPF_ABSENT)
 
         # DKIM check
         dkim = dns_data.get("dkim", {})
         if not dkim.get("present"):
-            findings.append(FindingData(
-                domain="D2", title="DKIM absent",
-                description="Aucun enregistrement DKIM détecté.",
-                severity="high", cvss_score=5.0, source="dns",
-                recommendation="Configurer DKIM pour le domaine.",
-            ))
+            findings.append(_DKIM_ABSENT)
 
         # DMARC check
         dmarc = dns_data.get("dmarc", {})
         if not dmarc.get("present"):
-            findings.append(FindingData(
-                domain="D2", title="DMARC absent",
-                description="Aucune politique DMARC détectée.",
-                severity="critical", cvss_score=7.0, source="dns",
-                recommendation="Configurer DMARC avec p=quarantine ou p=reject.",
-            ))
+            findings.append(_DMARC_ABSENT)
         elif dmarc.get("policy") == "none":
-            findings.append(FindingData(
-                domain="D2", title="DMARC policy=none",
-                description="DMARC est configuré mais la politique est 'none' (pas de protection).",
-                severity="medium", cvss_score=4.0, source="dns",
-                recommendation="Passer la politique DMARC à quarantine ou reject.",
-            ))
+            findings.append(_DMARC_POLICY_NONE)
 
         # DNSSEC check
         dnssec = dns_data.get("dnssec", {})
         if not dnssec.get("enabled"):
-            findings.append(FindingData(
-                domain="D2", title="DNSSEC non activé",
-                description="DNSSEC n'est pas activé pour ce domaine.",
-                severity="medium", cvss_score=3.5, source="dns",
-                recommendation="Activer DNSSEC.",
-            ))
+            findings.append(_DNSSEC_DISABLED)
 
         # CAA check
         caa = dns_data.get("CAA", [])
         if not caa:
-            findings.append(FindingData(
-                domain="D2", title="Enregistrement CAA absent",
-                description="Aucun enregistrement CAA limitant les CA autorisées.",
-                severity="low", cvss_score=2.0, source="dns",
-                recommendation="Ajouter un enregistrement CAA.",
-            ))
+            findings.append(_CAA_ABSENT)
 
         score = self.calculate_score(findings)
         return DomainResult(
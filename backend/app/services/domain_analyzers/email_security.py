@@ -18,11 +18,14 @@ class EmailSecurityAnalyzer(BaseDomainAnalyzer):
 
     domain_code = "D4"
     domain_name = "Sécurité Email"
+    feed_keys = ("dns",)
 
     async def analyze(
         self, domain: str, raw_data: dict[str, Any]
     ) -> DomainResult:
         """Analyze email security posture."""
+        if not self.has_feed(raw_data):
+            return self.empty_result()
         findings: list[FindingData] = []
         dns_data = raw_data.get("dns", {})
 
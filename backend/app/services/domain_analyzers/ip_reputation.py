@@ -17,11 +17,14 @@ class IPReputationAnalyzer(BaseDomainAnalyzer):
 
     domain_code = "D6"
     domain_name = "Réputation IP"
+    feed_keys = ("reputation",)
 
     async def analyze(
         self, domain: str, raw_data: dict[str, Any]
     ) -> DomainResult:
         """Analyze IP reputation."""
+        if not self.has_feed(raw_data):
+            return self.empty_result()
         findings: list[FindingData] = []
         reputation = raw_data.get("reputation", {})
 
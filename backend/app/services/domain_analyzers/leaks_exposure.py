@@ -3,6 +3,7 @@
 Analyzes data breaches, credential leaks, paste sites, and exposed secrets.
 """
 
+from bisect import bisect_left
 from typing import Any
 
 from app.services.domain_analyzers.base import (
@@ -11,32 +12,38 @@ from app.services.domain_analyzers.base import (
     FindingData,
 )
 
+# A breach with more affected accounts than the i-th threshold gets
+# severity i + 1
+_PWN_COUNT_THRESHOLDS = (10_000, 100_000)
+_BREACH_SEVERITIES = ("medium", "high", "critical")
+
 
 class LeaksExposureAnalyzer(BaseDomainAnalyzer):
     """D7: Analyzes data breaches and credential exposure."""
 
     domain_code = "D7"
     domain_name = "Fuites & Exposition"
+    feed_keys = ("hibp", "github_secrets")
 
     async def analyze(
         self, domain: str, raw_data: dict[str, Any]
     ) -> DomainResult:
         """Analyze leaks and exposure."""
-        findings: list[FindingData] = []
+        if not self.has_feed(raw_data):
+            return self.empty_result()
         hibp = raw_data.get("hibp", {})
 
         breaches = hibp.get("breaches", [])
+        findings: list[FindingData] = []
         for breach in breaches:
             name = breach.get("Name", "Unknown")
             date = breach.get("BreachDate", "Unknown")
             count = breach.get("PwnCount", 0)
-            severity = "critical" if count > 100000 else "high" if count > 10000 else "medium"
-
             findings.append(FindingData(
                 domain="D7",
                 title=f"Breach détectée: {name}",
                 description=f"Fuite de données '{name}' le {date} — {count:,} comptes affectés.",
-                severity=severity,
+                severity=_BREACH_SEVERITIES[bisect_left(_PWN_COUNT_THRESHOLDS, count)],
                 source="hibp",
                 evidence=f"HIBP: {name} ({date})",
                 recommendation="Vérifier l'impact, notifier les utilisateurs, reset des credentials.",
@@ -44,15 +51,17 @@ class LeaksExposureAnalyzer(BaseDomainAnalyzer):
 
         # GitHub secrets
         github_secrets = raw_data.get("github_secrets", [])
-        for secret in github_secrets:
-            findings.append(FindingData(
+        findings.extend(
+            FindingData(
                 domain="D7",
                 title=f"Secret exposé sur GitHub: {secret.get('type', 'API key')}",
                 description=f"Un secret de type {secret.get('type')} a été trouvé dans un repo public.",
                 severity="critical",
                 source="github_scan",
                 recommendation="Révoquer immédiatement le secret et le supprimer du repo.",
-            ))
+            )
+            for secret in github_secrets
+        )
 
         score = self.calculate_score(findings)
         return DomainResult(
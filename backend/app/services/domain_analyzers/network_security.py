@@ -14,6 +14,7 @@ from app.services.domain_analyzers.base import (
 
 RISKY_PORTS = {21, 23, 25, 110, 135, 139, 445, 1433, 1521, 3306, 3389, 5432, 5900}
 EXPECTED_PORTS = {80, 443}
+HIGH_SEVERITY_PORTS = frozenset({3389, 445, 23})
 
 
 class NetworkSecurityAnalyzer(BaseDomainAnalyzer):
@@ -21,14 +22,20 @@ class NetworkSecurityAnalyzer(BaseDomainAnalyzer):
 
     domain_code = "D1"
     domain_name = "Sécurité Réseau"
+    feed_keys = ("open_ports",)
 
     async def analyze(
         self, domain: str, raw_data: dict[str, Any]
     ) -> DomainResult:
         """Analyze network security from Shodan/Censys data."""
+        if not self.has_feed(raw_data):
+            return self.empty_result()
         findings: list[FindingData] = []
         ports = raw_data.get("open_ports", [])
 
+        # One pass over the ports; unencrypted-service findings still come
+        # after every risky-port finding
+        unencrypted: list[FindingData] = []
         for port in ports:
             port_num = port.get("port", 0)
             if port_num in RISKY_PORTS:
@@ -36,24 +43,27 @@ class NetworkSecurityAnalyzer(BaseDomainAnalyzer):
                     domain="D1",
                     title=f"Port risqué ouvert: {port_num}",
                     description=f"Le port {port_num} ({port.get('service', 'inconnu')}) est exposé publiquement.",
-                    severity="high" if port_num in {3389, 445, 23} else "medium",
+                    severity="high" if port_num in HIGH_SEVERITY_PORTS else "medium",
                     source="shodan",
                     evidence=f"Port {port_num} détecté sur {domain}",
                     recommendation=f"Fermer ou restreindre l'accès au port {port_num}.",
                 ))
 
-        # Check for unencrypted services
-        for port in ports:
-            if port.get("transport", "") == "tcp" and not port.get("tls", False):
-                if port.get("port", 0) not in EXPECTED_PORTS:
-                    findings.append(FindingData(
-                        domain="D1",
-                        title=f"Service non chiffré: port {port.get('port')}",
-                        description="Service accessible sans chiffrement TLS.",
-                        severity="medium",
-                        source="censys",
-                        recommendation="Activer TLS sur ce service.",
-                    ))
+            # Check for unencrypted services
+            if (
+                port_num not in EXPECTED_PORTS
+                and port.get("transport", "") == "tcp"
+                and not port.get("tls", False)
+            ):
+                unencrypted.append(FindingData(
+                    domain="D1",
+                    title=f"Service non chiffré: port {port.get('port')}",
+                    description="Service accessible sans chiffrement TLS.",
+                    severity="medium",
+                    source="censys",
+                    recommendation="Activer TLS sur ce service.",
+                ))
+        findings.extend(unencrypted)
 
         score = self.calculate_score(findings)
         return DomainResult(
@@ -4,6 +4,7 @@ Analyzes CVE exposure, known vulnerabilities matching detected
 software versions, and time since patch availability.
 """
 
+from bisect import bisect_right
 from typing import Any
 
 from app.services.domain_analyzers.base import (
@@ -19,32 +20,39 @@ CRITICALITY_FACTORS = {
     "low": 0.5,       # CVSS < 4.0
 }
 
+# A CVSS score at or above the i-th threshold gets severity i + 1
+_CVSS_THRESHOLDS = (4.0, 7.0, 9.0)
+_SEVERITIES = ("low", "medium", "high", "critical")
+
 
 class PatchingCadenceAnalyzer(BaseDomainAnalyzer):
     """D5: Analyzes patching cadence and CVE exposure."""
 
     domain_code = "D5"
     domain_name = "Cadence de Patching"
+    feed_keys = ("cves",)
 
     async def analyze(
         self, domain: str, raw_data: dict[str, Any]
     ) -> DomainResult:
         """Analyze patching cadence from CVE data."""
-        findings: list[FindingData] = []
+        if not self.has_feed(raw_data):
+            return self.empty_result()
         cves = raw_data.get("cves", [])
 
+        findings: list[FindingData] = []
         for cve in cves:
             cvss = cve.get("cvss_score", 0.0)
-            severity = self._cvss_to_severity(cvss)
+            cve_id = cve.get("id", "Unknown")
             findings.append(FindingData(
                 domain="D5",
-                title=f"CVE détectée: {cve.get('id', 'Unknown')}",
+                title=f"CVE détectée: {cve_id}",
                 description=cve.get("description", "Vulnérabilité connue."),
-                severity=severity,
+                severity=_SEVERITIES[bisect_right(_CVSS_THRESHOLDS, cvss)],
                 cvss_score=cvss,
                 source="nvd",
-                evidence=f"CVE: {cve.get('id')} — CVSS: {cvss}",
-                recommendation=f"Appliquer le correctif pour {cve.get('id')}.",
+                evidence=f"CVE: {cve_id} — CVSS: {cvss}",
+                recommendation=f"Appliquer le correctif pour {cve_id}.",
             ))
 
         score = self.calculate_score(findings)
@@ -56,13 +64,3 @@ class PatchingCadenceAnalyzer(BaseDomainAnalyzer):
             findings=findings,
             confidence=0.7,
         )
-
-    @staticmethod
-    def _cvss_to_severity(cvss: float) -> str:
-        if cvss >= 9.0:
-            return "critical"
-        if cvss >= 7.0:
-            return "high"
-        if cvss >= 4.0:
-            return "medium"
-        return "low"
@@ -19,6 +19,7 @@ VALUED_CERTIFICATIONS = {
     "secnumcloud": "SecNumCloud",
     "iso27701": "ISO 27701",
 }
+VALUED_KEYS = frozenset(VALUED_CERTIFICATIONS)
 
 
 class RegulatoryPresenceAnalyzer(BaseDomainAnalyzer):
@@ -26,11 +27,14 @@ class RegulatoryPresenceAnalyzer(BaseDomainAnalyzer):
 
     domain_code = "D8"
     domain_name = "Présence Réglementaire"
+    feed_keys = ("regulatory",)
 
     async def analyze(
         self, domain: str, raw_data: dict[str, Any]
     ) -> DomainResult:
         """Analyze regulatory presence."""
+        if not self.has_feed(raw_data):
+            return self.empty_result()
         findings: list[FindingData] = []
         regulatory = raw_data.get("regulatory", {})
 
@@ -66,8 +70,12 @@ class RegulatoryPresenceAnalyzer(BaseDomainAnalyzer):
             ))
 
         score = self.calculate_score(findings)
-        # Bonus for certifications
-        cert_bonus = min(len(certifications) * 5, 15)
+        # Bonus for valued certifications only, matched on their key
+        # ("ISO 27001" and "iso-27001" both count as iso27001)
+        valued = VALUED_KEYS.intersection(
+            c.lower().replace(" ", "").replace("-", "") for c in certifications
+        )
+        cert_bonus = min(len(valued) * 5, 15)
         score = min(100, score + cert_bonus)
 
         return DomainResult(
@@ -19,17 +19,31 @@ REQUIRED_HEADERS = [
     "Referrer-Policy",
 ]
 
+# Finding of each missing required header, keyed on the lowercased name
+_MISSING_HEADER_FINDINGS = {
+    header.lower(): FindingData(
+        domain="D3", title=f"Header manquant: {header}",
+        description=f"L'en-tête de sécurité {header} n'est pas défini.",
+        severity="medium", source="http_headers",
+        recommendation=f"Ajouter l'en-tête {header}.",
+    )
+    for header in REQUIRED_HEADERS
+}
+
 
 class WebSecurityAnalyzer(BaseDomainAnalyzer):
     """D3: Analyzes web security headers and TLS configuration."""
 
     domain_code = "D3"
     domain_name = "Sécurité Web"
+    feed_keys = ("ssl", "http_headers")
 
     async def analyze(
         self, domain: str, raw_data: dict[str, Any]
     ) -> DomainResult:
         """Analyze web security posture."""
+        if not self.has_feed(raw_data):
+            return self.empty_result()
         findings: list[FindingData] = []
         ssl_data = raw_data.get("ssl", {})
         headers = raw_data.get("http_headers", {})
@@ -68,15 +82,13 @@ class WebSecurityAnalyzer(BaseDomainAnalyzer):
                 recommendation="Renouveler le certificat rapidement.",
             ))
 
-        # Security headers check
-        for header in REQUIRED_HEADERS:
-            if header.lower() not in {h.lower() for h in headers.keys()}:
-                findings.append(FindingData(
-                    domain="D3", title=f"Header manquant: {header}",
-                    description=f"L'en-tête de sécurité {header} n'est pas défini.",
-                    severity="medium", source="http_headers",
-                    recommendation=f"Ajouter l'en-tête {header}.",
-                ))
+        # Security headers check (header names are case-insensitive)
+        present = {h.lower() for h in headers}
+        findings.extend(
+            finding
+            for header, finding in _MISSING_HEADER_FINDINGS.items()
+            if header not in present
+        )
 
         score = self.calculate_score(findings)
         return DomainResult(
@@ -1,20 +1,27 @@
 """GRC Service — manages security controls, framework mappings, and maturity."""
 
 import logging
-from collections import defaultdict
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import func, select
+from pydantic_core import to_json
+from sqlalchemy import Float, Numeric, case, cast, func, select
+from sqlalchemy.dialects.postgresql import array_agg
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 
+from app.cache import get_or_set
+from app.models.compliance_dashboard import ComplianceDashboardMV
 from app.models.grc import FrameworkMapping, MaturityAssessment, SecurityControl
 
 logger = logging.getLogger("cyberscore.services.grc")
 
 FRAMEWORKS = ["iso27001", "dora", "nis2", "hds", "rgpd"]
 
+# Cached framework coverage summaries are dropped whenever the compliance
+# dashboard view is refreshed; the TTL bounds staleness if that fails
+COVERAGE_CACHE_TTL = 60
+
 GRC_DOMAINS = [
     "access_control",
     "network_security",
@@ -31,6 +38,11 @@ GRC_DOMAINS = [
 ]
 
 
+def coverage_cache_key(framework: str) -> str:
+    """Redis key of the cached coverage summary of ``framework``."""
+    return f"fwcov:{framework}"
+
+
 class GRCService:
     """Service layer for GRC/PSSI management."""
 
@@ -53,9 +65,25 @@ class GRCService:
         Returns:
             List of control dicts.
         """
+        # One row per control, with its mapped frameworks aggregated into an
+        # array server-side instead of loaded as ORM objects
         query = (
-            select(SecurityControl)
-            .options(selectinload(SecurityControl.framework_mappings))
+            select(
+                SecurityControl.id,
+                SecurityControl.reference,
+                SecurityControl.title,
+                SecurityControl.description,
+                SecurityControl.domain,
+                SecurityControl.status,
+                SecurityControl.owner,
+                SecurityControl.evidence_url,
+                SecurityControl.last_assessed,
+                array_agg(FrameworkMapping.framework)
+                .filter(FrameworkMapping.framework.is_not(None))
+                .label("frameworks"),
+            )
+            .outerjoin(SecurityControl.framework_mappings)
+            .group_by(SecurityControl.id)
             .order_by(SecurityControl.reference)
         )
 
@@ -64,13 +92,11 @@ class GRCService:
         if status:
             query = query.where(SecurityControl.status == status)
         if framework:
-            query = query.join(SecurityControl.framework_mappings).where(
-                FrameworkMapping.framework == framework
-            )
+            # Filtered on the group, so the other frameworks of a matching
+            # control are still listed
+            query = query.having(func.bool_or(FrameworkMapping.framework == framework))
 
         result = await self.db.execute(query)
-        controls = result.scalars().unique().all()
-
         return [
             {
                 "id": c.id,
@@ -81,10 +107,10 @@ class GRCService:
                 "status": c.status,
                 "owner": c.owner,
                 "evidence_url": c.evidence_url,
-                "last_assessed": c.last_assessed.isoformat() if c.last_assessed else None,
-                "frameworks": [m.framework for m in c.framework_mappings],
+                "last_assessed": c.last_assessed,
+                "frameworks": c.frameworks or [],
             }
-            for c in controls
+            for c in result
         ]
 
     async def update_control(
@@ -117,7 +143,8 @@ class GRCService:
         if "evidence_url" in updates:
             control.evidence_url = updates["evidence_url"]
 
-        control.last_assessed = datetime.now(timezone.utc)
+        assessed_at = datetime.now(timezone.utc)
+        control.last_assessed = assessed_at
         await self.db.flush()
 
         return {
@@ -129,7 +156,7 @@ class GRCService:
             "status": control.status,
             "owner": control.owner,
             "evidence_url": control.evidence_url,
-            "last_assessed": control.last_assessed.isoformat(),
+            "last_assessed": assessed_at,
             "frameworks": [m.framework for m in control.framework_mappings],
         }
 
@@ -139,11 +166,17 @@ class GRCService:
         Returns:
             Dict with overall score and per-domain breakdown.
         """
+        # The overall maturity is the average of every assessment, computed
+        # in the same query with window sums over the per-domain groups
         result = await self.db.execute(
             select(
                 SecurityControl.domain,
                 func.avg(MaturityAssessment.level).label("avg_level"),
                 func.count(MaturityAssessment.id).label("assessment_count"),
+                (
+                    func.sum(func.sum(MaturityAssessment.level)).over()
+                    / func.sum(func.count(MaturityAssessment.level)).over()
+                ).label("overall_level"),
             )
             .join(
                 MaturityAssessment,
@@ -153,24 +186,19 @@ class GRCService:
         )
         rows = result.all()
 
-        domains = {}
-        total_score = 0.0
-        count = 0
-        for row in rows:
-            avg = float(row.avg_level) if row.avg_level else 0.0
-            domains[row.domain] = {
-                "average_level": round(avg, 2),
+        domains = {
+            row.domain: {
+                "average_level": round(float(row.avg_level), 2) if row.avg_level else 0.0,
                 "assessment_count": row.assessment_count,
             }
-            total_score += avg
-            count += 1
-
-        overall = round(total_score / count, 2) if count > 0 else 0.0
+            for row in rows
+        }
+        overall = round(float(rows[0].overall_level), 2) if rows else 0.0
 
         return {
             "overall_maturity": overall,
             "domains": domains,
-            "domain_count": count,
+            "domain_count": len(rows),
         }
 
     async def get_coverage_by_framework(
@@ -178,6 +206,9 @@ class GRCService:
     ) -> dict[str, Any]:
         """Get implementation coverage for a specific framework.
 
+        Read from the ``compliance_dashboard`` view, refreshed at most every
+        30 seconds after a GRC change.
+
         Args:
             framework: Framework name (iso27001, dora, nis2, hds, rgpd).
 
@@ -185,20 +216,18 @@ class GRCService:
             Coverage summary dict.
         """
         result = await self.db.execute(
-            select(SecurityControl.status, func.count(SecurityControl.id))
-            .join(
-                FrameworkMapping,
-                FrameworkMapping.control_id == SecurityControl.id,
-            )
-            .where(FrameworkMapping.framework == framework)
-            .group_by(SecurityControl.status)
+            select(
+                func.coalesce(func.sum(ComplianceDashboardMV.implemented), 0),
+                func.coalesce(func.sum(ComplianceDashboardMV.partial), 0),
+                func.coalesce(func.sum(ComplianceDashboardMV.not_implemented), 0),
+            ).where(ComplianceDashboardMV.framework == framework)
         )
-        rows = result.all()
-
-        counts = {"implemented": 0, "partial": 0, "not_implemented": 0}
-        for row in rows:
-            if row[0] in counts:
-                counts[row[0]] = row[1]
+        implemented, partial, not_implemented = result.one()
+        counts = {
+            "implemented": int(implemented),
+            "partial": int(partial),
+            "not_implemented": int(not_implemented),
+        }
 
         total = sum(counts.values())
         coverage_pct = (
@@ -216,65 +245,64 @@ class GRCService:
             "coverage_percent": coverage_pct,
         }
 
+    async def get_coverage_json(self, framework: str) -> bytes:
+        """Return the coverage summary of a framework as JSON bytes.
+
+        Served from the shared Redis cache for up to ``COVERAGE_CACHE_TTL``
+        seconds.
+
+        Args:
+            framework: Framework name (iso27001, dora, nis2, hds, rgpd).
+
+        Returns:
+            JSON-encoded coverage summary.
+        """
+
+        async def compute() -> bytes:
+            return to_json(await self.get_coverage_by_framework(framework))
+
+        return await get_or_set(coverage_cache_key(framework), COVERAGE_CACHE_TTL, compute)
+
     async def get_heatmap_data(self) -> list[dict[str, Any]]:
         """Generate heatmap data: domain x framework coverage matrix.
 
+        Read from the ``compliance_dashboard`` view, like the coverage summary.
+        Coverage and status are computed in the same query, so the cells come
+        back ready to serialize.
+
         Returns:
             List of heatmap cells.
         """
+        mv = ComplianceDashboardMV
+        # (implemented + 0.5 * partial) / total as a percentage; round() to a
+        # number of digits needs numeric in PostgreSQL
+        coverage = cast(
+            func.coalesce(
+                func.round(
+                    cast((mv.implemented * 2 + mv.partial) * 50, Numeric)
+                    / func.nullif(mv.implemented + mv.partial + mv.not_implemented, 0),
+                    1,
+                ),
+                0,
+            ),
+            Float,
+        )
         result = await self.db.execute(
             select(
-                SecurityControl.domain,
-                FrameworkMapping.framework,
-                SecurityControl.status,
-                func.count(SecurityControl.id).label("cnt"),
-            )
-            .join(
-                FrameworkMapping,
-                FrameworkMapping.control_id == SecurityControl.id,
-            )
-            .group_by(
-                SecurityControl.domain,
-                FrameworkMapping.framework,
-                SecurityControl.status,
+                mv.domain,
+                mv.framework,
+                coverage.label("coverage_percent"),
+                case(
+                    (coverage >= 75, "good"),
+                    (coverage >= 40, "warning"),
+                    else_="critical",
+                ).label("status"),
+                cast(func.round(cast(mv.avg_maturity, Numeric), 2), Float).label(
+                    "avg_maturity"
+                ),
             )
         )
-        rows = result.all()
-
-        # Aggregate by (domain, framework)
-        matrix: dict[tuple[str, str], dict[str, int]] = defaultdict(
-            lambda: {"implemented": 0, "partial": 0, "not_implemented": 0}
-        )
-        for row in rows:
-            key = (row.domain, row.framework)
-            if row.status in matrix[key]:
-                matrix[key][row.status] = row.cnt
-
-        cells = []
-        for (domain, framework), counts in matrix.items():
-            total = sum(counts.values())
-            coverage = (
-                round(
-                    (counts["implemented"] + counts["partial"] * 0.5) / total * 100, 1
-                )
-                if total > 0
-                else 0.0
-            )
-            if coverage >= 75:
-                cell_status = "good"
-            elif coverage >= 40:
-                cell_status = "warning"
-            else:
-                cell_status = "critical"
-
-            cells.append({
-                "domain": domain,
-                "framework": framework,
-                "coverage_percent": coverage,
-                "status": cell_status,
-            })
-
-        return cells
+        return [dict(row) for row in result.mappings()]
 
     async def map_control_to_frameworks(
         self,
@@ -290,19 +318,20 @@ class GRCService:
         Returns:
             List of created mapping dicts.
         """
-        created = []
-        for m in mappings:
-            mapping = FrameworkMapping(
+        # ORM objects rather than a Core INSERT, so that the mapper events
+        # marking the compliance dashboard stale fire; the flush still sends
+        # them as one batched INSERT ... RETURNING
+        self.db.add_all(
+            FrameworkMapping(
                 control_id=control_id,
                 framework=m["framework"],
                 framework_ref=m["framework_ref"],
                 description=m.get("description"),
             )
-            self.db.add(mapping)
-            created.append({
-                "framework": mapping.framework,
-                "framework_ref": mapping.framework_ref,
-            })
-
+            for m in mappings
+        )
         await self.db.flush()
-        return created
+        return [
+            {"framework": m["framework"], "framework_ref": m["framework_ref"]}
+            for m in mappings
+        ]
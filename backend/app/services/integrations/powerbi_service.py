@@ -1,17 +1,159 @@
 """Power BI integration service — tabular dataset with OData-like query support."""
 
+import hashlib
 import logging
+import operator
 import re
+from collections.abc import Callable
+from dataclasses import dataclass
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import ColumnElement, Float, String, cast, event, false, func, literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import object_session
 
+from app.database import run_after_commit
 from app.models.scoring import Finding, VendorScore
 from app.models.vendor import Vendor
+from app.ttl_cache import TTLCache
 
 logger = logging.getLogger("cyberscore.services.powerbi")
 
+DATASET_CACHE_SIZE = 256
+DATASET_CACHE_TTL = 30.0  # seconds
+
+# (data version, conditions, $select fields, (orderby field, descending), $top)
+_DatasetKey = tuple[
+    int, tuple[tuple[str, str, str], ...], tuple[str, ...], tuple[str, bool] | None, int | None
+]
+
+# Datasets by canonical query. Dashboards refresh the same queries every few
+# seconds. Cached datasets are shared and must not be mutated.
+_dataset_cache: TTLCache[_DatasetKey, dict[str, Any]] = TTLCache(
+    DATASET_CACHE_SIZE, DATASET_CACHE_TTL
+)
+
+
+@dataclass(slots=True)
+class _DataVersion:
+    """Version of the source data, part of every dataset cache key.
+
+    Bumping it retires all the cached datasets, and keeps a dataset built
+    from the previous data from being cached under it.
+    """
+
+    value: int = 0
+
+
+_data_version = _DataVersion()
+
+
+def invalidate_dataset_cache() -> None:
+    """Retire every cached dataset, e.g. after a bulk write to the source tables.
+
+    Call it once the write is committed (see ``run_after_commit``).
+    """
+    _data_version.value += 1
+    _dataset_cache.clear()
+
+
+def _on_source_write(_mapper: object, _connection: object, target: object) -> None:
+    """Invalidate the cached datasets once a flushed write to a source row commits.
+
+    Core bulk statements bypass these events and invalidate the cache
+    themselves, as the bulk vendor import does.
+    """
+    run_after_commit(object_session(target), invalidate_dataset_cache)
+
+
+for _target, _events in (
+    (Vendor, ("after_insert", "after_update", "after_delete")),
+    (VendorScore, ("after_insert",)),
+    (Finding, ("after_insert", "after_update", "after_delete")),
+):
+    for _event in _events:
+        event.listen(_target, _event, _on_source_write)
+
+
+# OData-like $filter syntax: conditions joined by "and", each "field op value"
+_AND_SPLIT = re.compile(r"\s+and\s+", re.IGNORECASE)
+_CONDITION_RE = re.compile(
+    r"(\w+)\s+(eq|ne|gt|lt|ge|le)\s+['\"]?([^'\"]+)['\"]?", re.IGNORECASE
+)
+
+_SEVERITY_COLUMNS = ("critical", "high", "medium", "low")
+
+# Open findings per vendor, counted per severity in one grouped scan
+_OPEN_FINDING_COUNTS = (
+    select(
+        Finding.vendor_id,
+        *(func.count().filter(Finding.severity == sev).label(sev) for sev in _SEVERITY_COLUMNS),
+        func.count().label("total"),
+    )
+    .where(Finding.status == "open")
+    .group_by(Finding.vendor_id)
+    .subquery("open_findings")
+)
+
+# Domain scores of the vendor's latest score; the global score and grade come
+# from the denormalized latest_* columns of the vendor itself
+_LATEST_DOMAIN_SCORES = (
+    select(VendorScore.domain_scores)
+    .where(VendorScore.vendor_id == Vendor.id)
+    .order_by(VendorScore.scanned_at.desc())
+    .limit(1)
+    .scalar_subquery()
+)
+
+_DATASET_COLUMNS = (
+    Vendor.id.label("vendor_id"),
+    Vendor.name.label("vendor_name"),
+    Vendor.domain,
+    Vendor.tier,
+    Vendor.industry,
+    Vendor.country,
+    Vendor.status,
+    Vendor.latest_score.label("global_score"),
+    Vendor.latest_grade.label("grade"),
+    Vendor.latest_scored_at.label("scanned_at"),
+    *(
+        func.coalesce(_OPEN_FINDING_COUNTS.c[sev], 0).label(f"findings_{sev}")
+        for sev in (*_SEVERITY_COLUMNS, "total")
+    ),
+    _LATEST_DOMAIN_SCORES.label("domain_scores"),
+)
+
+# Dataset fields that $filter and $orderby translate to SQL, by comparison
+# kind. Text columns are compared as plain text, like the Python filter does:
+# case-sensitively and without enum or UUID input checks.
+_TEXT_FIELDS: dict[str, ColumnElement[Any]] = {
+    "vendor_id": cast(Vendor.id, String),
+    "vendor_name": Vendor.name,
+    "domain": cast(Vendor.domain, String),
+    "industry": func.coalesce(Vendor.industry, ""),
+    "country": func.coalesce(Vendor.country, ""),
+    "status": cast(Vendor.status, String),
+    "grade": Vendor.latest_grade,
+}
+_NUMERIC_FIELDS: dict[str, ColumnElement[Any]] = {
+    "tier": Vendor.tier,
+    "global_score": Vendor.latest_score,
+    **{
+        f"findings_{sev}": func.coalesce(_OPEN_FINDING_COUNTS.c[sev], 0)
+        for sev in (*_SEVERITY_COLUMNS, "total")
+    },
+}
+# scanned_at is rendered as an ISO string, so it sorts in SQL but is filtered
+# in Python; so are the per-domain score_* columns
+_ORDERABLE_FIELDS = {**_TEXT_FIELDS, **_NUMERIC_FIELDS, "scanned_at": Vendor.latest_scored_at}
+
+# Applied to SQL columns and, for the conditions evaluated in Python, to values
+_OPERATORS: dict[str, Callable[[Any, Any], Any]] = {
+    "eq": operator.eq, "ne": operator.ne,
+    "gt": operator.gt, "lt": operator.lt,
+    "ge": operator.ge, "le": operator.le,
+}
+
 
 class PowerBIService:
     """Provides scoring data in Power BI-compatible tabular format with OData-like queries."""
@@ -34,6 +176,10 @@ class PowerBIService:
             ?$orderby=global_score desc
             ?$top=50
 
+        Results are cached for ``DATASET_CACHE_TTL`` seconds under the
+        canonical form of the query, so equivalent queries (same conditions
+        in another order, different spacing or operator case) share an entry.
+
         Args:
             filter_expr: OData-like filter string.
             select_fields: Comma-separated field names.
@@ -43,131 +189,205 @@ class PowerBIService:
         Returns:
             Dict with 'columns', 'rows', and 'metadata'.
         """
-        # Fetch all active vendors with their latest score
-        vendor_q = select(Vendor).where(Vendor.status == "active")
-        vendor_result = await self._db.execute(vendor_q)
-        vendors = vendor_result.scalars().all()
-
-        score_q = select(VendorScore).order_by(VendorScore.scanned_at.desc())
-        score_result = await self._db.execute(score_q)
-        scores = score_result.scalars().all()
-
-        # Map latest score per vendor
-        score_map: dict[str, VendorScore] = {}
-        for s in scores:
-            if s.vendor_id not in score_map:
-                score_map[s.vendor_id] = s
-
-        # Count findings per vendor
-        finding_q = select(Finding).where(Finding.status == "open")
-        finding_result = await self._db.execute(finding_q)
-        findings = finding_result.scalars().all()
-        finding_counts: dict[str, dict[str, int]] = {}
-        for f in findings:
-            counts = finding_counts.setdefault(f.vendor_id, {
-                "critical": 0, "high": 0, "medium": 0, "low": 0, "total": 0,
-            })
-            counts[f.severity] = counts.get(f.severity, 0) + 1
-            counts["total"] += 1
-
-        # Build tabular rows
-        all_rows: list[dict[str, Any]] = []
-        for v in vendors:
-            sc = score_map.get(v.id)
-            fc = finding_counts.get(v.id, {})
-            domain_scores = sc.domain_scores if sc else {}
+        conditions = self._parse_filter(filter_expr)
+        order_parts = orderby.split() if orderby else []
+        # Field names stay case-sensitive, and $select keeps its order: it is
+        # the column order of the result
+        key: _DatasetKey = (
+            _data_version.value,
+            tuple(sorted(set(conditions))),
+            tuple(f.strip() for f in select_fields.split(",")) if select_fields else (),
+            (
+                (order_parts[0], len(order_parts) > 1 and order_parts[1].lower() == "desc")
+                if order_parts else None
+            ),
+            top or None,
+        )
+        cached = _dataset_cache.get(key)
+        if cached is not None:
+            return cached
+
+        dataset = await self._build_dataset(conditions, select_fields, orderby, top)
+        dataset["metadata"]["cache_key"] = hashlib.blake2b(
+            repr(key[1:]).encode(), digest_size=8
+        ).hexdigest()
+
+        _dataset_cache.put(key, dataset)
+        return dataset
+
+    async def _build_dataset(
+        self,
+        conditions: list[tuple[str, str, str]],
+        select_fields: str | None,
+        orderby: str | None,
+        top: int | None,
+    ) -> dict[str, Any]:
+        """Query the dataset for parsed filter conditions and the other options.
+
+        Conditions and orderings on vendor, score and finding-count fields run
+        in SQL, along with $top when nothing is left for Python to filter or
+        sort, so only the requested rows are read.
+        """
+        query = (
+            select(*_DATASET_COLUMNS)
+            .outerjoin(_OPEN_FINDING_COUNTS, _OPEN_FINDING_COUNTS.c.vendor_id == Vendor.id)
+            .where(Vendor.status == "active")
+        )
 
+        residual: list[tuple[str, str, str]] = []
+        for field, op, value in conditions:
+            condition = self._sql_condition(field, op, value)
+            if condition is None:
+                residual.append((field, op, value))
+            else:
+                query = query.where(condition)
+
+        sorted_in_sql = True
+        if orderby:
+            parts = orderby.strip().split()
+            column = _ORDERABLE_FIELDS.get(parts[0])
+            if column is None:
+                sorted_in_sql = False
+            else:
+                # Nulls sort as the largest value, as in _apply_orderby
+                desc = len(parts) > 1 and parts[1].lower() == "desc"
+                query = query.order_by(
+                    column.desc().nulls_first() if desc else column.asc().nulls_last()
+                )
+
+        limited_in_sql = bool(top) and not residual and sorted_in_sql
+        if limited_in_sql:
+            query = query.limit(top)
+
+        result = await self._db.execute(query)
+        rows: list[dict[str, Any]] = []
+        for r in result:
             row: dict[str, Any] = {
-                "vendor_id": v.id,
-                "vendor_name": v.name,
-                "domain": v.domain,
-                "tier": v.tier,
-                "industry": v.industry or "",
-                "country": v.country or "",
-                "status": v.status,
-                "global_score": sc.global_score if sc else None,
-                "grade": sc.grade if sc else None,
-                "scanned_at": sc.scanned_at.isoformat() if sc and sc.scanned_at else None,
-                "findings_critical": fc.get("critical", 0),
-                "findings_high": fc.get("high", 0),
-                "findings_medium": fc.get("medium", 0),
-                "findings_low": fc.get("low", 0),
-                "findings_total": fc.get("total", 0),
+                "vendor_id": r.vendor_id,
+                "vendor_name": r.vendor_name,
+                "domain": r.domain,
+                "tier": r.tier,
+                "industry": r.industry or "",
+                "country": r.country or "",
+                "status": r.status,
+                "global_score": r.global_score,
+                "grade": r.grade,
+                "scanned_at": r.scanned_at.isoformat() if r.scanned_at else None,
+                "findings_critical": r.findings_critical,
+                "findings_high": r.findings_high,
+                "findings_medium": r.findings_medium,
+                "findings_low": r.findings_low,
+                "findings_total": r.findings_total,
             }
             # Add domain scores as separate columns
-            for d_name, d_val in domain_scores.items():
+            for d_name, d_val in (r.domain_scores or {}).items():
                 row[f"score_{d_name}"] = d_val
+            rows.append(row)
 
-            all_rows.append(row)
-
-        # Apply OData-like filters
-        rows = self._apply_filter(all_rows, filter_expr)
-        rows = self._apply_orderby(rows, orderby)
-        if top:
+        # Whatever SQL could not express is applied to the fetched rows
+        rows = self._apply_filter(rows, residual)
+        if not sorted_in_sql:
+            rows = self._apply_orderby(rows, orderby)
+        if top and not limited_in_sql:
             rows = rows[:top]
         rows = self._apply_select(rows, select_fields)
 
         columns = list(rows[0].keys()) if rows else []
 
+        total_vendors = await self._db.scalar(
+            select(func.count()).select_from(Vendor).where(Vendor.status == "active")
+        )
+
         return {
             "columns": columns,
             "rows": rows,
             "metadata": {
                 "total_rows": len(rows),
-                "total_vendors": len(vendors),
+                "total_vendors": total_vendors,
                 "format": "tabular",
                 "odata_supported": ["$filter", "$select", "$orderby", "$top"],
             },
         }
 
     @staticmethod
-    def _apply_filter(
-        rows: list[dict[str, Any]], filter_expr: str | None
-    ) -> list[dict[str, Any]]:
-        """Apply a simple OData-like filter expression.
+    def _parse_filter(filter_expr: str | None) -> list[tuple[str, str, str]]:
+        """Parse an OData-like filter into (field, operator, value) conditions.
 
         Supports: field eq 'value', field gt N, field lt N, field ge N, field le N.
-        Multiple conditions with 'and'.
+        Multiple conditions with 'and'; conditions that do not parse are ignored.
         """
         if not filter_expr:
-            return rows
+            return []
+
+        conditions: list[tuple[str, str, str]] = []
+        for cond in _AND_SPLIT.split(filter_expr):
+            match = _CONDITION_RE.match(cond.strip())
+            if match:
+                conditions.append((match.group(1), match.group(2).lower(), match.group(3)))
+        return conditions
+
+    @staticmethod
+    def _sql_condition(field: str, op: str, value: str) -> ColumnElement[bool] | None:
+        """Translate a filter condition to SQL, or None if it must run in Python.
+
+        Mirrors ``_compile_condition``: numeric fields compare numerically when the
+        value is a number, otherwise only ``ne`` can hold (for any non-null
+        value); text fields support ``eq`` and ``ne`` only.
+        """
+        if field in _NUMERIC_FIELDS:
+            column = _NUMERIC_FIELDS[field]
+            try:
+                number = float(value)
+            except ValueError:
+                return column.is_not(None) if op == "ne" else false()
+            return _OPERATORS[op](column, literal(number, Float))
+        if field in _TEXT_FIELDS:
+            if op not in ("eq", "ne"):
+                return false()
+            return _OPERATORS[op](_TEXT_FIELDS[field], value)
+        return None
+
+    @staticmethod
+    def _compile_condition(field: str, op: str, value: str) -> Callable[[dict[str, Any]], bool]:
+        """Build the row predicate of a parsed filter condition.
 
-        conditions = re.split(r"\s+and\s+", filter_expr, flags=re.IGNORECASE)
-        filtered = rows
-
-        for cond in conditions:
-            cond = cond.strip()
-            match = re.match(
-                r"(\w+)\s+(eq|ne|gt|lt|ge|le)\s+['\"]?([^'\"]+)['\"]?",
-                cond, re.IGNORECASE,
-            )
-            if not match:
-                continue
-
-            field, op, value = match.group(1), match.group(2).lower(), match.group(3)
-
-            def _matches(row: dict[str, Any], f: str = field, o: str = op, v: str = value) -> bool:
-                rv = row.get(f)
-                if rv is None:
-                    return False
-                # Try numeric comparison
-                try:
-                    rv_num = float(rv)
-                    v_num = float(v)
-                    ops = {"eq": rv_num == v_num, "ne": rv_num != v_num,
-                           "gt": rv_num > v_num, "lt": rv_num < v_num,
-                           "ge": rv_num >= v_num, "le": rv_num <= v_num}
-                    return ops.get(o, False)
-                except (ValueError, TypeError):
-                    pass
-                # String comparison
-                rv_str = str(rv)
-                ops_str = {"eq": rv_str == v, "ne": rv_str != v}
-                return ops_str.get(o, False)
-
-            filtered = [r for r in filtered if _matches(r)]
-
-        return filtered
+        Rows whose value is null never match. When both sides are numbers the
+        comparison is numeric; otherwise only ``eq`` and ``ne`` apply, to the
+        string form of the row value.
+        """
+        compare = _OPERATORS[op]
+        string_op = op in ("eq", "ne")
+        try:
+            number = float(value)
+        except ValueError:
+            if not string_op:
+                return lambda _row: False
+            return lambda row: (rv := row.get(field)) is not None and compare(str(rv), value)
+
+        def _matches(row: dict[str, Any]) -> bool:
+            rv = row.get(field)
+            if rv is None:
+                return False
+            if isinstance(rv, (int, float)):
+                return compare(rv, number)
+            # Rare path: a non-numeric value, such as the scanned_at string
+            try:
+                return compare(float(rv), number)
+            except (ValueError, TypeError):
+                return string_op and compare(str(rv), value)
+
+        return _matches
+
+    @classmethod
+    def _apply_filter(
+        cls, rows: list[dict[str, Any]], conditions: list[tuple[str, str, str]]
+    ) -> list[dict[str, Any]]:
+        """Keep the rows matching every parsed filter condition."""
+        if not conditions:
+            return rows
+        # Each condition is resolved once, not re-parsed for every row
+        predicates = [cls._compile_condition(*condition) for condition in conditions]
+        return [row for row in rows if all(matches(row) for matches in predicates)]
 
     @staticmethod
     def _apply_orderby(
@@ -0,0 +1,70 @@
+"""Internal Finding Service — bulk persistence of internal scan findings."""
+
+import logging
+from typing import Any
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.internal_scoring import InternalFinding
+
+logger = logging.getLogger("cyberscore.services.internal_finding")
+
+# Above this many findings, COPY beats a batched INSERT: the rows are streamed
+# with a single permission and type check instead of bound as parameters
+COPY_THRESHOLD = 500
+
+# status has no server default, so COPY sets it explicitly
+_COPY_COLUMNS = (
+    "scan_id", "category", "title", "description", "severity", "recommendation", "status",
+)
+
+
+async def insert_internal_findings(db: AsyncSession, findings: list[dict[str, Any]]) -> None:
+    """Insert the findings of a scan in the session's transaction.
+
+    Large batches go through COPY on psycopg and asyncpg connections when
+    ``settings.findings_copy_enabled`` is set. COPY skips SQLAlchemy entirely,
+    so no ORM or Core event fires for those rows.
+
+    Args:
+        db: Session whose transaction receives the rows.
+        findings: Column values with the keys of ``_COPY_COLUMNS`` except
+            ``status``.
+    """
+    if not findings:
+        return
+
+    conn = await db.connection()
+    driver = conn.dialect.driver
+    if (
+        settings.findings_copy_enabled
+        and len(findings) > COPY_THRESHOLD
+        and driver in ("psycopg", "asyncpg")
+    ):
+        records = [
+            (
+                f["scan_id"], f["category"], f["title"], f["description"],
+                f["severity"], f["recommendation"], "open",
+            )
+            for f in findings
+        ]
+        raw = (await conn.get_raw_connection()).driver_connection
+        if driver == "asyncpg":
+            await raw.copy_records_to_table(
+                InternalFinding.__tablename__, records=records, columns=_COPY_COLUMNS
+            )
+        else:
+            copy_sql = (
+                f"COPY {InternalFinding.__tablename__} ({', '.join(_COPY_COLUMNS)}) "
+                "FROM STDIN"
+            )
+            async with raw.cursor() as cursor, cursor.copy(copy_sql) as copy:
+                for record in records:
+                    await copy.write_row(record)
+        logger.debug("Copied %d internal findings", len(records))
+        return
+
+    # One batched multi-row INSERT instead of a statement per finding
+    await db.execute(insert(InternalFinding), findings)
@@ -0,0 +1,152 @@
+"""LLM Config Service — lookup and caching of the active LLM configuration.
+
+The active configuration is read on every LLM call but changes only when an
+admin saves a new one. Inside the API process it is cached and invalidated
+by a ``LISTEN llm_config_changed`` connection, fed by a statement-level
+trigger on ``llm_configs``. Processes that do not run the listener (Celery
+workers, scripts) always read through to the database.
+
+The API key is decrypted when the snapshot is taken, so a cached snapshot
+costs no decryption per LLM call.
+"""
+
+import asyncio
+import base64
+import logging
+from dataclasses import dataclass, field
+
+import psycopg
+from sqlalchemy import lambda_stmt, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.config import settings
+from app.models.llm_config import LLMConfig
+from app.utils.crypto import decrypt_data
+
+logger = logging.getLogger("cyberscore.services.llm_config")
+
+NOTIFY_CHANNEL = "llm_config_changed"
+_RECONNECT_DELAY = 5.0
+
+# Hit on every LLM call: as a lambda statement the SELECT is built and its
+# cache key computed once, then served from the compiled cache.
+_ACTIVE_CONFIG_STMT = lambda_stmt(
+    lambda: select(LLMConfig).where(LLMConfig.is_active.is_(True)).limit(1)
+)
+
+
+@dataclass(frozen=True, slots=True)
+class ActiveLLMConfig:
+    """Session-independent snapshot of the active LLM configuration."""
+
+    provider: str
+    model_name: str
+    api_key: str | None = field(repr=False)
+    api_base_url: str | None
+
+
+_UNSET = object()
+
+
+@dataclass(slots=True)
+class _ConfigCache:
+    """In-process cache of the active configuration."""
+
+    # Snapshot of the active configuration, or _UNSET until looked up
+    value: ActiveLLMConfig | object | None = _UNSET
+    # Bumped on every invalidation
+    generation: int = 0
+    # Whether the LISTEN connection is up; the cache is only used while it is
+    listening: bool = False
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+_cache = _ConfigCache()
+
+
+async def get_active_llm_config(db: AsyncSession) -> LLMConfig | None:
+    """Return the active LLM configuration row, or None if none is active.
+
+    Args:
+        db: Async database session.
+
+    Returns:
+        The active LLMConfig, or None.
+    """
+    result = await db.execute(_ACTIVE_CONFIG_STMT)
+    return result.scalar_one_or_none()
+
+
+async def get_cached_llm_config(db: AsyncSession) -> ActiveLLMConfig | None:
+    """Return the active LLM configuration, from the in-process cache if valid.
+
+    Args:
+        db: Async database session, used only on a cache miss.
+
+    Returns:
+        Snapshot of the active configuration, or None if none is active.
+    """
+    if not _cache.listening:
+        return _snapshot(await get_active_llm_config(db))
+    if _cache.value is not _UNSET:
+        return _cache.value
+
+    async with _cache.lock:
+        if _cache.value is _UNSET:
+            generation = _cache.generation
+            snapshot = _snapshot(await get_active_llm_config(db))
+            # Do not store a value read before a concurrent invalidation
+            if generation == _cache.generation:
+                _cache.value = snapshot
+            return snapshot
+        return _cache.value
+
+
+def invalidate_llm_config_cache() -> None:
+    """Drop the cached configuration so the next lookup reads the database."""
+    _cache.generation += 1
+    _cache.value = _UNSET
+
+
+async def listen_for_llm_config_changes() -> None:
+    """Invalidate the cache on every ``llm_config_changed`` notification.
+
+    Runs until cancelled, reconnecting after connection failures. The cache
+    is only used while the LISTEN connection is up.
+    """
+    url = make_url(settings.database_url)
+    if url.get_backend_name() != "postgresql":
+        return
+    conninfo = url.set(drivername="postgresql").render_as_string(hide_password=False)
+
+    while True:
+        try:
+            async with await psycopg.AsyncConnection.connect(
+                conninfo, autocommit=True
+            ) as conn:
+                await conn.execute(f"LISTEN {NOTIFY_CHANNEL}")
+                invalidate_llm_config_cache()
+                _cache.listening = True
+                async for _notify in conn.notifies():
+                    invalidate_llm_config_cache()
+        except (psycopg.Error, OSError) as exc:
+            logger.warning("LLM config listener disconnected: %s", exc)
+        finally:
+            _cache.listening = False
+            invalidate_llm_config_cache()
+        await asyncio.sleep(_RECONNECT_DELAY)
+
+
+def _snapshot(cfg: LLMConfig | None) -> ActiveLLMConfig | None:
+    if cfg is None:
+        return None
+    api_key = None
+    if cfg.api_key_encrypted and settings.encryption_key:
+        api_key = decrypt_data(cfg.api_key_encrypted, base64.b64decode(settings.encryption_key))
+    return ActiveLLMConfig(
+        provider=cfg.provider,
+        model_name=cfg.model_name,
+        api_key=api_key,
+        api_base_url=cfg.api_base_url,
+    )
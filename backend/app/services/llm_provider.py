@@ -61,6 +61,20 @@ class BaseLLMProvider(ABC):
             List of floats representing the embedding vector.
         """
 
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embedding vectors for several texts.
+
+        Providers with a list-input embedding endpoint override this to make
+        one HTTP call per batch; the default embeds the texts one by one.
+
+        Args:
+            texts: Input texts to embed.
+
+        Returns:
+            One embedding vector per input text, in the same order.
+        """
+        return [await self.embed(text) for text in texts]
+
     def get_model_info(self) -> dict[str, Any]:
         """Return metadata about the current provider and model."""
         return {
@@ -99,6 +113,9 @@ class MistralProvider(BaseLLMProvider):
         return data["choices"][0]["message"]["content"]
 
     async def embed(self, text: str) -> list[float]:
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
         url = f"{self.API_BASE}/embeddings"
         headers = {
             "Authorization": f"Bearer {self.config.api_key}",
@@ -106,19 +123,21 @@ class MistralProvider(BaseLLMProvider):
         }
         payload = {
             "model": "mistral-embed",
-            "input": [text],
+            "input": texts,
         }
         async with httpx.AsyncClient(timeout=_HTTP_TIMEOUT) as client:
             resp = await client.post(url, json=payload, headers=headers)
             resp.raise_for_status()
             data = resp.json()
-        return data["data"][0]["embedding"]
+        return [item["embedding"] for item in sorted(data["data"], key=lambda d: d["index"])]
 
 
 class GeminiProvider(BaseLLMProvider):
     """Google Gemini provider via the Generative Language API."""
 
     API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+    # batchEmbedContents rejects calls with more requests than this
+    EMBED_BATCH_LIMIT = 100
 
     async def chat(
         self,
@@ -161,6 +180,28 @@ class GeminiProvider(BaseLLMProvider):
             data = resp.json()
         return data["embedding"]["values"]
 
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        url = (
+            f"{self.API_BASE}/models/text-embedding-004"
+            f":batchEmbedContents?key={self.config.api_key}"
+        )
+        vectors: list[list[float]] = []
+        async with httpx.AsyncClient(timeout=_HTTP_TIMEOUT) as client:
+            for start in range(0, len(texts), self.EMBED_BATCH_LIMIT):
+                payload = {
+                    "requests": [
+                        {
+                            "model": "models/text-embedding-004",
+                            "content": {"parts": [{"text": text}]},
+                        }
+                        for text in texts[start:start + self.EMBED_BATCH_LIMIT]
+                    ]
+                }
+                resp = await client.post(url, json=payload)
+                resp.raise_for_status()
+                vectors.extend(item["values"] for item in resp.json()["embeddings"])
+        return vectors
+
 
 class ClaudeProvider(BaseLLMProvider):
     """Anthropic Claude provider via the Messages API."""
@@ -244,6 +285,9 @@ class OpenAIProvider(BaseLLMProvider):
         return data["choices"][0]["message"]["content"]
 
     async def embed(self, text: str) -> list[float]:
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
         url = f"{self.API_BASE}/embeddings"
         headers = {
             "Authorization": f"Bearer {self.config.api_key}",
@@ -251,13 +295,13 @@ class OpenAIProvider(BaseLLMProvider):
         }
         payload = {
             "model": "text-embedding-3-small",
-            "input": text,
+            "input": texts,
         }
         async with httpx.AsyncClient(timeout=_HTTP_TIMEOUT) as client:
             resp = await client.post(url, json=payload, headers=headers)
             resp.raise_for_status()
             data = resp.json()
-        return data["data"][0]["embedding"]
+        return [item["embedding"] for item in sorted(data["data"], key=lambda d: d["index"])]
 
 
 class OllamaProvider(BaseLLMProvider):
@@ -292,16 +336,19 @@ class OllamaProvider(BaseLLMProvider):
         return data["message"]["content"]
 
     async def embed(self, text: str) -> list[float]:
+        return (await self.embed_batch([text]))[0]
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
         url = f"{self.base_url}/api/embed"
         payload = {
             "model": self.config.model_name,
-            "input": text,
+            "input": texts,
         }
         async with httpx.AsyncClient(timeout=_HTTP_TIMEOUT) as client:
             resp = await client.post(url, json=payload)
             resp.raise_for_status()
             data = resp.json()
-        return data["embeddings"][0]
+        return data["embeddings"]
 
 
 _PROVIDER_MAP: dict[str, type[BaseLLMProvider]] = {
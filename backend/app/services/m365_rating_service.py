@@ -3,11 +3,12 @@
 import logging
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.agents.m365_rating_agent import M365RatingAgent
 from app.models.internal_scoring import InternalFinding, InternalScan
+from app.services.internal_finding_service import insert_internal_findings
 
 logger = logging.getLogger("cyberscore.services.m365_rating")
 
@@ -47,21 +48,25 @@ class M365RatingService:
             findings_count=result.data.get("findings_count", 0),
             scan_data=result.data,
         )
+        # Scan results can be regenerated by scanning again, so this
+        # transaction's commit does not wait for the WAL flush
+        await self.db.execute(text("SET LOCAL synchronous_commit = off"))
         self.db.add(scan)
         await self.db.flush()
 
-        for f in result.data.get("findings", []):
-            finding = InternalFinding(
-                scan_id=scan.id,
-                category=f.get("category", "unknown"),
-                title=f.get("title", ""),
-                description=f.get("description"),
-                severity=f.get("severity", "info"),
-                recommendation=f.get("recommendation"),
-            )
-            self.db.add(finding)
+        findings = [
+            {
+                "scan_id": scan.id,
+                "category": f.get("category", "unknown"),
+                "title": f.get("title", ""),
+                "description": f.get("description"),
+                "severity": f.get("severity", "info"),
+                "recommendation": f.get("recommendation"),
+            }
+            for f in result.data.get("findings", [])
+        ]
+        await insert_internal_findings(self.db, findings)
 
-        await self.db.flush()
         return scan
 
     async def get_score(self, target: str | None = None) -> dict[str, Any]:
@@ -73,8 +78,16 @@ class M365RatingService:
         Returns:
             Dict with score data or empty dict.
         """
+        # Only the category scores are extracted from scan_data, server-side
         query = (
-            select(InternalScan)
+            select(
+                InternalScan.id,
+                InternalScan.score,
+                InternalScan.grade,
+                InternalScan.findings_count,
+                InternalScan.scan_data["category_scores"].label("category_scores"),
+                InternalScan.created_at,
+            )
             .where(InternalScan.scan_type == "m365")
             .order_by(InternalScan.created_at.desc())
             .limit(1)
@@ -83,7 +96,7 @@ class M365RatingService:
             query = query.where(InternalScan.target == target)
 
         result = await self.db.execute(query)
-        scan = result.scalar_one_or_none()
+        scan = result.one_or_none()
         if not scan:
             return {}
         return {
@@ -91,7 +104,7 @@ class M365RatingService:
             "score": scan.score,
             "grade": scan.grade,
             "findings_count": scan.findings_count,
-            "category_scores": scan.scan_data.get("category_scores", {}),
+            "category_scores": scan.category_scores or {},
             "created_at": scan.created_at.isoformat() if scan.created_at else None,
         }
 
@@ -106,26 +119,21 @@ class M365RatingService:
         Returns:
             List of finding dicts.
         """
-        query = (
-            select(InternalScan)
+        latest_scan = (
+            select(InternalScan.id)
             .where(InternalScan.scan_type == "m365")
             .order_by(InternalScan.created_at.desc())
             .limit(1)
         )
         if target:
-            query = query.where(InternalScan.target == target)
-
-        result = await self.db.execute(query)
-        scan = result.scalar_one_or_none()
-        if not scan:
-            return []
+            latest_scan = latest_scan.where(InternalScan.target == target)
 
+        # One round trip: the latest scan id is resolved inside the findings query
         findings_result = await self.db.execute(
             select(InternalFinding)
-            .where(InternalFinding.scan_id == scan.id)
+            .where(InternalFinding.scan_id == latest_scan.scalar_subquery())
             .order_by(InternalFinding.detected_at.desc())
         )
-        findings = findings_result.scalars().all()
         return [
             {
                 "id": f.id,
@@ -138,5 +146,5 @@ class M365RatingService:
                 "status": f.status,
                 "detected_at": f.detected_at.isoformat() if f.detected_at else None,
             }
-            for f in findings
+            for f in findings_result.scalars()
         ]
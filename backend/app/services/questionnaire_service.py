@@ -5,8 +5,9 @@ import logging
 from datetime import datetime, timezone
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.models.questionnaire import Answer, Question, Questionnaire, QuestionnaireResponse
 from app.schemas.questionnaire import (
@@ -21,6 +22,7 @@ from app.schemas.questionnaire import (
     SmartAnswerRequest,
     SmartAnswerResponse,
 )
+from app.services.smart_answer_service import suggest_answer
 
 logger = logging.getLogger("cyberscore.questionnaire_service")
 
@@ -161,7 +163,7 @@ class QuestionnaireService:
             self.db.add(question)
 
         await self.db.flush()
-        await self.db.refresh(questionnaire)
+        questionnaire = await self._load_with_questions(questionnaire.id)
         return QuestionnaireResponseSchema.model_validate(questionnaire)
 
     # ── List / Get ──────────────────────────────────────────────────
@@ -186,14 +188,21 @@ class QuestionnaireService:
         Raises:
             ValueError: If not found.
         """
-        result = await self.db.execute(
-            select(Questionnaire).where(Questionnaire.id == questionnaire_id)
-        )
-        questionnaire = result.scalar_one_or_none()
+        questionnaire = await self._load_with_questions(questionnaire_id)
         if not questionnaire:
             raise ValueError(f"Questionnaire not found: {questionnaire_id}")
         return QuestionnaireResponseSchema.model_validate(questionnaire)
 
+    async def _load_with_questions(self, questionnaire_id: str) -> Questionnaire | None:
+        """Fetch a questionnaire and eagerly load its questions in one extra query."""
+        result = await self.db.execute(
+            select(Questionnaire)
+            .where(Questionnaire.id == questionnaire_id)
+            .options(selectinload(Questionnaire.questions))
+            .execution_options(populate_existing=True)
+        )
+        return result.scalar_one_or_none()
+
     # ── Send ────────────────────────────────────────────────────────
 
     async def send_questionnaire(
@@ -265,14 +274,15 @@ class QuestionnaireService:
             self.db.add(qr)
             await self.db.flush()
 
-        # Save answers
-        for ans in answers:
-            answer = Answer(
-                response_id=qr.id,
-                question_id=ans.question_id,
-                value=ans.value,
+        # Save answers in a single batched INSERT
+        if answers:
+            await self.db.execute(
+                insert(Answer),
+                [
+                    {"response_id": qr.id, "question_id": ans.question_id, "value": ans.value}
+                    for ans in answers
+                ],
             )
-            self.db.add(answer)
 
         qr.status = "submitted"
         qr.submitted_at = datetime.now(timezone.utc)
@@ -360,33 +370,17 @@ class QuestionnaireService:
         if not question:
             raise ValueError(f"Question not found: {data.question_id}")
 
-        # Build prompt
-        system_prompt = (
-            "Tu es un expert en cybersecurite et conformite reglementaire. "
-            "Tu aides a repondre a des questionnaires d'evaluation de securite des fournisseurs. "
-            "Reponds en francais de maniere professionnelle et concise."
-        )
-
-        user_prompt = f"Question: {question.text}\n"
+        # Build prompt; concurrent suggestions sharing the vendor context are
+        # answered together
+        question_prompt = f"Question: {question.text}\n"
         if question.options and question.options.get("choices"):
             choices = ", ".join(question.options["choices"])
-            user_prompt += f"Choix possibles: {choices}\n"
-        if data.vendor_context:
-            user_prompt += f"Contexte du fournisseur: {data.vendor_context}\n"
-        user_prompt += (
-            "\nSuggere une reponse appropriee. "
-            "Reponds au format JSON: {\"answer\": \"...\", \"confidence\": 0.0-1.0, \"reasoning\": \"...\"}"
-        )
+            question_prompt += f"Choix possibles: {choices}\n"
 
         try:
             llm = await self._get_llm_provider()
-            response_text = await llm.chat(
-                messages=[
-                    {"role": "system", "content": system_prompt},
-                    {"role": "user", "content": user_prompt},
-                ],
-                temperature=0.2,
-                max_tokens=1024,
+            response_text = await suggest_answer(
+                llm, question_prompt, data.vendor_context or ""
             )
 
             # Parse LLM response
@@ -415,29 +409,18 @@ class QuestionnaireService:
 
     async def _get_llm_provider(self):
         """Load the active LLM config from DB and return a provider instance."""
-        import base64
-
         from app.config import settings
-        from app.models.llm_config import LLMConfig
+        from app.services.llm_config_service import get_cached_llm_config
         from app.services.llm_provider import LLMProviderConfig, get_llm_provider
 
-        result = await self.db.execute(
-            select(LLMConfig).where(LLMConfig.is_active.is_(True)).limit(1)
-        )
-        cfg = result.scalar_one_or_none()
+        cfg = await get_cached_llm_config(self.db)
 
         if cfg is not None:
-            api_key = None
-            if cfg.api_key_encrypted and settings.encryption_key:
-                from app.utils.crypto import decrypt_data
-
-                enc_key = base64.b64decode(settings.encryption_key)
-                api_key = decrypt_data(cfg.api_key_encrypted, enc_key)
             return get_llm_provider(
                 LLMProviderConfig(
                     provider=cfg.provider,
                     model_name=cfg.model_name,
-                    api_key=api_key,
+                    api_key=cfg.api_key,
                     api_base_url=cfg.api_base_url,
                 )
             )
@@ -4,11 +4,13 @@ Indexes vendor scores, findings, and documents into Qdrant vector DB,
 then provides semantic search for chat context retrieval.
 """
 
+import hashlib
 import logging
 from typing import Any
 from uuid import uuid4
 
 from app.services.llm_provider import BaseLLMProvider
+from app.ttl_cache import TTLCache
 
 logger = logging.getLogger("cyberscore.services.rag")
 
@@ -16,6 +18,34 @@ COLLECTION_SCORES = "cyber_scores"
 COLLECTION_FINDINGS = "cyber_findings"
 COLLECTION_DOCUMENTS = "cyber_documents"
 VECTOR_SIZE = 1024  # Default; adjusted on first embed call
+EMBED_BATCH_SIZE = 64  # Texts per embedding call when indexing
+SEARCH_CACHE_SIZE = 2000
+SEARCH_CACHE_TTL = 300.0  # seconds
+
+
+def _search_cache_key(query: str, top_k: int) -> bytes:
+    """Return the cache key of a search.
+
+    Keyed on the normalized query (case and whitespace folded), so repeated
+    dashboard questions skip both the query embedding and the vector search.
+    """
+    normalized = " ".join(query.lower().split())
+    return hashlib.blake2b(f"{top_k}:{normalized}".encode(), digest_size=16).digest()
+
+
+_search_cache: TTLCache[bytes, list[dict[str, Any]]] = TTLCache(
+    SEARCH_CACHE_SIZE, SEARCH_CACHE_TTL
+)
+
+
+def clear_search_cache() -> None:
+    """Invalidate cached search results, e.g. after a reindex."""
+    _search_cache.clear()
+
+
+def get_search_cache_stats() -> dict[str, int | float]:
+    """Return the search cache counters."""
+    return _search_cache.stats()
 
 
 class RAGService:
@@ -62,131 +92,120 @@ class RAGService:
             self._vector_size = len(vector)
         return vector
 
+    async def _index(
+        self,
+        collection: str,
+        texts: list[str],
+        payloads: list[dict[str, Any]],
+        batch_size: int,
+    ) -> int:
+        """Embed ``texts`` batch by batch and upsert them into ``collection``.
+
+        Each batch costs one embedding call and one upsert. The collection is
+        created from the dimension of the first batch.
+        """
+        from qdrant_client.models import PointStruct
+
+        client = self._get_client()
+        for start in range(0, len(texts), batch_size):
+            vectors = await self._llm.embed_batch(texts[start:start + batch_size])
+            if start == 0:
+                self._vector_size = len(vectors[0])
+                self._ensure_collection(collection, self._vector_size)
+            client.upsert(
+                collection_name=collection,
+                points=[
+                    PointStruct(id=str(uuid4()), vector=vector, payload=payload)
+                    for vector, payload in zip(
+                        vectors, payloads[start:start + batch_size], strict=True
+                    )
+                ],
+            )
+        return len(texts)
+
     async def index_vendor_scores(
-        self, scores: list[dict[str, Any]]
+        self, scores: list[dict[str, Any]], batch_size: int = EMBED_BATCH_SIZE
     ) -> int:
         """Embed and store vendor scores in the 'scores' collection.
 
         Args:
             scores: List of dicts with keys like vendor_name, domain, global_score, grade.
+            batch_size: Number of texts embedded per provider call.
 
         Returns:
             Number of points indexed.
         """
-        from qdrant_client.models import PointStruct
-
-        if not scores:
-            return 0
-
-        # Determine vector size from first embed
-        sample_text = self._score_to_text(scores[0])
-        sample_vec = await self._embed(sample_text)
-        self._ensure_collection(COLLECTION_SCORES, len(sample_vec))
-
-        points = []
-        for sc in scores:
-            text = self._score_to_text(sc)
-            vector = await self._embed(text)
-            points.append(PointStruct(
-                id=str(uuid4()),
-                vector=vector,
-                payload={
-                    "text": text,
-                    "source": "score",
-                    "vendor_id": sc.get("vendor_id", ""),
-                    "vendor_name": sc.get("vendor_name", ""),
-                    "global_score": sc.get("global_score", 0),
-                    "grade": sc.get("grade", ""),
-                },
-            ))
-
-        client = self._get_client()
-        client.upsert(collection_name=COLLECTION_SCORES, points=points)
-        logger.info("Indexed %d vendor scores", len(points))
-        return len(points)
+        texts = [self._score_to_text(sc) for sc in scores]
+        payloads = [
+            {
+                "text": text,
+                "source": "score",
+                "vendor_id": sc.get("vendor_id", ""),
+                "vendor_name": sc.get("vendor_name", ""),
+                "global_score": sc.get("global_score", 0),
+                "grade": sc.get("grade", ""),
+            }
+            for sc, text in zip(scores, texts, strict=True)
+        ]
+        count = await self._index(COLLECTION_SCORES, texts, payloads, batch_size)
+        logger.info("Indexed %d vendor scores", count)
+        return count
 
     async def index_findings(
-        self, findings: list[dict[str, Any]]
+        self, findings: list[dict[str, Any]], batch_size: int = EMBED_BATCH_SIZE
     ) -> int:
         """Embed and store findings in the 'findings' collection.
 
         Args:
             findings: List of finding dicts.
+            batch_size: Number of texts embedded per provider call.
 
         Returns:
             Number of points indexed.
         """
-        from qdrant_client.models import PointStruct
-
-        if not findings:
-            return 0
-
-        sample_text = self._finding_to_text(findings[0])
-        sample_vec = await self._embed(sample_text)
-        self._ensure_collection(COLLECTION_FINDINGS, len(sample_vec))
-
-        points = []
-        for f in findings:
-            text = self._finding_to_text(f)
-            vector = await self._embed(text)
-            points.append(PointStruct(
-                id=str(uuid4()),
-                vector=vector,
-                payload={
-                    "text": text,
-                    "source": "finding",
-                    "finding_id": f.get("id", ""),
-                    "vendor_id": f.get("vendor_id", ""),
-                    "severity": f.get("severity", ""),
-                    "title": f.get("title", ""),
-                    "domain": f.get("domain", ""),
-                },
-            ))
-
-        client = self._get_client()
-        client.upsert(collection_name=COLLECTION_FINDINGS, points=points)
-        logger.info("Indexed %d findings", len(points))
-        return len(points)
+        texts = [self._finding_to_text(f) for f in findings]
+        payloads = [
+            {
+                "text": text,
+                "source": "finding",
+                "finding_id": f.get("id", ""),
+                "vendor_id": f.get("vendor_id", ""),
+                "severity": f.get("severity", ""),
+                "title": f.get("title", ""),
+                "domain": f.get("domain", ""),
+            }
+            for f, text in zip(findings, texts, strict=True)
+        ]
+        count = await self._index(COLLECTION_FINDINGS, texts, payloads, batch_size)
+        logger.info("Indexed %d findings", count)
+        return count
 
     async def index_documents(
-        self, docs: list[dict[str, Any]]
+        self, docs: list[dict[str, Any]], batch_size: int = EMBED_BATCH_SIZE
     ) -> int:
         """Embed and store documents (reports, regulations) in 'documents' collection.
 
         Args:
             docs: List of dicts with 'title', 'content', 'doc_type'.
+            batch_size: Number of texts embedded per provider call.
 
         Returns:
             Number of points indexed.
         """
-        from qdrant_client.models import PointStruct
-
-        if not docs:
-            return 0
-
-        sample_vec = await self._embed(docs[0].get("content", "")[:500])
-        self._ensure_collection(COLLECTION_DOCUMENTS, len(sample_vec))
-
-        points = []
-        for doc in docs:
-            text = doc.get("content", "")[:2000]
-            vector = await self._embed(text)
-            points.append(PointStruct(
-                id=str(uuid4()),
-                vector=vector,
-                payload={
-                    "text": text,
-                    "source": "document",
-                    "doc_id": doc.get("id", ""),
-                    "title": doc.get("title", ""),
-                    "doc_type": doc.get("doc_type", ""),
-                },
-            ))
-
-        client = self._get_client()
-        client.upsert(collection_name=COLLECTION_DOCUMENTS, points=points)
-        logger.info("Indexed %d documents", len(points))
-        return len(points)
+        texts = [doc.get("content", "")[:2000] for doc in docs]
+        payloads = [
+            {
+                "text": text,
+                "source": "document",
+                "doc_id": doc.get("id", ""),
+                "title": doc.get("title", ""),
+                "doc_type": doc.get("doc_type", ""),
+            }
+            for doc, text in zip(docs, texts, strict=True)
+        ]
+        count = await self._index(COLLECTION_DOCUMENTS, texts, payloads, batch_size)
+        logger.info("Indexed %d documents", count)
+        return count
 
     async def search(
         self, query: str, top_k: int = 5
@@ -198,15 +217,32 @@ class RAGService:
             top_k: Number of results per collection.
 
         Returns:
-            Combined list of results sorted by relevance score.
+            Combined list of results sorted by relevance score. Results are
+            served from a shared TTL cache and must not be mutated.
         """
+        cache_key = _search_cache_key(query, top_k)
+        cached = _search_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         query_vector = await self._embed(query)
         client = self._get_client()
 
         all_results: list[dict[str, Any]] = []
+        complete = True
+        try:
+            existing = {c.name for c in client.get_collections().collections}
+        except Exception as exc:
+            existing = set()
+            complete = False
+            logger.debug("Listing Qdrant collections failed: %s", exc)
+
+        # A collection that was never indexed simply has no results; only a
+        # failed search makes them incomplete
         collections = [COLLECTION_SCORES, COLLECTION_FINDINGS, COLLECTION_DOCUMENTS]
-
         for collection_name in collections:
+            if collection_name not in existing:
+                continue
             try:
                 hits = client.search(
                     collection_name=collection_name,
@@ -223,14 +259,16 @@ class RAGService:
                         "metadata": payload,
                     })
             except Exception as exc:
-                logger.debug(
-                    "Search in %s failed (may not exist yet): %s",
-                    collection_name, exc,
-                )
+                complete = False
+                logger.debug("Search in %s failed: %s", collection_name, exc)
 
         # Sort by relevance score descending
         all_results.sort(key=lambda r: r.get("score", 0), reverse=True)
-        return all_results[:top_k]
+        results = all_results[:top_k]
+        # Partial results (Qdrant unreachable or a search failing) are not cached
+        if complete:
+            _search_cache.put(cache_key, results)
+        return results
 
     def build_context(
         self, query: str, results: list[dict[str, Any]]
@@ -7,6 +7,7 @@ Formula: score_global = Σ(score_domain_i × weight_i × 10)
 Grade: A(800-1000), B(600-799), C(400-599), D(200-399), F(0-199)
 """
 
+import asyncio
 import logging
 from typing import Any
 
@@ -69,27 +70,28 @@ class ScoringEngine:
         Returns:
             Dict with global_score, grade, domain_scores, findings.
         """
-        domain_results: list[DomainResult] = []
+        # The analyzers are independent: run them concurrently so that any
+        # I/O they do overlaps. Results come back in domain order.
+        domain = raw_data.get("domain", "")
+        results = await asyncio.gather(
+            *(
+                analyzer.analyze(domain=domain, raw_data=raw_data)
+                for analyzer in self.analyzers.values()
+            ),
+            return_exceptions=True,
+        )
 
-        for code, analyzer in self.analyzers.items():
-            try:
-                result = await analyzer.analyze(
-                    domain=raw_data.get("domain", ""),
-                    raw_data=raw_data,
-                )
-                domain_results.append(result)
-            except Exception as exc:
+        domain_results: list[DomainResult] = []
+        for (code, analyzer), result in zip(self.analyzers.items(), results, strict=True):
+            if isinstance(result, Exception):
                 logger.error(
                     "Analyzer %s failed for vendor %s: %s",
-                    code, vendor_id, exc,
+                    code, vendor_id, result,
                 )
-                domain_results.append(DomainResult(
-                    domain_code=code,
-                    domain_name=analyzer.domain_name,
-                    score=50,
-                    grade="C",
-                    confidence=0.0,
-                ))
+                result = analyzer.empty_result()
+            elif isinstance(result, BaseException):
+                raise result
+            domain_results.append(result)
 
         # Calculate global score
         global_score = self._calculate_global_score(domain_results)
@@ -0,0 +1,194 @@
+"""Smart Answer Service — micro-batching of questionnaire answer suggestions.
+
+Vendors filling a questionnaire ask for suggestions one question at a time,
+and each LLM call costs close to a second of latency. Requests arriving
+within ``BATCH_WINDOW`` seconds of each other that use the same LLM
+configuration and the same vendor context are answered, up to ``MAX_BATCH``
+at a time, by a single chat completion that returns one JSON object per
+question. A vendor's context is therefore never sent along with another
+vendor's questions.
+
+The batcher runs as a background task of the API process. Elsewhere, or
+while it is not running, every suggestion is a direct LLM call.
+"""
+
+import asyncio
+import json
+import logging
+from dataclasses import astuple, dataclass
+
+from app.services.llm_provider import BaseLLMProvider
+
+logger = logging.getLogger("cyberscore.services.smart_answer")
+
+BATCH_WINDOW = 0.02  # seconds
+# Questions per LLM call: the answers to more would not fit in max_tokens
+MAX_BATCH = 4
+# Requests collected per window, before grouping them into batches
+MAX_PENDING = 32
+
+SYSTEM_PROMPT = (
+    "Tu es un expert en cybersecurite et conformite reglementaire. "
+    "Tu aides a repondre a des questionnaires d'evaluation de securite des fournisseurs. "
+    "Reponds en francais de maniere professionnelle et concise."
+)
+_ANSWER_FORMAT = '{"answer": "...", "confidence": 0.0-1.0, "reasoning": "..."}'
+
+# (LLM, question prompt, vendor context, future of the answer)
+_Pending = tuple[BaseLLMProvider, str, str, asyncio.Future[str]]
+
+
+@dataclass(slots=True)
+class _Batcher:
+    """Queue of the running batcher, None while it is not running."""
+
+    queue: asyncio.Queue[_Pending] | None = None
+
+
+_batcher = _Batcher()
+
+
+async def suggest_answer(
+    llm: BaseLLMProvider, question_prompt: str, vendor_context: str = ""
+) -> str:
+    """Return the LLM's JSON answer for one question.
+
+    Args:
+        llm: Provider of the active LLM configuration.
+        question_prompt: The question and its choices.
+        vendor_context: Context supplied by the vendor, if any.
+
+    Returns:
+        The JSON text ``{"answer", "confidence", "reasoning"}`` for this
+        question, or the raw model output if it could not be split.
+    """
+    queue = _batcher.queue
+    if queue is None:
+        return await _answer_one(llm, question_prompt, vendor_context)
+    future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+    await queue.put((llm, question_prompt, vendor_context, future))
+    return await future
+
+
+async def run_smart_answer_batcher() -> None:
+    """Collect suggestion requests into batches and answer them. Runs until cancelled."""
+    queue: asyncio.Queue[_Pending] = asyncio.Queue()
+    _batcher.queue = queue
+    loop = asyncio.get_running_loop()
+    tasks: set[asyncio.Task[None]] = set()
+    try:
+        while True:
+            pending = [await queue.get()]
+            deadline = loop.time() + BATCH_WINDOW
+            while len(pending) < MAX_PENDING:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    pending.append(await asyncio.wait_for(queue.get(), timeout))
+                except TimeoutError:
+                    break
+            # Only requests with the same configuration and vendor context
+            # share a prompt
+            groups: dict[tuple[object, ...], list[_Pending]] = {}
+            for request in pending:
+                llm, _prompt, vendor_context, _future = request
+                groups.setdefault((astuple(llm.config), vendor_context), []).append(request)
+            for group in groups.values():
+                for start in range(0, len(group), MAX_BATCH):
+                    # Answer in the background so the next window starts now
+                    task = asyncio.create_task(_answer_batch(group[start:start + MAX_BATCH]))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+    finally:
+        _batcher.queue = None
+        while not queue.empty():
+            _llm, _prompt, _context, future = queue.get_nowait()
+            future.cancel()
+
+
+async def _answer_batch(batch: list[_Pending]) -> None:
+    """Answer a batch with one LLM call and resolve every request's future.
+
+    Every request of ``batch`` has the same LLM configuration and vendor context.
+    """
+    futures = [future for _llm, _prompt, _context, future in batch]
+    prompts = [prompt for _llm, prompt, _context, _future in batch]
+    llm, _prompt, vendor_context, _future = batch[0]
+    try:
+        if len(batch) == 1:
+            answers = [await _answer_one(llm, prompts[0], vendor_context)]
+        else:
+            answers = await _answer_many(llm, prompts, vendor_context)
+    except Exception as exc:
+        for future in futures:
+            if not future.done():
+                future.set_exception(exc)
+        return
+    for future, answer in zip(futures, answers, strict=True):
+        if not future.done():
+            future.set_result(answer)
+
+
+def _context_prompt(vendor_context: str) -> str:
+    """Return the prompt line giving the vendor context, if any."""
+    return f"Contexte du fournisseur: {vendor_context}\n" if vendor_context else ""
+
+
+async def _answer_one(llm: BaseLLMProvider, question_prompt: str, vendor_context: str) -> str:
+    """Ask the LLM about a single question."""
+    return await llm.chat(
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {
+                "role": "user",
+                "content": (
+                    f"{question_prompt}{_context_prompt(vendor_context)}\n"
+                    "Suggere une reponse appropriee. "
+                    f"Reponds au format JSON: {_ANSWER_FORMAT}"
+                ),
+            },
+        ],
+        temperature=0.2,
+        max_tokens=1024,
+    )
+
+
+async def _answer_many(
+    llm: BaseLLMProvider, question_prompts: list[str], vendor_context: str
+) -> list[str]:
+    """Ask the LLM about several questions of the same vendor in one prompt.
+
+    Falls back to one call per question if the combined answer cannot be
+    split back into per-question answers.
+    """
+    blocks = "\n".join(
+        f"### Question {index}\n{prompt}" for index, prompt in enumerate(question_prompts)
+    )
+    response_text = await llm.chat(
+        messages=[
+            {"role": "system", "content": SYSTEM_PROMPT},
+            {
+                "role": "user",
+                "content": (
+                    f"{_context_prompt(vendor_context)}{blocks}\n"
+                    "Suggere une reponse appropriee pour chaque question. "
+                    'Reponds au format JSON: {"answers": [{"index": 0, "answer": "...", '
+                    '"confidence": 0.0-1.0, "reasoning": "..."}, ...]} '
+                    "avec une entree par question."
+                ),
+            },
+        ],
+        temperature=0.2,
+        max_tokens=1024 * len(question_prompts),
+    )
+    try:
+        items = {int(item["index"]): item for item in json.loads(response_text)["answers"]}
+        return [json.dumps(items[index]) for index in range(len(question_prompts))]
+    except (json.JSONDecodeError, KeyError, TypeError, ValueError):
+        logger.debug("Batched smart answer could not be split, answering one by one")
+        return list(
+            await asyncio.gather(
+                *(_answer_one(llm, prompt, vendor_context) for prompt in question_prompts)
+            )
+        )
@@ -3,18 +3,17 @@
 import logging
 from typing import Any
 
-from sqlalchemy import func, select
+from sqlalchemy import func, literal, null, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.scoring import VendorScore
 from app.models.supply_chain import ConcentrationAlert, VendorDependency
 from app.models.vendor import Vendor
 from app.schemas.supply_chain import (
     ConcentrationRisk,
     ConcentrationRiskResponse,
-    GraphData,
-    SupplyChainLink,
-    SupplyChainNode,
+    GraphDict,
+    LinkDict,
+    NodeDict,
     VendorDependencyResponse,
 )
 
@@ -31,85 +30,72 @@ class SupplyChainService:
 
     async def build_dependency_graph(
         self, vendor_ids: list[str] | None = None
-    ) -> GraphData:
+    ) -> GraphDict:
         """Build a NetworkX-compatible JSON graph of vendor dependencies.
 
         Args:
             vendor_ids: Optional filter; if None, includes all vendors.
 
         Returns:
-            GraphData with nodes and links for D3.js rendering.
+            Plain-dict graph with nodes and links for D3.js rendering.
         """
-        # Fetch vendors
-        vendor_q = select(Vendor).where(Vendor.status == "active")
+        # Vendor nodes come straight from the row mappings; the latest score
+        # is denormalized onto vendors
+        vendor_q = select(
+            Vendor.id,
+            Vendor.name,
+            literal("vendor").label("type"),
+            Vendor.tier,
+            Vendor.latest_score.label("score"),
+            Vendor.latest_grade.label("grade"),
+            null().label("provider_type"),
+        ).where(Vendor.status == "active")
         if vendor_ids:
             vendor_q = vendor_q.where(Vendor.id.in_(vendor_ids))
         result = await self._db.execute(vendor_q)
-        vendors = result.scalars().all()
+        nodes: list[NodeDict] = [dict(row) for row in result.mappings()]
 
-        vendor_map = {v.id: v for v in vendors}
-        target_ids = list(vendor_map.keys())
-
-        if not target_ids:
-            return GraphData(nodes=[], links=[])
+        if not nodes:
+            return {"nodes": [], "links": []}
 
         # Fetch dependencies
-        dep_q = select(VendorDependency).where(
-            VendorDependency.vendor_id.in_(target_ids)
-        )
+        dep_q = select(
+            VendorDependency.vendor_id,
+            VendorDependency.provider_name,
+            VendorDependency.provider_type,
+            VendorDependency.dependency_tier,
+            VendorDependency.detected_via,
+            VendorDependency.confidence,
+        ).where(VendorDependency.vendor_id.in_([n["id"] for n in nodes]))
         dep_result = await self._db.execute(dep_q)
-        dependencies = dep_result.scalars().all()
+        dependencies = dep_result.all()
 
-        # Fetch latest scores for vendors
-        score_q = (
-            select(VendorScore)
-            .where(VendorScore.vendor_id.in_(target_ids))
-            .order_by(VendorScore.scanned_at.desc())
-        )
-        score_result = await self._db.execute(score_q)
-        scores = score_result.scalars().all()
-        score_map: dict[str, VendorScore] = {}
-        for s in scores:
-            if s.vendor_id not in score_map:
-                score_map[s.vendor_id] = s
-
-        # Build nodes
-        nodes: list[SupplyChainNode] = []
         provider_node_ids: set[str] = set()
 
-        for v in vendors:
-            sc = score_map.get(v.id)
-            nodes.append(SupplyChainNode(
-                id=v.id,
-                name=v.name,
-                type="vendor",
-                tier=v.tier,
-                score=sc.global_score if sc else None,
-                grade=sc.grade if sc else None,
-            ))
-
         # Build links and provider nodes
-        links: list[SupplyChainLink] = []
+        links: list[LinkDict] = []
         for dep in dependencies:
             provider_id = f"provider:{dep.provider_name}"
             if provider_id not in provider_node_ids:
                 provider_node_ids.add(provider_id)
-                nodes.append(SupplyChainNode(
-                    id=provider_id,
-                    name=dep.provider_name,
-                    type="provider",
-                    tier=dep.dependency_tier,
-                    provider_type=dep.provider_type,
-                ))
-            links.append(SupplyChainLink(
-                source=dep.vendor_id,
-                target=provider_id,
-                type="direct" if dep.dependency_tier == 1 else "indirect",
-                detected_via=dep.detected_via,
-                confidence=dep.confidence,
-            ))
-
-        return GraphData(nodes=nodes, links=links)
+                nodes.append({
+                    "id": provider_id,
+                    "name": dep.provider_name,
+                    "type": "provider",
+                    "tier": dep.dependency_tier,
+                    "score": None,
+                    "grade": None,
+                    "provider_type": dep.provider_type,
+                })
+            links.append({
+                "source": dep.vendor_id,
+                "target": provider_id,
+                "type": "direct" if dep.dependency_tier == 1 else "indirect",
+                "detected_via": dep.detected_via,
+                "confidence": dep.confidence,
+            })
+
+        return {"nodes": nodes, "links": links}
 
     async def calculate_concentration_risk(self) -> ConcentrationRiskResponse:
         """Calculate concentration risk across all vendors.
@@ -237,5 +223,4 @@ class SupplyChainService:
         Returns:
             Dict with 'nodes' and 'links' keys.
         """
-        graph = await self.build_dependency_graph(vendor_ids)
-        return graph.model_dump()
+        return await self.build_dependency_graph(vendor_ids)
@@ -2,14 +2,47 @@
 
 import math
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import func, literal, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.models.scoring import VendorScore
 from app.models.vendor import Vendor
-from app.schemas.vendor import VendorCreate, VendorListResponse, VendorResponse, VendorUpdate
+from app.schemas.common import decode_cursor, encode_cursor
+from app.schemas.vendor import (
+    VendorCreate,
+    VendorCursorResponse,
+    VendorListResponse,
+    VendorResponse,
+    VendorUpdate,
+)
 from app.utils.exceptions import VendorAlreadyExistsError, VendorNotFoundError
 
+# Columns projected by the list queries, derived from the response schema so
+# the two stay in sync (see the list-query pattern in app/services/__init__.py).
+_VENDOR_COLUMNS = tuple(getattr(Vendor, name) for name in VendorResponse.model_fields)
+
+
+def _vendor_filters(
+    tier: int | None,
+    industry: str | None,
+    grade: str | None,
+    status: str | None,
+    search: str | None,
+) -> list:
+    """Build the WHERE clauses shared by the vendor list queries."""
+    filters = []
+    if tier is not None:
+        filters.append(Vendor.tier == tier)
+    if industry:
+        filters.append(Vendor.industry == industry)
+    if status:
+        filters.append(Vendor.status == status)
+    if search:
+        pattern = f"%{search}%"
+        filters.append(or_(Vendor.name.ilike(pattern), Vendor.domain.ilike(pattern)))
+    if grade:
+        filters.append(Vendor.latest_grade == grade)
+    return filters
+
 
 class VendorService:
     """Service layer for vendor CRUD operations with filtering and pagination."""
@@ -37,6 +70,20 @@ class VendorService:
             raise VendorNotFoundError(vendor_id)
         return VendorResponse.model_validate(vendor)
 
+    async def vendor_exists(self, vendor_id: str) -> bool:
+        """Check whether a vendor exists without loading the ORM row.
+
+        Args:
+            vendor_id: The vendor UUID.
+
+        Returns:
+            True if a vendor with this ID exists.
+        """
+        result = await self.db.execute(
+            select(literal(1)).where(Vendor.id == vendor_id).limit(1)
+        )
+        return result.scalar() is not None
+
     async def list_vendors(
         self,
         page: int = 1,
@@ -61,63 +108,90 @@ class VendorService:
         Returns:
             Paginated vendor list response.
         """
-        query = select(Vendor)
-
-        # Apply filters
-        if tier is not None:
-            query = query.where(Vendor.tier == tier)
-        if industry:
-            query = query.where(Vendor.industry == industry)
-        if status:
-            query = query.where(Vendor.status == status)
-        if search:
-            pattern = f"%{search}%"
-            query = query.where(
-                or_(Vendor.name.ilike(pattern), Vendor.domain.ilike(pattern))
-            )
+        filters = _vendor_filters(tier, industry, grade, status, search)
 
-        # Grade filter requires a subquery on latest score
-        if grade:
-            latest_score_subq = (
-                select(
-                    VendorScore.vendor_id,
-                    func.max(VendorScore.scanned_at).label("max_scanned"),
-                )
-                .group_by(VendorScore.vendor_id)
-                .subquery()
-            )
-            query = (
-                query.join(
-                    latest_score_subq,
-                    Vendor.id == latest_score_subq.c.vendor_id,
-                )
-                .join(
-                    VendorScore,
-                    (VendorScore.vendor_id == latest_score_subq.c.vendor_id)
-                    & (VendorScore.scanned_at == latest_score_subq.c.max_scanned),
-                )
-                .where(VendorScore.grade == grade)
-            )
-
-        # Count total
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await self.db.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Paginate
+        # One round-trip: the window count is computed before LIMIT/OFFSET
         offset = (page - 1) * page_size
-        query = query.order_by(Vendor.name).offset(offset).limit(page_size)
-        result = await self.db.execute(query)
-        vendors = result.scalars().all()
+        result = await self.db.execute(
+            select(*_VENDOR_COLUMNS, func.count().over().label("total_count"))
+            .where(*filters)
+            .order_by(Vendor.name)
+            .offset(offset)
+            .limit(page_size)
+        )
+        rows = result.mappings().all()
+        if rows:
+            total = rows[0]["total_count"]
+        elif offset:
+            # Past the last page no row carries the window count
+            total_result = await self.db.execute(
+                select(func.count()).select_from(Vendor).where(*filters)
+            )
+            total = total_result.scalar() or 0
+        else:
+            total = 0
 
-        return VendorListResponse(
-            items=[VendorResponse.model_validate(v) for v in vendors],
+        return VendorListResponse.model_construct(
+            # model_construct drops the extra total_count key
+            items=[VendorResponse.model_construct(**row) for row in rows],
             total=total,
             page=page,
             page_size=page_size,
             pages=math.ceil(total / page_size) if total > 0 else 0,
         )
 
+    async def list_recent_vendors(
+        self,
+        cursor: str | None = None,
+        page_size: int = 20,
+        tier: int | None = None,
+        industry: str | None = None,
+        grade: str | None = None,
+        status: str | None = None,
+        search: str | None = None,
+    ) -> VendorCursorResponse:
+        """List vendors newest first with keyset pagination.
+
+        Seeks past ``(created_at, id)`` of the cursor instead of skipping rows
+        with OFFSET, so every page costs the same whatever its depth.
+
+        Args:
+            cursor: ``next_cursor`` of the previous page, None for the first page.
+            page_size: Items per page.
+            tier: Filter by vendor tier (1-3).
+            industry: Filter by industry.
+            grade: Filter by latest score grade (A-F).
+            status: Filter by vendor status.
+            search: Full-text search on name and domain.
+
+        Returns:
+            Keyset-paginated vendor list response.
+
+        Raises:
+            ValueError: If the cursor is malformed.
+        """
+        filters = _vendor_filters(tier, industry, grade, status, search)
+        if cursor:
+            created_at, vendor_id = decode_cursor(cursor)
+            filters.append(tuple_(Vendor.created_at, Vendor.id) < tuple_(created_at, vendor_id))
+
+        # Fetch one extra row to know whether another page follows
+        result = await self.db.execute(
+            select(*_VENDOR_COLUMNS)
+            .where(*filters)
+            .order_by(Vendor.created_at.desc(), Vendor.id.desc())
+            .limit(page_size + 1)
+        )
+        items = [VendorResponse.model_construct(**row) for row in result.mappings()]
+        has_more = len(items) > page_size
+        del items[page_size:]
+
+        return VendorCursorResponse.model_construct(
+            items=items,
+            next_cursor=encode_cursor(items[-1].created_at, items[-1].id) if has_more else None,
+            has_more=has_more,
+        )
+
     async def create_vendor(self, data: VendorCreate) -> VendorResponse:
         """Create a new vendor.
 
@@ -132,7 +206,7 @@ class VendorService:
         """
         # Check for duplicate domain
         existing = await self.db.execute(
-            select(Vendor).where(Vendor.domain == data.domain)
+            select(Vendor.id).where(Vendor.domain == data.domain)
         )
         if existing.scalar_one_or_none():
             raise VendorAlreadyExistsError(data.domain)
@@ -2,7 +2,7 @@
 
 from datetime import datetime, timedelta, timezone
 
-from sqlalchemy import select
+from sqlalchemy import literal, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.dispute import Dispute
@@ -21,6 +21,13 @@ from app.schemas.vrm import (
 from app.utils.exceptions import VendorAlreadyExistsError, VendorNotFoundError
 
 
+# Columns projected by the list queries, derived from the response schemas so
+# the two stay in sync (see the list-query pattern in app/services/__init__.py).
+_DISPUTE_COLUMNS = tuple(getattr(Dispute, name) for name in DisputeResponse.model_fields)
+_REMEDIATION_COLUMNS = tuple(
+    getattr(Remediation, name) for name in RemediationResponse.model_fields
+)
+
 # SLA deadlines by vendor tier (days)
 _SLA_DAYS = {1: 5, 2: 10, 3: 20}
 
@@ -53,7 +60,7 @@ class VRMService:
             VendorAlreadyExistsError: If domain is already registered.
         """
         existing = await self.db.execute(
-            select(Vendor).where(Vendor.domain == data.domain)
+            select(Vendor.id).where(Vendor.domain == data.domain)
         )
         if existing.scalar_one_or_none():
             raise VendorAlreadyExistsError(data.domain)
@@ -157,14 +164,15 @@ class VRMService:
         Returns:
             Created dispute response.
         """
+        # Only the tier is needed for the SLA: project it instead of loading the vendor
         result = await self.db.execute(
-            select(Vendor).where(Vendor.id == vendor_id)
+            select(Vendor.tier).where(Vendor.id == vendor_id)
         )
-        vendor = result.scalar_one_or_none()
-        if not vendor:
+        tier = result.scalar_one_or_none()
+        if tier is None:
             raise VendorNotFoundError(vendor_id)
 
-        sla_days = _SLA_DAYS.get(vendor.tier, 20)
+        sla_days = _SLA_DAYS.get(tier, 20)
         dispute = Dispute(
             vendor_id=vendor_id,
             finding_id=data.finding_id,
@@ -186,12 +194,11 @@ class VRMService:
         Returns:
             List of dispute responses.
         """
-        query = select(Dispute).order_by(Dispute.created_at.desc())
+        query = select(*_DISPUTE_COLUMNS).order_by(Dispute.created_at.desc())
         if vendor_id:
             query = query.where(Dispute.vendor_id == vendor_id)
         result = await self.db.execute(query)
-        disputes = result.scalars().all()
-        return [DisputeResponse.model_validate(d) for d in disputes]
+        return [DisputeResponse.model_construct(**row) for row in result.mappings()]
 
     async def resolve_dispute(
         self, dispute_id: str, data: DisputeUpdate
@@ -240,9 +247,9 @@ class VRMService:
             Created remediation response.
         """
         result = await self.db.execute(
-            select(Vendor).where(Vendor.id == vendor_id)
+            select(literal(1)).where(Vendor.id == vendor_id).limit(1)
         )
-        if not result.scalar_one_or_none():
+        if result.scalar() is None:
             raise VendorNotFoundError(vendor_id)
 
         remediation = Remediation(
@@ -268,10 +275,9 @@ class VRMService:
             List of remediation responses.
         """
         query = (
-            select(Remediation)
+            select(*_REMEDIATION_COLUMNS)
             .where(Remediation.vendor_id == vendor_id)
             .order_by(Remediation.created_at.desc())
         )
         result = await self.db.execute(query)
-        items = result.scalars().all()
-        return [RemediationResponse.model_validate(r) for r in items]
+        return [RemediationResponse.model_construct(**row) for row in result.mappings()]
@@ -9,6 +9,7 @@ import base64
 import hashlib
 import os
 import secrets
+from functools import lru_cache
 
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
 
@@ -22,6 +23,12 @@ def generate_encryption_key() -> bytes:
     return AESGCM.generate_key(bit_length=256)
 
 
+@lru_cache(maxsize=8)
+def _cipher(key: bytes) -> AESGCM:
+    """Return the (cached) AES-GCM cipher for a key; it holds no per-message state."""
+    return AESGCM(key)
+
+
 def encrypt_data(plaintext: str, key: bytes) -> str:
     """Encrypt plaintext using AES-256-GCM.
 
@@ -33,8 +40,7 @@ def encrypt_data(plaintext: str, key: bytes) -> str:
         Base64-encoded string of nonce + ciphertext + tag.
     """
     nonce = os.urandom(12)
-    aesgcm = AESGCM(key)
-    ciphertext = aesgcm.encrypt(nonce, plaintext.encode("utf-8"), None)
+    ciphertext = _cipher(key).encrypt(nonce, plaintext.encode("utf-8"), None)
     return base64.b64encode(nonce + ciphertext).decode("utf-8")
 
 
@@ -54,8 +60,7 @@ def decrypt_data(encrypted: str, key: bytes) -> str:
     raw = base64.b64decode(encrypted)
     nonce = raw[:12]
     ciphertext = raw[12:]
-    aesgcm = AESGCM(key)
-    return aesgcm.decrypt(nonce, ciphertext, None).decode("utf-8")
+    return _cipher(key).decrypt(nonce, ciphertext, None).decode("utf-8")
 
 
 def generate_secure_token(length: int = 32) -> str:
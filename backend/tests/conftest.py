@@ -1,10 +1,15 @@
 """Pytest fixtures for CyberScore backend tests."""
 
+import uuid
 from collections.abc import AsyncGenerator
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.sql.compiler import TypeCompiler
 
 from app.api.deps import get_current_user, get_db, UserClaims
 from app.database import Base
@@ -18,15 +23,36 @@ TestSessionLocal = async_sessionmaker(
     test_engine, class_=AsyncSession, expire_on_commit=False
 )
 
+# Tables SQLite cannot express: audit_logs autoincrements an id inside a
+# composite (partitioned) primary key, dora_register has a JSONB generated column
+SQLITE_UNSUPPORTED_TABLES = {"audit_logs", "dora_register"}
+TEST_TABLES = [
+    table for table in Base.metadata.sorted_tables
+    if table.name not in SQLITE_UNSUPPORTED_TABLES
+]
+
+
+@event.listens_for(test_engine.sync_engine, "connect")
+def _register_uuid_functions(dbapi_connection: object, _record: object) -> None:
+    """Provide the PostgreSQL uuid functions used as server defaults."""
+    for name in ("gen_random_uuid", "uuidv7"):
+        dbapi_connection.create_function(name, 0, lambda: uuid.uuid4().hex)
+
+
+@compiles(JSONB, "sqlite")
+def _compile_jsonb_sqlite(type_: JSONB, compiler: TypeCompiler, **kw: object) -> str:
+    """Store JSONB columns as SQLite JSON."""
+    return "JSON"
+
 
 @pytest.fixture(autouse=True)
 async def setup_db() -> AsyncGenerator[None, None]:
     """Create all tables before each test, drop after."""
     async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(Base.metadata.create_all, tables=TEST_TABLES)
     yield
     async with test_engine.begin() as conn:
-        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.drop_all, tables=TEST_TABLES)
 
 
 @pytest.fixture
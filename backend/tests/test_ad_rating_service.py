@@ -0,0 +1,79 @@
+"""Tests for the AD rating service."""
+
+from typing import Any
+
+import pytest
+from sqlalchemy import TextClause
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.agents.ad_rating_agent import ADRatingAgent
+from app.agents.base_agent import AgentResult
+from app.models.internal_scoring import InternalScan
+from app.services import ad_rating_service
+from app.services.ad_rating_service import ADRatingService
+
+
+@pytest.fixture(autouse=True)
+def empty_score_cache() -> None:
+    """Start each test without cached scores."""
+    ad_rating_service._score_cache.clear()
+
+
+@pytest.fixture
+def fake_scan(monkeypatch: pytest.MonkeyPatch, db_session: AsyncSession) -> None:
+    """Scan without reaching a domain controller, on SQLite."""
+
+    async def execute(self: ADRatingAgent, **_kwargs: Any) -> AgentResult:
+        return AgentResult(
+            agent_name="ad_rating", vendor_id="dc1", success=True,
+            data={"global_score": 90, "grade": "A", "findings_count": 0},
+        )
+
+    run = db_session.execute
+
+    async def execute_sql(statement: Any, *args: Any, **kwargs: Any) -> Any:
+        # SET LOCAL is PostgreSQL-only
+        if isinstance(statement, TextClause) and statement.text.startswith("SET LOCAL"):
+            return None
+        return await run(statement, *args, **kwargs)
+
+    monkeypatch.setattr(ADRatingAgent, "execute", execute)
+    monkeypatch.setattr(db_session, "execute", execute_sql)
+
+
+@pytest.mark.asyncio
+class TestScoreCache:
+    """Test the cached latest score."""
+
+    async def test_score_is_cached(self, db_session: AsyncSession) -> None:
+        service = ADRatingService(db_session)
+        assert await service.get_score("dc1") == {}
+        db_session.add(InternalScan(scan_type="ad", target="dc1", score=50, grade="C"))
+        await db_session.commit()
+        # Served from the cache until a scan through the service invalidates it
+        assert await service.get_score("dc1") == {}
+
+    async def test_scan_invalidates_after_commit(
+        self, db_session: AsyncSession, fake_scan: None
+    ) -> None:
+        service = ADRatingService(db_session)
+        assert await service.get_score("dc1") == {}
+        assert await service.get_score() == {}
+
+        await service.scan_domain("dc1")
+        # Not committed yet: a concurrent reader would still see the old score
+        assert ad_rating_service._score_cache.get("dc1") == {}
+        await db_session.commit()
+
+        assert (await service.get_score("dc1"))["score"] == 90
+        assert (await service.get_score())["score"] == 90
+
+    async def test_rolled_back_scan_keeps_cache(
+        self, db_session: AsyncSession, fake_scan: None
+    ) -> None:
+        service = ADRatingService(db_session)
+        await service.get_score("dc1")
+        await service.scan_domain("dc1")
+        await db_session.rollback()
+        await db_session.commit()
+        assert ad_rating_service._score_cache.get("dc1") == {}
@@ -0,0 +1,56 @@
+"""Tests for the chat API."""
+
+import uuid
+from datetime import UTC, datetime
+from typing import Any
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.scoring import Finding
+from app.services import llm_provider
+from app.services.rag_service import RAGService
+
+
+@pytest.mark.asyncio
+class TestReindex:
+    """Test the RAG reindex endpoint."""
+
+    async def test_findings_are_indexed_batch_by_batch(
+        self,
+        client: AsyncClient,
+        db_session: AsyncSession,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        db_session.add_all(
+            Finding(
+                id=str(uuid.uuid4()), vendor_id=str(uuid.uuid4()), domain="D1",
+                title=f"f{n}", severity="high", status="open",
+                created_at=datetime(2026, 10, 1, tzinfo=UTC),
+            )
+            for n in range(5)
+        )
+        await db_session.flush()
+
+        batches: list[list[str]] = []
+
+        async def index_findings(
+            self: RAGService, findings: list[dict[str, Any]], batch_size: int
+        ) -> int:
+            batches.append([f["title"] for f in findings])
+            return len(findings)
+
+        monkeypatch.setattr(llm_provider, "get_llm_provider", lambda _config: None)
+        monkeypatch.setattr(RAGService, "index_findings", index_findings)
+
+        response = await client.post(
+            "/api/v1/chat/index", json={"collections": ["findings"], "batch_size": 2}
+        )
+
+        assert response.status_code == 200
+        assert response.json()["indexed"] == {"findings": 5}
+        assert [len(batch) for batch in batches] == [2, 2, 1]
+        assert sorted(title for batch in batches for title in batch) == [
+            f"f{n}" for n in range(5)
+        ]
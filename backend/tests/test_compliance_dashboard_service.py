@@ -0,0 +1,45 @@
+"""Tests for the compliance dashboard staleness tracking."""
+
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.grc import SecurityControl
+from app.services import compliance_dashboard_service
+
+
+@pytest.fixture(autouse=True)
+def clean_view() -> None:
+    """Start each test with the view marked as fresh."""
+    compliance_dashboard_service._state.dirty = False
+
+
+def _control() -> SecurityControl:
+    return SecurityControl(
+        id=str(uuid.uuid4()), reference=f"CTL-{uuid.uuid4().hex[:8]}", title="t",
+        domain="access_control",
+    )
+
+
+@pytest.mark.asyncio
+class TestDirtyFlag:
+    """The view is marked stale by committed GRC writes only."""
+
+    async def test_flush_does_not_mark_dirty(self, db_session: AsyncSession) -> None:
+        db_session.add(_control())
+        await db_session.flush()
+        assert compliance_dashboard_service._state.dirty is False
+
+    async def test_commit_marks_dirty(self, db_session: AsyncSession) -> None:
+        db_session.add(_control())
+        await db_session.flush()
+        await db_session.commit()
+        assert compliance_dashboard_service._state.dirty is True
+
+    async def test_rollback_does_not_mark_dirty(self, db_session: AsyncSession) -> None:
+        db_session.add(_control())
+        await db_session.flush()
+        await db_session.rollback()
+        await db_session.commit()
+        assert compliance_dashboard_service._state.dirty is False
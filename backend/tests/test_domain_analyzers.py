@@ -0,0 +1,123 @@
+"""Tests for the domain analyzers."""
+
+import pytest
+
+from app.services.domain_analyzers import (
+    BaseDomainAnalyzer,
+    DNSSecurityAnalyzer,
+    EmailSecurityAnalyzer,
+    IPReputationAnalyzer,
+    LeaksExposureAnalyzer,
+    NetworkSecurityAnalyzer,
+    PatchingCadenceAnalyzer,
+    RegulatoryPresenceAnalyzer,
+    WebSecurityAnalyzer,
+)
+
+ANALYZERS = [
+    DNSSecurityAnalyzer,
+    EmailSecurityAnalyzer,
+    IPReputationAnalyzer,
+    LeaksExposureAnalyzer,
+    NetworkSecurityAnalyzer,
+    PatchingCadenceAnalyzer,
+    RegulatoryPresenceAnalyzer,
+    WebSecurityAnalyzer,
+]
+
+
+@pytest.mark.asyncio
+class TestEmptyFeed:
+    """Analyzers without any collected feed return a neutral result."""
+
+    @pytest.mark.parametrize("analyzer_class", ANALYZERS)
+    async def test_missing_feed_is_neutral(
+        self, analyzer_class: type[BaseDomainAnalyzer]
+    ) -> None:
+        analyzer = analyzer_class()
+        result = await analyzer.analyze("example.com", {"domain": "example.com"})
+        assert result.domain_code == analyzer.domain_code
+        assert result.score == 50
+        assert result.grade == "C"
+        assert result.confidence == 0.0
+        assert result.findings == []
+
+    @pytest.mark.parametrize("analyzer_class", ANALYZERS)
+    async def test_collected_feed_is_analyzed(
+        self, analyzer_class: type[BaseDomainAnalyzer]
+    ) -> None:
+        analyzer = analyzer_class()
+        raw_data = {key: {} for key in analyzer.feed_keys}
+        result = await analyzer.analyze("example.com", raw_data)
+        assert result.confidence > 0.0
+
+
+@pytest.mark.asyncio
+class TestPatchingCadence:
+    """Test CVE severity mapping."""
+
+    @pytest.mark.parametrize(
+        ("cvss", "severity"),
+        [(0.0, "low"), (3.9, "low"), (4.0, "medium"), (7.0, "high"), (8.9, "high"),
+         (9.0, "critical"), (10.0, "critical")],
+    )
+    async def test_cvss_to_severity(self, cvss: float, severity: str) -> None:
+        result = await PatchingCadenceAnalyzer().analyze(
+            "example.com", {"cves": [{"id": "CVE-2026-0001", "cvss_score": cvss}]}
+        )
+        assert [f.severity for f in result.findings] == [severity]
+
+    async def test_missing_cve_id(self) -> None:
+        result = await PatchingCadenceAnalyzer().analyze(
+            "example.com", {"cves": [{"cvss_score": 5.0}]}
+        )
+        finding = result.findings[0]
+        assert "Unknown" in finding.title
+        assert "Unknown" in finding.evidence
+        assert "Unknown" in finding.recommendation
+
+
+@pytest.mark.asyncio
+class TestLeaksExposure:
+    """Test breach findings."""
+
+    async def test_breach_findings(self) -> None:
+        result = await LeaksExposureAnalyzer().analyze(
+            "example.com",
+            {"hibp": {"breaches": [
+                {"Name": "Small", "BreachDate": "2026-01-01", "PwnCount": 10_000},
+                {"Name": "Large", "BreachDate": "2026-02-01", "PwnCount": 100_001},
+                {},
+            ]}},
+        )
+        assert [f.severity for f in result.findings] == ["medium", "critical", "medium"]
+        assert result.findings[1].evidence == "HIBP: Large (2026-02-01)"
+        assert result.findings[2].title == "Breach détectée: Unknown"
+
+
+@pytest.mark.asyncio
+class TestRegulatoryPresence:
+    """Test the certification bonus."""
+
+    async def test_certification_spellings_match(self) -> None:
+        result = await RegulatoryPresenceAnalyzer().analyze(
+            "example.com",
+            {"regulatory": {
+                "privacy_policy": True,
+                "legal_notices": True,
+                "certifications": ["ISO 27001", "iso-27001", "Unknown cert"],
+            }},
+        )
+        # One distinct valued certification, on an already perfect score
+        assert result.score == 100
+        assert result.findings == []
+
+    async def test_bonus_is_capped(self) -> None:
+        result = await RegulatoryPresenceAnalyzer().analyze(
+            "example.com",
+            {"regulatory": {
+                "certifications": ["ISO 27001", "SOC 2", "HDS", "SecNumCloud", "ISO 27701"],
+            }},
+        )
+        # 100 - 20 (privacy policy) - 10 (legal notices) + 15 (capped bonus)
+        assert result.score == 85
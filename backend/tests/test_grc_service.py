@@ -0,0 +1,85 @@
+"""Tests for the GRC service."""
+
+import uuid
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.grc import FrameworkMapping, MaturityAssessment, SecurityControl
+from app.services import compliance_dashboard_service
+from app.services.grc_service import GRCService
+
+
+async def _add_control(db: AsyncSession, domain: str, levels: list[int]) -> str:
+    control_id = str(uuid.uuid4())
+    db.add(SecurityControl(
+        id=control_id, reference=f"CTL-{control_id[:8]}", title="t", domain=domain,
+    ))
+    db.add_all(
+        MaturityAssessment(
+            id=str(uuid.uuid4()), control_id=control_id, level=level, assessor="test",
+        )
+        for level in levels
+    )
+    await db.flush()
+    return control_id
+
+
+@pytest.mark.asyncio
+class TestMaturityScore:
+    """Test the maturity aggregation."""
+
+    async def test_no_assessments(self, db_session: AsyncSession) -> None:
+        score = await GRCService(db_session).get_maturity_score()
+        assert score == {"overall_maturity": 0.0, "domains": {}, "domain_count": 0}
+
+    async def test_overall_is_weighted_by_assessment(self, db_session: AsyncSession) -> None:
+        await _add_control(db_session, "access_control", [1, 2, 2, 3])
+        await _add_control(db_session, "cryptography", [5])
+
+        score = await GRCService(db_session).get_maturity_score()
+
+        assert score["domains"] == {
+            "access_control": {"average_level": 2.0, "assessment_count": 4},
+            "cryptography": {"average_level": 5.0, "assessment_count": 1},
+        }
+        # 13 / 5, not the mean of the domain averages (3.5)
+        assert score["overall_maturity"] == 2.6
+        assert score["domain_count"] == 2
+
+
+@pytest.mark.asyncio
+class TestFrameworkMapping:
+    """Test mapping controls to framework requirements."""
+
+    async def test_map_control_to_frameworks(self, db_session: AsyncSession) -> None:
+        control_id = await _add_control(db_session, "access_control", [])
+        await db_session.commit()
+        compliance_dashboard_service._state.dirty = False
+
+        created = await GRCService(db_session).map_control_to_frameworks(
+            control_id,
+            [
+                {"framework": "iso27001", "framework_ref": "A.9.1.1"},
+                {"framework": "dora", "framework_ref": "Art. 9", "description": "d"},
+            ],
+        )
+        await db_session.commit()
+
+        assert created == [
+            {"framework": "iso27001", "framework_ref": "A.9.1.1"},
+            {"framework": "dora", "framework_ref": "Art. 9"},
+        ]
+        rows = await db_session.execute(
+            select(FrameworkMapping.framework, FrameworkMapping.framework_ref)
+            .where(FrameworkMapping.control_id == control_id)
+            .order_by(FrameworkMapping.framework)
+        )
+        assert rows.all() == [("dora", "Art. 9"), ("iso27001", "A.9.1.1")]
+        # The new mappings change the framework coverage
+        assert compliance_dashboard_service._state.dirty is True
+
+    async def test_no_mappings(self, db_session: AsyncSession) -> None:
+        control_id = await _add_control(db_session, "access_control", [])
+        assert await GRCService(db_session).map_control_to_frameworks(control_id, []) == []
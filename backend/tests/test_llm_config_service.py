@@ -0,0 +1,53 @@
+"""Tests for the active LLM configuration cache."""
+
+import uuid
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.llm_config import LLMConfig
+from app.services import llm_config_service
+from app.services.llm_config_service import (
+    get_cached_llm_config,
+    invalidate_llm_config_cache,
+)
+
+
+@pytest.fixture
+async def active_config(db_session: AsyncSession) -> LLMConfig:
+    config = LLMConfig(
+        id=str(uuid.uuid4()), provider="mistral", model_name="small", is_active=True
+    )
+    db_session.add(config)
+    await db_session.commit()
+    invalidate_llm_config_cache()
+    return config
+
+
+@pytest.mark.asyncio
+class TestCachedConfig:
+    """Test when the active configuration is served from the cache."""
+
+    async def test_reads_through_without_listener(
+        self, db_session: AsyncSession, active_config: LLMConfig
+    ) -> None:
+        assert (await get_cached_llm_config(db_session)).model_name == "small"
+        active_config.model_name = "large"
+        await db_session.commit()
+        assert (await get_cached_llm_config(db_session)).model_name == "large"
+
+    async def test_cached_until_invalidated(
+        self,
+        db_session: AsyncSession,
+        active_config: LLMConfig,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        monkeypatch.setattr(llm_config_service._cache, "listening", True)
+        snapshot = await get_cached_llm_config(db_session)
+        active_config.model_name = "large"
+        await db_session.commit()
+        assert await get_cached_llm_config(db_session) is snapshot
+
+        invalidate_llm_config_cache()
+        assert (await get_cached_llm_config(db_session)).model_name == "large"
+        invalidate_llm_config_cache()
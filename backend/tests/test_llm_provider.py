@@ -0,0 +1,42 @@
+"""Tests for the LLM providers."""
+
+import json
+from typing import Any
+
+import httpx
+import pytest
+
+from app.services import llm_provider
+from app.services.llm_provider import GeminiProvider, LLMProviderConfig
+
+
+@pytest.mark.asyncio
+class TestGeminiEmbedBatch:
+    """Test batched Gemini embeddings."""
+
+    async def test_splits_calls_at_the_request_limit(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        batch_sizes: list[int] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            requests = json.loads(request.content)["requests"]
+            batch_sizes.append(len(requests))
+            return httpx.Response(200, json={"embeddings": [
+                {"values": [float(len(r["content"]["parts"][0]["text"]))]} for r in requests
+            ]})
+
+        transport = httpx.MockTransport(handler)
+        real_client = httpx.AsyncClient
+
+        def client(**kwargs: Any) -> httpx.AsyncClient:
+            return real_client(transport=transport, **kwargs)
+
+        monkeypatch.setattr(llm_provider.httpx, "AsyncClient", client)
+        provider = GeminiProvider(LLMProviderConfig(provider="gemini", model_name="gemini"))
+
+        texts = ["x" * (n % 7) for n in range(256)]
+        vectors = await provider.embed_batch(texts)
+
+        assert batch_sizes == [100, 100, 56]
+        assert vectors == [[float(len(text))] for text in texts]
@@ -0,0 +1,178 @@
+"""Tests for the Power BI dataset queries."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.scoring import Finding, VendorScore
+from app.models.vendor import Vendor
+from app.services.integrations.powerbi_service import (
+    PowerBIService,
+    invalidate_dataset_cache,
+)
+
+SCANNED_AT = datetime(2026, 10, 1, tzinfo=UTC)
+
+
+@pytest.fixture
+async def vendors(db_session: AsyncSession) -> list[str]:
+    """Three active vendors, two of them scored, and one inactive vendor."""
+    ids = [str(uuid.uuid4()) for _ in range(4)]
+    for n, vendor_id in enumerate(ids):
+        db_session.add(Vendor(
+            id=vendor_id, name=f"v{n}", domain=f"v{n}.com", tier=n % 3 + 1,
+            status="active" if n < 3 else "inactive",
+            industry="bank" if n == 1 else None,
+        ))
+    await db_session.flush()
+    for n in range(2):
+        vendor = await db_session.get(Vendor, ids[n])
+        vendor.latest_score = 100 * (n + 1)
+        vendor.latest_grade = "AB"[n]
+        vendor.latest_scored_at = SCANNED_AT
+        for day in range(2):
+            db_session.add(VendorScore(
+                id=str(uuid.uuid4()), vendor_id=ids[n], global_score=100 * (n + 1),
+                grade="AB"[n], domain_scores={"D1": 10 * n + day},
+                scanned_at=SCANNED_AT - timedelta(days=1 - day),
+            ))
+    for severity in ("high", "high", "critical"):
+        db_session.add(Finding(
+            id=str(uuid.uuid4()), vendor_id=ids[0], domain="D1", title="t",
+            severity=severity, status="open", created_at=SCANNED_AT,
+        ))
+    await db_session.commit()
+    invalidate_dataset_cache()
+    return ids
+
+
+def _names(dataset: dict) -> list[str]:
+    return [row["vendor_name"] for row in dataset["rows"]]
+
+
+class TestFilterTranslation:
+    """Test the parsing and SQL translation of $filter conditions."""
+
+    def test_parse_filter(self) -> None:
+        conditions = PowerBIService._parse_filter("grade eq 'A' AND tier GT 1 and bogus")
+        assert conditions == [("grade", "eq", "A"), ("tier", "gt", "1")]
+
+    def test_parse_empty_filter(self) -> None:
+        assert PowerBIService._parse_filter(None) == []
+
+    def test_vendor_fields_run_in_sql(self) -> None:
+        assert PowerBIService._sql_condition("tier", "ge", "2") is not None
+        assert PowerBIService._sql_condition("grade", "eq", "A") is not None
+
+    def test_other_fields_run_in_python(self) -> None:
+        assert PowerBIService._sql_condition("score_D1", "gt", "5") is None
+        assert PowerBIService._sql_condition("scanned_at", "eq", "x") is None
+
+
+class TestCompiledCondition:
+    """Test the row predicates of $filter conditions evaluated in Python."""
+
+    def test_numeric_comparison(self) -> None:
+        matches = PowerBIService._compile_condition("score_D1", "gt", "5")
+        assert matches({"score_D1": 6})
+        assert matches({"score_D1": "6.5"})
+        assert not matches({"score_D1": 5.0})
+
+    def test_null_never_matches(self) -> None:
+        assert not PowerBIService._compile_condition("f", "ne", "5")({"f": None})
+        assert not PowerBIService._compile_condition("f", "ne", "x")({})
+
+    def test_string_comparison(self) -> None:
+        assert PowerBIService._compile_condition("f", "eq", "x")({"f": "x"})
+        assert PowerBIService._compile_condition("f", "ne", "5")({"f": "abc"})
+        assert not PowerBIService._compile_condition("f", "gt", "x")({"f": "y"})
+        assert not PowerBIService._compile_condition("f", "gt", "5")({"f": "abc"})
+
+
+@pytest.mark.asyncio
+class TestDataset:
+    """Test get_dataset against the database."""
+
+    async def test_active_vendors_only(
+        self, db_session: AsyncSession, vendors: list[str]
+    ) -> None:
+        dataset = await PowerBIService(db_session).get_dataset()
+        assert sorted(_names(dataset)) == ["v0", "v1", "v2"]
+        assert dataset["metadata"]["total_vendors"] == 3
+
+    async def test_sql_filter(self, db_session: AsyncSession, vendors: list[str]) -> None:
+        service = PowerBIService(db_session)
+        assert _names(await service.get_dataset(filter_expr="grade eq 'A'")) == ["v0"]
+        dataset = await service.get_dataset(filter_expr="findings_high ge 2 and tier lt 3")
+        assert _names(dataset) == ["v0"]
+        assert dataset["rows"][0]["findings_total"] == 3
+
+    async def test_residual_filter_uses_latest_domain_scores(
+        self, db_session: AsyncSession, vendors: list[str]
+    ) -> None:
+        dataset = await PowerBIService(db_session).get_dataset(filter_expr="score_D1 gt 5")
+        assert _names(dataset) == ["v1"]
+        assert dataset["rows"][0]["score_D1"] == 11
+
+    async def test_orderby_sorts_nulls_as_largest(
+        self, db_session: AsyncSession, vendors: list[str]
+    ) -> None:
+        service = PowerBIService(db_session)
+        assert _names(await service.get_dataset(orderby="global_score")) == ["v0", "v1", "v2"]
+        assert _names(await service.get_dataset(orderby="global_score desc")) == [
+            "v2", "v1", "v0",
+        ]
+
+    async def test_top_and_select(self, db_session: AsyncSession, vendors: list[str]) -> None:
+        dataset = await PowerBIService(db_session).get_dataset(
+            orderby="global_score desc", top=2, select_fields="vendor_name,global_score"
+        )
+        assert dataset["columns"] == ["vendor_name", "global_score"]
+        assert dataset["rows"] == [
+            {"vendor_name": "v2", "global_score": None},
+            {"vendor_name": "v1", "global_score": 200},
+        ]
+
+    async def test_python_orderby_and_top(
+        self, db_session: AsyncSession, vendors: list[str]
+    ) -> None:
+        dataset = await PowerBIService(db_session).get_dataset(orderby="score_D1", top=2)
+        assert _names(dataset) == ["v0", "v1"]
+
+
+@pytest.mark.asyncio
+class TestDatasetCache:
+    """Test the invalidation of cached datasets."""
+
+    async def test_orm_write_invalidates_after_commit(
+        self, db_session: AsyncSession, vendors: list[str]
+    ) -> None:
+        service = PowerBIService(db_session)
+        dataset = await service.get_dataset()
+        assert await service.get_dataset() is dataset
+
+        db_session.add(Vendor(id=str(uuid.uuid4()), name="v4", domain="v4.com", tier=1))
+        await db_session.flush()
+        assert await service.get_dataset() is dataset
+        await db_session.commit()
+
+        assert "v4" in _names(await service.get_dataset())
+
+    async def test_bulk_import_invalidates_after_commit(
+        self, client: AsyncClient, db_session: AsyncSession, vendors: list[str]
+    ) -> None:
+        service = PowerBIService(db_session)
+        dataset = await service.get_dataset()
+
+        response = await client.post(
+            "/api/v1/bulk/vendors",
+            files={"file": ("vendors.csv", b"name,domain,tier\nv4,v4.com,1\n", "text/csv")},
+        )
+        assert response.json()["created"] == 1
+        assert await service.get_dataset() is dataset
+        await db_session.commit()
+
+        assert "v4" in _names(await service.get_dataset())
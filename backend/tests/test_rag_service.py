@@ -0,0 +1,80 @@
+"""Tests for the RAG search."""
+
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from app.services import rag_service
+from app.services.rag_service import COLLECTION_FINDINGS, COLLECTION_SCORES, RAGService
+
+
+class FakeLLM:
+    """Embeds every text as the same vector and counts the calls."""
+
+    def __init__(self) -> None:
+        self.embed_calls = 0
+
+    async def embed(self, text: str) -> list[float]:
+        self.embed_calls += 1
+        return [0.1, 0.2, 0.3]
+
+
+class FakeQdrant:
+    """In-memory stand-in for the Qdrant client."""
+
+    def __init__(self, collections: list[str], fail: bool = False) -> None:
+        self.collections = collections
+        self.fail = fail
+        self.searched: list[str] = []
+
+    def get_collections(self) -> Any:
+        return SimpleNamespace(collections=[SimpleNamespace(name=n) for n in self.collections])
+
+    def search(self, collection_name: str, **_kwargs: Any) -> list[Any]:
+        self.searched.append(collection_name)
+        if self.fail:
+            raise ConnectionError("qdrant unreachable")
+        return [SimpleNamespace(
+            payload={"text": collection_name, "source": collection_name}, score=0.5,
+        )]
+
+
+@pytest.fixture(autouse=True)
+def empty_search_cache() -> None:
+    """Start each test without cached search results."""
+    rag_service.clear_search_cache()
+
+
+def _service(client: FakeQdrant, llm: FakeLLM) -> RAGService:
+    service = RAGService(qdrant_url="http://qdrant:6333", llm_provider=llm)
+    service._client = client
+    return service
+
+
+@pytest.mark.asyncio
+class TestSearch:
+    """Test the search and its result cache."""
+
+    async def test_missing_collection_is_skipped_and_cached(self) -> None:
+        llm = FakeLLM()
+        client = FakeQdrant([COLLECTION_SCORES, COLLECTION_FINDINGS])
+        service = _service(client, llm)
+
+        results = await service.search("Which vendors are  critical?", top_k=5)
+        assert {r["source"] for r in results} == {COLLECTION_SCORES, COLLECTION_FINDINGS}
+        assert client.searched == [COLLECTION_SCORES, COLLECTION_FINDINGS]
+
+        # Same question up to case and spacing: no embedding, no vector search
+        assert await service.search("which vendors are critical?", top_k=5) is results
+        assert llm.embed_calls == 1
+        assert len(client.searched) == 2
+
+    async def test_failed_search_is_not_cached(self) -> None:
+        llm = FakeLLM()
+        client = FakeQdrant([COLLECTION_SCORES], fail=True)
+        service = _service(client, llm)
+
+        assert await service.search("q") == []
+        await service.search("q")
+        assert llm.embed_calls == 2
@@ -0,0 +1,102 @@
+"""Tests for the smart answer micro-batcher."""
+
+import asyncio
+import json
+import re
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from app.services import smart_answer_service
+from app.services.llm_provider import BaseLLMProvider, LLMProviderConfig
+from app.services.smart_answer_service import MAX_BATCH, suggest_answer
+
+
+class FakeLLM(BaseLLMProvider):
+    """Answers each question with its own text and records the prompts."""
+
+    def __init__(self, split_batches: bool = True) -> None:
+        super().__init__(LLMProviderConfig(provider="fake", model_name="fake"))
+        self.split_batches = split_batches
+        self.prompts: list[str] = []
+        self.max_tokens: list[int] = []
+
+    async def chat(
+        self,
+        messages: list[dict[str, str]],
+        temperature: float = 0.1,
+        max_tokens: int = 4096,
+    ) -> str:
+        prompt = messages[-1]["content"]
+        self.prompts.append(prompt)
+        self.max_tokens.append(max_tokens)
+        questions = re.findall(r"Question: (\w+)", prompt)
+        if "### Question" not in prompt:
+            return json.dumps({"answer": questions[0]})
+        if not self.split_batches:
+            return "not JSON"
+        return json.dumps({"answers": [
+            {"index": index, "answer": question} for index, question in enumerate(questions)
+        ]})
+
+    async def embed(self, text: str) -> list[float]:
+        return [0.0]
+
+
+@pytest.fixture
+async def batcher() -> AsyncGenerator[None, None]:
+    """Run the batcher for the duration of a test."""
+    task = asyncio.create_task(smart_answer_service.run_smart_answer_batcher())
+    await asyncio.sleep(0)
+    yield
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+
+async def _ask(llm: FakeLLM, questions: list[str], vendor_context: str = "") -> list[str]:
+    answers = await asyncio.gather(
+        *(suggest_answer(llm, f"Question: {q}\n", vendor_context) for q in questions)
+    )
+    return [json.loads(answer)["answer"] for answer in answers]
+
+
+@pytest.mark.asyncio
+class TestSmartAnswer:
+    """Test direct and batched suggestions."""
+
+    async def test_direct_call_without_batcher(self) -> None:
+        llm = FakeLLM()
+        assert await _ask(llm, ["q0"], "ctx") == ["q0"]
+        assert "Contexte du fournisseur: ctx" in llm.prompts[0]
+
+    async def test_concurrent_questions_are_batched(self, batcher: None) -> None:
+        llm = FakeLLM()
+        questions = [f"q{n}" for n in range(MAX_BATCH + 1)]
+
+        assert await _ask(llm, questions, "ctx") == questions
+        # One call for MAX_BATCH questions, one for the remaining question
+        assert len(llm.prompts) == 2
+        assert sorted(llm.max_tokens) == [1024, 1024 * MAX_BATCH]
+        assert all(prompt.count("Contexte du fournisseur: ctx") == 1 for prompt in llm.prompts)
+
+    async def test_vendor_contexts_are_not_mixed(self, batcher: None) -> None:
+        llm = FakeLLM()
+        answers = await asyncio.gather(
+            _ask(llm, ["a0", "a1"], "vendor A"), _ask(llm, ["b0", "b1"], "vendor B")
+        )
+
+        assert answers == [["a0", "a1"], ["b0", "b1"]]
+        assert len(llm.prompts) == 2
+        for prompt in llm.prompts:
+            assert ("vendor A" in prompt) != ("vendor B" in prompt)
+            assert ("a0" in prompt) == ("vendor A" in prompt)
+
+    async def test_unsplittable_batch_falls_back_to_single_calls(self, batcher: None) -> None:
+        llm = FakeLLM(split_batches=False)
+        questions = ["q0", "q1", "q2"]
+
+        assert await _ask(llm, questions, "ctx") == questions
+        # The batched call, then one call per question
+        assert len(llm.prompts) == 1 + len(questions)
+        assert all("### Question" not in prompt for prompt in llm.prompts[1:])
@@ -0,0 +1,68 @@
+"""Tests for the in-process TTL cache."""
+
+import pytest
+
+from app import ttl_cache
+from app.ttl_cache import TTLCache
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch: pytest.MonkeyPatch) -> FakeClock:
+    """Freeze the cache clock at the fake one."""
+    fake = FakeClock()
+    monkeypatch.setattr(ttl_cache.time, "monotonic", fake)
+    return fake
+
+
+class TestTTLCache:
+    """Test hits, expiry, eviction and invalidation."""
+
+    def test_hit(self, clock: FakeClock) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=30.0)
+        assert cache.get("a") is None
+        cache.put("a", 1)
+        assert cache.get("a") == 1
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_expiry(self, clock: FakeClock) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=30.0)
+        cache.put("a", 1)
+        clock.now += 30.0
+        assert cache.get("a") == 1
+        clock.now += 0.1
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(self, clock: FakeClock) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=2, ttl=30.0)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.get("a")
+        cache.put("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.get("c") == 3
+        assert cache.stats()["evictions"] == 1
+
+    def test_discard_and_clear(self, clock: FakeClock) -> None:
+        cache: TTLCache[str, int] = TTLCache(maxsize=4, ttl=30.0)
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+        cache.discard("a", "b", "missing")
+        assert cache.get("a") is None
+        assert cache.get("b") is None
+        assert cache.get("c") == 3
+        cache.clear()
+        assert len(cache) == 0
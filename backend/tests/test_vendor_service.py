@@ -0,0 +1,52 @@
+"""Tests for the vendor service."""
+
+import uuid
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.vendor import Vendor
+from app.schemas.common import decode_cursor, encode_cursor
+from app.services.vendor_service import VendorService
+
+CREATED_AT = datetime(2026, 10, 1, tzinfo=UTC)
+
+
+class TestCursor:
+    """Test the keyset cursor encoding."""
+
+    def test_round_trip(self) -> None:
+        vendor_id = str(uuid.uuid4())
+        assert decode_cursor(encode_cursor(CREATED_AT, vendor_id)) == (CREATED_AT, vendor_id)
+
+    def test_malformed_cursor(self) -> None:
+        with pytest.raises(ValueError):
+            decode_cursor("not-a-cursor")
+
+
+@pytest.mark.asyncio
+class TestRecentVendors:
+    """Test the keyset-paginated vendor listing."""
+
+    async def test_pages_cover_every_vendor_once(self, db_session: AsyncSession) -> None:
+        # Two vendors share a creation time, so the id breaks the tie
+        for n in range(5):
+            db_session.add(Vendor(
+                id=str(uuid.uuid4()), name=f"v{n}", domain=f"v{n}.com", tier=1,
+                created_at=CREATED_AT + timedelta(minutes=min(n, 3)),
+            ))
+        await db_session.flush()
+
+        service = VendorService(db_session)
+        names: list[str] = []
+        cursor = None
+        for _ in range(3):
+            page = await service.list_recent_vendors(cursor=cursor, page_size=2)
+            names += [vendor.name for vendor in page.items]
+            cursor = page.next_cursor
+        assert page.has_more is False
+        assert cursor is None
+        assert sorted(names) == ["v0", "v1", "v2", "v3", "v4"]
+        assert names[-1] == "v0"
+        assert set(names[:2]) == {"v3", "v4"}